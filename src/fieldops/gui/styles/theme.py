@@ -189,28 +189,37 @@ def component_styles() -> ComponentStyles:
     )
 
 
+@lru_cache(maxsize=None)
+def _qcolor(hex_value: str):
+    """Return a shared ``QColor`` for ``hex_value``; palettes copy colors by value."""
+
+    from PySide6.QtGui import QColor  # type: ignore[import]
+
+    return QColor(hex_value)
+
+
 def build_palette():
     """Construct a :class:`PySide6.QtGui.QPalette` when PySide6 is available."""
 
     if importlib.util.find_spec("PySide6") is None:
         raise RuntimeError("PySide6 is required to build the FieldOps palette")
 
-    from PySide6.QtGui import QColor, QPalette  # type: ignore[import]
+    from PySide6.QtGui import QPalette  # type: ignore[import]
 
     palette = QPalette()
-    palette.setColor(QPalette.Window, QColor(COLOR_TOKENS["surface_light"].hex))
-    palette.setColor(QPalette.WindowText, QColor(COLOR_TOKENS["neutral_900"].hex))
-    palette.setColor(QPalette.Base, QColor(COLOR_TOKENS["surface_light"].hex))
-    palette.setColor(QPalette.AlternateBase, QColor(COLOR_TOKENS["surface_dark"].hex))
-    palette.setColor(QPalette.ToolTipBase, QColor(COLOR_TOKENS["neutral_900"].hex))
-    palette.setColor(QPalette.ToolTipText, QColor(COLOR_TOKENS["primary_contrast"].hex))
-    palette.setColor(QPalette.Text, QColor(COLOR_TOKENS["neutral_900"].hex))
-    palette.setColor(QPalette.Button, QColor(COLOR_TOKENS["primary"].hex))
-    palette.setColor(QPalette.ButtonText, QColor(COLOR_TOKENS["primary_contrast"].hex))
-    palette.setColor(QPalette.Highlight, QColor(COLOR_TOKENS["primary_light"].hex))
-    palette.setColor(QPalette.HighlightedText, QColor(COLOR_TOKENS["primary_contrast"].hex))
-    palette.setColor(QPalette.Link, QColor(COLOR_TOKENS["accent"].hex))
-    palette.setColor(QPalette.BrightText, QColor(COLOR_TOKENS["primary_contrast"].hex))
+    palette.setColor(QPalette.Window, _qcolor(COLOR_TOKENS["surface_light"].hex))
+    palette.setColor(QPalette.WindowText, _qcolor(COLOR_TOKENS["neutral_900"].hex))
+    palette.setColor(QPalette.Base, _qcolor(COLOR_TOKENS["surface_light"].hex))
+    palette.setColor(QPalette.AlternateBase, _qcolor(COLOR_TOKENS["surface_dark"].hex))
+    palette.setColor(QPalette.ToolTipBase, _qcolor(COLOR_TOKENS["neutral_900"].hex))
+    palette.setColor(QPalette.ToolTipText, _qcolor(COLOR_TOKENS["primary_contrast"].hex))
+    palette.setColor(QPalette.Text, _qcolor(COLOR_TOKENS["neutral_900"].hex))
+    palette.setColor(QPalette.Button, _qcolor(COLOR_TOKENS["primary"].hex))
+    palette.setColor(QPalette.ButtonText, _qcolor(COLOR_TOKENS["primary_contrast"].hex))
+    palette.setColor(QPalette.Highlight, _qcolor(COLOR_TOKENS["primary_light"].hex))
+    palette.setColor(QPalette.HighlightedText, _qcolor(COLOR_TOKENS["primary_contrast"].hex))
+    palette.setColor(QPalette.Link, _qcolor(COLOR_TOKENS["accent"].hex))
+    palette.setColor(QPalette.BrightText, _qcolor(COLOR_TOKENS["primary_contrast"].hex))
     return palette
 
 
@@ -11,6 +11,7 @@ try:  # pragma: no cover - import guard for headless environments
     from .controller import HQCommandController
     from .main_window import HQMainWindow
     from .qt_compat import QtCore, QtWidgets
+    from .styles import prewarm_component_styles
 except ImportError as e:  # pragma: no cover - PySide6 missing
     error_msg = """
     Failed to import required GUI components. This is likely because PySide6 is not properly installed.
@@ -104,6 +105,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     qt_argv = list(sys.argv if argv is None else [sys.argv[0], *argv])
     app = QtWidgets.QApplication(qt_argv)
     window = HQMainWindow(controller)
+    # The window built its own stylesheet; prepare the other variants so
+    # switching themes later doesn't stall on generating one
+    prewarm_component_styles()
 
     # Store active_devices and hq_integration reference on window for access during callbacks
     if hq_integration:
@@ -21,7 +21,6 @@ from .qt_compat import (
     QPainter,
     QPen,
     QBrush,
-    QColor,
     QRect,
     QSize,
     Qt,
@@ -136,7 +135,7 @@ class GaugeChart(QWidget):
         )
 
         # Background arc
-        painter.setPen(QPen(QColor(theme.NEUTRAL_200), 10, Qt.SolidLine))
+        painter.setPen(QPen(theme.qcolor(theme.NEUTRAL_200), 10, Qt.SolidLine))
         painter.setBrush(Qt.NoBrush)
         painter.drawArc(gauge_rect, 0, 360 * 16)  # Full circle
 
@@ -144,11 +143,11 @@ class GaugeChart(QWidget):
         ratio = (self._current_value - self._min_value) / (self._max_value - self._min_value)
         angle = int(360 * ratio * 16)  # Qt uses 1/16th degree units
         color = self._get_color_for_value(self._current_value)
-        painter.setPen(QPen(QColor(color), 10, Qt.SolidLine))
+        painter.setPen(QPen(theme.qcolor(color), 10, Qt.SolidLine))
         painter.drawArc(gauge_rect, 90 * 16, -angle)  # Start from top, go clockwise
 
         # Draw value text in center
-        painter.setPen(QColor(theme.TEXT_PRIMARY))
+        painter.setPen(theme.qcolor(theme.TEXT_PRIMARY))
         painter.setFont(painter.font())
         value_text = f"{self._current_value:.0f}"
         painter.drawText(gauge_rect, Qt.AlignCenter, value_text)
@@ -168,7 +167,7 @@ class GaugeChart(QWidget):
 
         # Background
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(QColor(theme.NEUTRAL_200)))
+        painter.setBrush(QBrush(theme.qcolor(theme.NEUTRAL_200)))
         painter.drawRoundedRect(bar_rect, 4, 4)
 
         # Value bar
@@ -177,11 +176,11 @@ class GaugeChart(QWidget):
         value_rect = QRect(bar_rect.x(), bar_rect.y(), value_width, bar_height)
 
         color = self._get_color_for_value(self._current_value)
-        painter.setBrush(QBrush(QColor(color)))
+        painter.setBrush(QBrush(theme.qcolor(color)))
         painter.drawRoundedRect(value_rect, 4, 4)
 
         # Value text
-        painter.setPen(QColor(theme.TEXT_PRIMARY))
+        painter.setPen(theme.qcolor(theme.TEXT_PRIMARY))
         value_text = f"{self._current_value:.0f}"
         text_rect = QRect(rect.x(), bar_rect.y() + bar_height + 5, rect.width(), 20)
         painter.drawText(text_rect, Qt.AlignCenter, value_text)
@@ -201,7 +200,7 @@ class GaugeChart(QWidget):
 
         # Background
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(QColor(theme.NEUTRAL_200)))
+        painter.setBrush(QBrush(theme.qcolor(theme.NEUTRAL_200)))
         painter.drawRoundedRect(bar_rect, 4, 4)
 
         # Value bar (from bottom)
@@ -215,7 +214,7 @@ class GaugeChart(QWidget):
         )
 
         color = self._get_color_for_value(self._current_value)
-        painter.setBrush(QBrush(QColor(color)))
+        painter.setBrush(QBrush(theme.qcolor(color)))
         painter.drawRoundedRect(value_rect, 4, 4)
 
     def sizeHint(self) -> QSize:
@@ -303,7 +302,7 @@ class Sparkline(QWidget):
 
         # Draw filled area under line
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(QColor(self._fill_color + "40")))  # Add transparency
+        painter.setBrush(QBrush(theme.qcolor(self._fill_color + "40")))  # Add transparency
 
         # Create polygon for fill
         fill_points = [(margin, rect.height() - margin)] + points + [(rect.width() - margin, rect.height() - margin)]
@@ -313,14 +312,14 @@ class Sparkline(QWidget):
             painter.drawPolygon(polygon)
 
             # Draw line
-            painter.setPen(QPen(QColor(self._line_color), 2, Qt.SolidLine))
+            painter.setPen(QPen(theme.qcolor(self._line_color), 2, Qt.SolidLine))
             painter.setBrush(Qt.NoBrush)
 
             line_polygon = QPolygonF([QPointF(x, y) for x, y in points])
             painter.drawPolyline(line_polygon)
         else:
             # Fallback: draw simple line segments
-            painter.setPen(QPen(QColor(self._line_color), 2, Qt.SolidLine))
+            painter.setPen(QPen(theme.qcolor(self._line_color), 2, Qt.SolidLine))
             for i in range(len(points) - 1):
                 painter.drawLine(int(points[i][0]), int(points[i][1]),
                                 int(points[i+1][0]), int(points[i+1][1]))
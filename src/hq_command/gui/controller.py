@@ -4,7 +4,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterable, List, Mapping, Sequence, Tuple
+from typing import Any, Final, Iterable, List, Literal, Mapping, Sequence, Tuple, overload
 
 from hq_command.analytics import summarize_field_telemetry
 from hq_command.tasking_engine import (
@@ -19,6 +19,14 @@ from ..performance import MemoryTracker, PerformanceMetrics
 from .caching import StaleWhileRevalidateCache
 from .qt_compat import QtCore
 
+# Item data roles as plain ints, resolved once from the Qt enum.
+DISPLAY_ROLE: Final[int] = int(QtCore.Qt.DisplayRole)
+EDIT_ROLE: Final[int] = int(QtCore.Qt.EditRole)
+USER_ROLE: Final[int] = int(QtCore.Qt.UserRole)
+
+# Roles answered by BaseListModel.data(); every role returns the raw row item.
+_VALID_ROLES: Final[frozenset[int]] = frozenset((DISPLAY_ROLE, EDIT_ROLE, USER_ROLE))
+
 
 class BaseListModel(QtCore.QAbstractListModel):
     """Simple list model that works with or without real Qt bindings."""
@@ -27,50 +35,50 @@ class BaseListModel(QtCore.QAbstractListModel):
         super().__init__(parent)  # type: ignore[arg-type]
         self._items: list[Any] = []
 
+    # Storage accessors; subclasses may override these to back the model
+    # with another container.
+    def _get_items(self, *, copy: bool = False) -> Sequence[Any]:
+        """Return the rows, as a fresh list only when ``copy`` is set."""
+        return list(self._items) if copy else self._items
+
+    def _set_items(self, items: list[Any]) -> None:
+        self._items = items
+
     # Qt signature uses camelCase and optional QModelIndex argument.
     def rowCount(self, parent: QtCore.QModelIndex | None = None) -> int:  # type: ignore[override]
-        if hasattr(self, "_get_items"):
-            return len(getattr(self, "_get_items")())  # type: ignore[misc]
-        return len(self._items)
+        return len(self._get_items())
 
-    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:  # type: ignore[override]
+    def data(self, index: QtCore.QModelIndex, role: int = DISPLAY_ROLE) -> Any:  # type: ignore[override]
+        if role not in _VALID_ROLES:
+            return None
+        source = self._get_items()
         row = index.row()
-        if hasattr(self, "_get_items"):
-            source = list(getattr(self, "_get_items")())  # type: ignore[misc]
-        else:
-            source = self._items
-        if not 0 <= row < len(source):
+        if row < 0 or row >= len(source):
             return None
-        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole, QtCore.Qt.UserRole):
-            return source[row]
-        return None
+        return source[row]
 
     # Convenience helpers used by the controller to provide deterministic data to
     # unit tests without relying on Qt-specific signals.
     def set_items(self, items: Iterable[Any]) -> None:
         items_list = list(items)
 
-        begin_reset = getattr(self, "beginResetModel", None)
-        if callable(begin_reset):  # pragma: no branch - simple guard
-            begin_reset()
+        self.beginResetModel()
+        self._set_items(items_list)
+        self.endResetModel()
 
-        if hasattr(self, "_set_items"):
-            getattr(self, "_set_items")(items_list)  # type: ignore[misc]
-        else:
-            self._items = list(items_list)
+    @overload
+    def items(self, *, copy: Literal[True] = ...) -> list[Any]: ...
 
-        end_reset = getattr(self, "endResetModel", None)
-        if callable(end_reset):  # pragma: no branch - simple guard
-            end_reset()
+    @overload
+    def items(self, *, copy: Literal[False]) -> Sequence[Any]: ...
 
-        if not hasattr(self, "_set_items"):
-            # Mirror the shim storage when real Qt bindings are available.
-            self._items = items_list
+    def items(self, *, copy: bool = True) -> Sequence[Any]:
+        """Return the model rows.
 
-    def items(self) -> list[Any]:
-        if hasattr(self, "_get_items"):
-            return list(getattr(self, "_get_items")())  # type: ignore[misc]
-        return list(self._items)
+        Callers that only iterate may pass ``copy=False`` to read the live
+        list without an O(n) copy; they must not mutate it.
+        """
+        return self._get_items(copy=copy)
 
 
 class RosterListModel(BaseListModel):
@@ -69,22 +69,39 @@ class DataTableModel(QAbstractItemModel):
     def set_data(self, data: List[Dict[str, Any]]) -> None:
         """Set the table data and apply current filters."""
         self.beginResetModel()
+        self._release_virtual_source()
         self._data = data
         self._apply_filter()
         self.endResetModel()
-        self._virtual_source = None
 
     def set_virtualized_source(self, source: VirtualizedSequence[Dict[str, Any]]) -> None:
-        """Switch the model to use a virtualized data provider."""
+        """Switch the model to use a virtualized data provider.
+
+        The model owns ``source`` from here on and closes it when the source
+        is replaced or the model is destroyed. Rows may be prefetched on
+        worker threads, so the source's ``fetch_page`` must be thread-safe
+        and must not touch Qt widgets.
+        """
 
         self.beginResetModel()
+        self._release_virtual_source()
         self._virtual_source = source
+        self.destroyed.connect(source.close)
         self._data = []
         self._filtered_data = []
         self._sort_column = -1
         self._sort_order = SortOrder.NONE
         self.endResetModel()
 
+    def _release_virtual_source(self) -> None:
+        """Close and drop the current virtualized source, if any."""
+        source = self._virtual_source
+        if source is None:
+            return
+        self._virtual_source = None
+        self.destroyed.disconnect(source.close)
+        source.close()
+
     def prefetch_rows(self, start: int, stop: Optional[int] = None) -> None:
         """Prefetch an anticipated range of rows when virtualized."""
 
@@ -327,11 +327,11 @@ class TaskQueueTableModel(DataTableModel):
             status = row_data.get("status", "pending")
 
             if status == "escalated":
-                from .qt_compat import QColor, QBrush
-                return QBrush(QColor(theme.DANGER + "20"))
+                from .qt_compat import QBrush
+                return QBrush(theme.qcolor(theme.DANGER + "20"))
             elif priority == 1:
-                from .qt_compat import QColor, QBrush
-                return QBrush(QColor(theme.WARNING + "20"))
+                from .qt_compat import QBrush
+                return QBrush(theme.qcolor(theme.WARNING + "20"))
 
         return None
 
@@ -782,7 +782,7 @@ class TelemetryPane(QWidget):
         if not self._model:
             return
 
-        telemetry_data = self._model.items()
+        telemetry_data = self._model.items(copy=False)
 
         # Update cards based on telemetry data
         for item in telemetry_data:
@@ -26,6 +26,12 @@ from .qt_compat import (
     QLabel,
     QTableWidget,
     QTableWidgetItem,
+    QDialog,
+    QFileDialog,
+    QMenu,
+    QMessageBox,
+    QShortcut,
+    QKeySequence,
     qt_exec,
     pyqtSignal,
 )
@@ -73,6 +79,7 @@ from .notifications import (
     NotificationManager,
     Notification,
     NotificationType,
+    clear_badge_cache,
 )
 from .search_filter import (
     GlobalSearchBar,
@@ -172,6 +179,13 @@ class HQMainWindow(QMainWindow):
         stylesheet = component_styles(self.current_theme.variant)
         self.setStyleSheet(stylesheet)
 
+        # Cached notification badges were rendered with the previous theme
+        clear_badge_cache()
+
+        # The timeline paints its rows itself, so stylesheets don't reach it
+        if hasattr(self, 'timeline_view'):
+            self.timeline_view.set_theme(self.current_theme)
+
     def _create_ui(self):
         """Create main UI layout."""
         # Central widget with main layout
@@ -312,6 +326,7 @@ class HQMainWindow(QMainWindow):
 
         # Timeline view for situational awareness
         self.timeline_view = TimelineView(view)
+        self.timeline_view.set_theme(self.current_theme)
         self.timeline_view.export_requested.connect(self._on_timeline_export_requested)
 
         layout.addWidget(self.timeline_view)
@@ -811,7 +826,6 @@ class HQMainWindow(QMainWindow):
 
     def _on_timeline_export_requested(self):
         """Handle timeline export request."""
-        from .qt_compat import QDialog, QFileDialog
         import json
         import csv
         from pathlib import Path
@@ -950,14 +964,12 @@ class HQMainWindow(QMainWindow):
         # Connect notification signals
         self.notification_panel.notification_dismissed.connect(self._on_notification_dismissed)
         self.notification_panel.notification_action.connect(self._on_notification_action)
+        self.notification_panel.unread_count_changed.connect(
+            self.notification_badge.set_unread_count
+        )
 
     def _setup_phase3_shortcuts(self):
         """Set up Phase 3 keyboard shortcuts (3-18)."""
-        from .qt_compat import QShortcut, QKeySequence
-
-        if not QShortcut or not QKeySequence:
-            return
-
         # Global search (Ctrl+F)
         search_shortcut = QShortcut(QKeySequence("Ctrl+F"), self)
         search_shortcut.activated.connect(self.search_bar.set_focus)
@@ -992,11 +1004,6 @@ class HQMainWindow(QMainWindow):
 
     def _show_task_context_menu(self, position):
         """Show context menu for tasks (3-19)."""
-        from .qt_compat import QMenu
-
-        if not QMenu:
-            return
-
         # Get selected task (simplified)
         menu = QMenu(self)
 
@@ -1016,11 +1023,6 @@ class HQMainWindow(QMainWindow):
 
     def _show_responder_context_menu(self, position):
         """Show context menu for responders (3-19)."""
-        from .qt_compat import QMenu
-
-        if not QMenu:
-            return
-
         menu = QMenu(self)
 
         new_responder_action = menu.addAction("New Responder...")
@@ -1063,7 +1065,7 @@ class HQMainWindow(QMainWindow):
 
         # Search tasks
         if scope in ('all', 'tasks'):
-            tasks = self.controller.task_queue_model.items()
+            tasks = self.controller.task_queue_model.items(copy=False)
             for task in tasks:
                 task_id = task.get('task_id', '').lower()
                 location = task.get('location', '').lower()
@@ -1078,7 +1080,7 @@ class HQMainWindow(QMainWindow):
 
         # Search responders
         if scope in ('all', 'responders'):
-            responders = self.controller.roster_model.items()
+            responders = self.controller.roster_model.items(copy=False)
             for responder in responders:
                 unit_id = responder.get('unit_id', '').lower()
                 caps = ' '.join(responder.get('capabilities', [])).lower()
@@ -1114,7 +1116,7 @@ class HQMainWindow(QMainWindow):
 
         # Get available units
         available_units = [
-            r for r in self.controller.roster_model.items()
+            r for r in self.controller.roster_model.items(copy=False)
             if r.get('status') == 'available'
         ]
 
@@ -1145,7 +1147,7 @@ class HQMainWindow(QMainWindow):
             return
 
         available_units = [
-            r for r in self.controller.roster_model.items()
+            r for r in self.controller.roster_model.items(copy=False)
             if r.get('status') == 'available'
         ]
 
@@ -1214,29 +1216,21 @@ class HQMainWindow(QMainWindow):
             action_callback=lambda: self._show_task_details({'task_id': task_id}),
         )
 
-        # Update notification badge
-        self.notification_badge.set_unread_count(
-            self.notification_panel.get_unread_count()
-        )
-
         # Refresh data
         self.refresh()
 
     def _on_bulk_assignment_confirmed(self, assignments: Dict[str, List[str]]) -> None:
         """Handle confirmed bulk assignments."""
-        for task_id, unit_ids in assignments.items():
-            for unit_id in unit_ids:
-                self.controller.apply_manual_assignment(task_id, unit_id)
-
-            self.notification_manager.add_assignment_notification(
-                task_id,
-                unit_ids,
-                action_callback=lambda tid=task_id: self._show_task_details({'task_id': tid}),
-            )
-
-        self.notification_badge.set_unread_count(
-            self.notification_panel.get_unread_count()
-        )
+        with self.notification_manager.batch():
+            for task_id, unit_ids in assignments.items():
+                for unit_id in unit_ids:
+                    self.controller.apply_manual_assignment(task_id, unit_id)
+
+                self.notification_manager.add_assignment_notification(
+                    task_id,
+                    unit_ids,
+                    action_callback=lambda tid=task_id: self._show_task_details({'task_id': tid}),
+                )
 
         analytics = {
             "Tasks Updated": len(assignments),
@@ -1284,13 +1278,8 @@ class HQMainWindow(QMainWindow):
                 f"Task {task_data.get('task_id')} has been created",
             )
 
-            self.notification_badge.set_unread_count(
-                self.notification_panel.get_unread_count()
-            )
-
             self.refresh()
         except ValueError as e:
-            from .qt_compat import QMessageBox
             QMessageBox.warning(self, "Error", str(e))
 
     def _send_task_to_field_units(self, task_data: Dict[str, Any]):
@@ -1357,10 +1346,6 @@ class HQMainWindow(QMainWindow):
             f"Task {task_id} has been updated",
         )
 
-        self.notification_badge.set_unread_count(
-            self.notification_panel.get_unread_count()
-        )
-
         self.refresh()
 
     def _show_escalation_dialog(self, task_id: str):
@@ -1379,10 +1364,6 @@ class HQMainWindow(QMainWindow):
             action_callback=lambda: self._show_task_details({'task_id': task_id}),
         )
 
-        self.notification_badge.set_unread_count(
-            self.notification_panel.get_unread_count()
-        )
-
         # Update status bar escalation count
         escalation_count = self.status_bar.findChild(QLabel, "escalation_count")
         if escalation_count:
@@ -1406,10 +1387,6 @@ class HQMainWindow(QMainWindow):
             f"Task {task_id} deferred for {duration} minutes",
         )
 
-        self.notification_badge.set_unread_count(
-            self.notification_panel.get_unread_count()
-        )
-
         self.refresh()
 
     def _show_status_dialog(self, unit_id: str):
@@ -1438,10 +1415,6 @@ class HQMainWindow(QMainWindow):
             f"{unit_id} status updated to {changes.get('status')}",
         )
 
-        self.notification_badge.set_unread_count(
-            self.notification_panel.get_unread_count()
-        )
-
         self.refresh()
 
     def _show_profile_dialog(self, unit_data: Dict[str, Any]):
@@ -1459,10 +1432,6 @@ class HQMainWindow(QMainWindow):
             f"{unit_id} profile has been updated",
         )
 
-        self.notification_badge.set_unread_count(
-            self.notification_panel.get_unread_count()
-        )
-
         self.refresh()
 
     def _show_responder_creation_dialog(self):
@@ -1487,13 +1456,8 @@ class HQMainWindow(QMainWindow):
                 f"{unit_id} has been added to the roster",
             )
 
-            self.notification_badge.set_unread_count(
-                self.notification_panel.get_unread_count()
-            )
-
             self.refresh()
         except ValueError as e:
-            from .qt_compat import QMessageBox
             QMessageBox.warning(self, "Error", str(e))
 
     def _show_call_intake_dialog(self):
@@ -1518,10 +1482,6 @@ class HQMainWindow(QMainWindow):
             f"Call {call_data.get('call_id')} logged: {call_data.get('incident_type')}",
         )
 
-        self.notification_badge.set_unread_count(
-            self.notification_panel.get_unread_count()
-        )
-
     def _show_call_correlation_dialog(self) -> None:
         """Open the call correlation dialog for recent calls (3-13)."""
         if not self.call_log:
@@ -1566,10 +1526,6 @@ class HQMainWindow(QMainWindow):
             f"Linked calls: {summary}",
         )
 
-        self.notification_badge.set_unread_count(
-            self.notification_panel.get_unread_count()
-        )
-
         if self.drawer_content_manager:
             self.drawer_content_manager.show_analytics_summary(
                 {"Linked Calls": len(call_ids), "Primary": call_ids[0]}
@@ -1589,13 +1545,11 @@ class HQMainWindow(QMainWindow):
         # Mark all as read when opened
         # (This is optional behavior)
 
-    def _on_notification_dismissed(self, notification_id: str):
+    def _on_notification_dismissed(self, notification_id: int):
         """Handle notification dismissal (3-17)."""
-        self.notification_badge.set_unread_count(
-            self.notification_panel.get_unread_count()
-        )
+        logger.debug(f"Notification {notification_id} dismissed")
 
-    def _on_notification_action(self, notification_id: str):
+    def _on_notification_action(self, notification_id: int):
         """Handle notification action (3-17)."""
         # Action callbacks are already executed
         # This is for additional tracking/logging
@@ -1662,9 +1616,6 @@ class HQMainWindow(QMainWindow):
             "Preset Saved",
             f"{preset_name} is now available",
         )
-        self.notification_badge.set_unread_count(
-            self.notification_panel.get_unread_count()
-        )
 
     def _collect_current_filters(self, context: str) -> Dict[str, Any]:
         """Gather the current filter state for the active pane."""
@@ -1690,7 +1641,7 @@ class HQMainWindow(QMainWindow):
 
     def _get_task_data(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get task data by ID."""
-        tasks = self.controller.task_queue_model.items()
+        tasks = self.controller.task_queue_model.items(copy=False)
         for task in tasks:
             if task.get('task_id') == task_id:
                 return task
@@ -1698,7 +1649,7 @@ class HQMainWindow(QMainWindow):
 
     def _get_responder_data(self, unit_id: str) -> Optional[Dict[str, Any]]:
         """Get responder data by ID."""
-        responders = self.controller.roster_model.items()
+        responders = self.controller.roster_model.items(copy=False)
         for responder in responders:
             if responder.get('unit_id') == unit_id:
                 return responder
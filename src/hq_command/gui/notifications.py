@@ -8,19 +8,30 @@ Provides notification components for:
 """
 
 from __future__ import annotations
-from typing import Optional, List, Dict, Any, Callable
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Callable, Deque, Iterable, Iterator
 from datetime import datetime, timezone
 from enum import Enum
 from dataclasses import dataclass
 
 from .qt_compat import (
+    QApplication,
+    QColor,
+    QEvent,
+    QFont,
+    QIcon,
+    QPainter,
     QWidget,
     QFrame,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QPushButton,
+    QPixmap,
     QScrollArea,
+    QSizePolicy,
+    QTimer,
+    QToolButton,
     Qt,
     pyqtSignal,
 )
@@ -28,6 +39,17 @@ from .styles import theme
 from .components import Badge, BadgeType, Card, Button, ButtonVariant
 
 
+# =============================================================================
+# STYLES
+# =============================================================================
+
+# Inline QSS shared by every notification widget, formatted once at import
+_TIMESTAMP_QSS = f"color: {theme.NEUTRAL_500}; font-size: 11pt;"
+_TITLE_QSS = "font-weight: bold; font-size: 12pt;"
+_PANEL_HEADER_QSS = "font-weight: bold; font-size: 14pt;"
+_EMPTY_STATE_QSS = f"color: {theme.NEUTRAL_500}; padding: 40px;"
+
+
 # =============================================================================
 # NOTIFICATION TYPES
 # =============================================================================
@@ -44,7 +66,7 @@ class NotificationType(Enum):
 @dataclass
 class Notification:
     """Notification data structure."""
-    notification_id: str
+    notification_id: int
     notification_type: NotificationType
     title: str
     message: str
@@ -60,6 +82,57 @@ class Notification:
             self.metadata = {}
 
 
+# =============================================================================
+# GLYPH RENDERING
+# =============================================================================
+
+def _transparent_pixmap(size: int) -> QPixmap:
+    """Create an empty square pixmap at the application's device pixel ratio."""
+    app = QApplication.instance()
+    ratio = app.devicePixelRatio() if app is not None else 1.0
+
+    pixmap = QPixmap(int(size * ratio), int(size * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+    return pixmap
+
+
+def _render_glyph(glyph: str, color: str, size: int) -> QPixmap:
+    """Render a single glyph into a transparent, HiDPI-aware pixmap."""
+    pixmap = _transparent_pixmap(size)
+
+    painter = QPainter(pixmap)
+    font = QFont()
+    font.setBold(True)
+    font.setPixelSize(size - 4)
+    painter.setFont(font)
+    painter.setPen(QColor(color))
+    painter.drawText(0, 0, size, size, Qt.AlignCenter, glyph)
+    painter.end()
+    return pixmap
+
+
+# Emoji glyphs rendered once, avoiding per-paint emoji text shaping
+_EMOJI_CACHE: Dict[str, QPixmap] = {}
+_EMOJI_SIZE = 32
+_EMOJI_POINT_SIZE = 20
+
+
+def _emoji_pixmap(glyph: str) -> QPixmap:
+    """Return a cached pixmap of an emoji glyph drawn at 20pt."""
+    pixmap = _EMOJI_CACHE.get(glyph)
+    if pixmap is None:
+        pixmap = _transparent_pixmap(_EMOJI_SIZE)
+        painter = QPainter(pixmap)
+        font = QFont()
+        font.setPointSize(_EMOJI_POINT_SIZE)
+        painter.setFont(font)
+        painter.drawText(0, 0, _EMOJI_SIZE, _EMOJI_SIZE, Qt.AlignCenter, glyph)
+        painter.end()
+        _EMOJI_CACHE[glyph] = pixmap
+    return pixmap
+
+
 # =============================================================================
 # NOTIFICATION BADGE
 # =============================================================================
@@ -81,9 +154,10 @@ class NotificationBadge(QWidget):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        # Icon (using text emoji for now)
-        self.icon_label = QLabel("🔔")
-        self.icon_label.setStyleSheet("font-size: 20pt;")
+        # Icon (pre-rendered emoji, see _emoji_pixmap)
+        self.icon_label = QLabel()
+        self.icon_label.setPixmap(_emoji_pixmap("🔔"))
+        self.icon_label.setAccessibleName("Notifications")
         layout.addWidget(self.icon_label)
 
         # Badge with count
@@ -92,9 +166,13 @@ class NotificationBadge(QWidget):
         layout.addWidget(self.count_badge)
 
         # Make clickable
-        self.mousePressEvent = lambda e: self.clicked.emit()
         self.setCursor(Qt.PointingHandCursor)
 
+    def mousePressEvent(self, event):
+        """Emit ``clicked`` when the badge is pressed."""
+        self.clicked.emit()
+        super().mousePressEvent(event)
+
     def set_unread_count(self, count: int):
         """Update unread notification count."""
         self.unread_count = count
@@ -110,24 +188,77 @@ class NotificationBadge(QWidget):
 # NOTIFICATION ITEM
 # =============================================================================
 
+# Display formats indexed by NotificationItem._timestamp_bucket()
+_TIMESTAMP_FORMATS = ("Just now", "{}m ago", "{}h ago", "{}d ago")
+
+# Events after which a read item's snapshot no longer matches its widgets
+_SNAPSHOT_STALE_EVENTS = frozenset(
+    (QEvent.Type.StyleChange, QEvent.Type.PaletteChange, QEvent.Type.FontChange)
+)
+
+# Badge text/style for each notification type
+_TYPE_BADGE_SPEC: Dict[NotificationType, tuple[str, BadgeType]] = {
+    NotificationType.ESCALATION: ("⚠ Escalation", BadgeType.DANGER),
+    NotificationType.ASSIGNMENT: ("📋 Assignment", BadgeType.INFO),
+    NotificationType.SYSTEM: ("⚙ System", BadgeType.DEFAULT),
+    NotificationType.WARNING: ("⚠ Warning", BadgeType.WARNING),
+    NotificationType.INFO: ("ℹ Info", BadgeType.INFO),
+}
+_DEFAULT_BADGE_SPEC = ("Notification", BadgeType.DEFAULT)
+
+# Rendered type badges, captured from the first styled Badge shown per type
+_BADGE_PIXMAP_CACHE: Dict[NotificationType, QPixmap] = {}
+
+
+def clear_badge_cache():
+    """Discard cached type-badge pixmaps (call after a theme change)."""
+    _BADGE_PIXMAP_CACHE.clear()
+
+
+# Shared "✕" icon for every dismiss button, built on first use
+_DISMISS_ICON: Optional[QIcon] = None
+_DISMISS_ICON_SIZE = 16
+
+
+def _dismiss_icon() -> QIcon:
+    """Return the shared dismiss icon (neutral, turning red on hover)."""
+    global _DISMISS_ICON
+    if _DISMISS_ICON is None:
+        icon = QIcon()
+        icon.addPixmap(_render_glyph("✕", theme.NEUTRAL_500, _DISMISS_ICON_SIZE), QIcon.Normal)
+        icon.addPixmap(_render_glyph("✕", theme.DANGER, _DISMISS_ICON_SIZE), QIcon.Active)
+        _DISMISS_ICON = icon
+    return _DISMISS_ICON
+
+
 class NotificationItem(QFrame):
     """
     Individual notification item in the notification panel (3-17).
-    """
 
-    dismissed = pyqtSignal(str)  # notification_id
-    action_triggered = pyqtSignal(str)  # notification_id
+    Dismiss/action clicks are reported straight to the owning panel
+    instead of through per-item signals.
+    """
 
     def __init__(
         self,
         notification: Notification,
         parent: Optional[QWidget] = None,
+        panel: Optional[NotificationPanel] = None,
     ):
         super().__init__(parent)
 
         self.notification = notification
+        self._panel = panel
         self.setObjectName("Card")
 
+        # Last rendered timestamp bucket/value; the label only changes on a tick
+        self._ts_bucket: int = -1
+        self._ts_value: int = -1
+
+        # Read items are swapped for a static pixmap of their content while idle
+        self._cached_pixmap: Optional[QPixmap] = None
+        self._snapshot_label: Optional[QLabel] = None
+
         # Style based on read status
         if not notification.read:
             self.setProperty("unread", True)
@@ -136,7 +267,15 @@ class NotificationItem(QFrame):
 
     def _build_ui(self):
         """Build notification item UI."""
-        layout = QVBoxLayout(self)
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+        outer_layout.setSpacing(0)
+
+        # Live content; hidden while a read item is shown as a snapshot
+        self._live = QWidget()
+        outer_layout.addWidget(self._live)
+
+        layout = QVBoxLayout(self._live)
         layout.setContentsMargins(
             theme.SPACING_SM,
             theme.SPACING_SM,
@@ -149,39 +288,32 @@ class NotificationItem(QFrame):
         header_layout = QHBoxLayout()
 
         # Type badge
-        type_badge = self._get_type_badge()
-        header_layout.addWidget(type_badge)
+        self.type_badge = self._get_type_badge()
+        header_layout.addWidget(self.type_badge)
 
         # Timestamp
-        timestamp_str = self._format_timestamp(self.notification.timestamp)
-        timestamp_label = QLabel(timestamp_str)
-        timestamp_label.setStyleSheet(f"color: {theme.NEUTRAL_500}; font-size: 11pt;")
-        header_layout.addWidget(timestamp_label)
+        self.timestamp_label = QLabel()
+        self.timestamp_label.setStyleSheet(_TIMESTAMP_QSS)
+        self.refresh_timestamp(datetime.now(timezone.utc))
+        header_layout.addWidget(self.timestamp_label)
 
         header_layout.addStretch()
 
         # Dismiss button
-        dismiss_btn = QPushButton("✕")
+        dismiss_btn = QToolButton()
+        dismiss_btn.setObjectName("NotifDismiss")
+        dismiss_btn.setIcon(_dismiss_icon())
+        dismiss_btn.setAutoRaise(True)
         dismiss_btn.setFixedSize(24, 24)
-        dismiss_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                border: none;
-                color: {theme.NEUTRAL_500};
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                color: {theme.DANGER};
-            }}
-        """)
-        dismiss_btn.clicked.connect(lambda: self.dismissed.emit(self.notification.notification_id))
+        dismiss_btn.setToolTip("Dismiss")
+        dismiss_btn.clicked.connect(self._on_dismiss_clicked)
         header_layout.addWidget(dismiss_btn)
 
         layout.addLayout(header_layout)
 
         # Title
         title_label = QLabel(self.notification.title)
-        title_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
+        title_label.setStyleSheet(_TITLE_QSS)
         title_label.setWordWrap(True)
         layout.addWidget(title_label)
 
@@ -190,50 +322,98 @@ class NotificationItem(QFrame):
         message_label.setWordWrap(True)
         layout.addWidget(message_label)
 
-        # Action button (if actionable)
+        # Action button (if actionable); built on first show, see _ensure_action_button
+        self.action_btn: Optional[Button] = None
+        self._action_placeholder: Optional[QWidget] = None
         if self.notification.actionable and self.notification.action_label:
-            action_btn = Button(
-                self.notification.action_label,
-                ButtonVariant.PRIMARY,
-            )
-            action_btn.clicked.connect(
-                lambda: self.action_triggered.emit(self.notification.notification_id)
-            )
-            layout.addWidget(action_btn)
-
-    def _get_type_badge(self) -> Badge:
-        """Get badge for notification type."""
-        type_map = {
-            NotificationType.ESCALATION: ("⚠ Escalation", BadgeType.DANGER),
-            NotificationType.ASSIGNMENT: ("📋 Assignment", BadgeType.INFO),
-            NotificationType.SYSTEM: ("⚙ System", BadgeType.DEFAULT),
-            NotificationType.WARNING: ("⚠ Warning", BadgeType.WARNING),
-            NotificationType.INFO: ("ℹ Info", BadgeType.INFO),
-        }
-
-        text, badge_type = type_map.get(
+            self._action_placeholder = QWidget()
+            self._action_placeholder.setFixedHeight(theme.MIN_TOUCH_TARGET)
+            layout.addWidget(self._action_placeholder)
+
+    def _ensure_action_button(self):
+        """Swap the reserved placeholder for the real action button."""
+        if self._action_placeholder is None:
+            return
+
+        self.action_btn = Button(
+            self.notification.action_label,
+            ButtonVariant.PRIMARY,
+        )
+        self.action_btn.clicked.connect(self._on_action_clicked)
+        self._live.layout().replaceWidget(self._action_placeholder, self.action_btn)
+        self._action_placeholder.deleteLater()
+        self._action_placeholder = None
+
+    def _on_dismiss_clicked(self):
+        """Report a dismiss click to the owning panel."""
+        if self._panel is not None:
+            self._panel._on_notification_dismissed(self.notification.notification_id)
+
+    def _on_action_clicked(self):
+        """Report an action click to the owning panel."""
+        if self._panel is not None:
+            self._panel._on_notification_action(self.notification.notification_id)
+
+    def _get_type_badge(self) -> QLabel:
+        """Get badge for notification type.
+
+        Returns a pixmap label when this type has already been rendered,
+        otherwise a live ``Badge`` that is captured on first show.
+        """
+        text, badge_type = _TYPE_BADGE_SPEC.get(
             self.notification.notification_type,
-            ("Notification", BadgeType.DEFAULT)
+            _DEFAULT_BADGE_SPEC,
         )
 
-        return Badge(text, badge_type)
+        pixmap = _BADGE_PIXMAP_CACHE.get(self.notification.notification_type)
+        if pixmap is None:
+            return Badge(text, badge_type)
+
+        label = QLabel()
+        label.setPixmap(pixmap)
+        label.setAccessibleName(text)
+        return label
+
+    def showEvent(self, event):
+        """Build deferred widgets and capture the styled type badge for reuse."""
+        super().showEvent(event)
+        self._ensure_action_button()
+
+        notification_type = self.notification.notification_type
+        if isinstance(self.type_badge, Badge) and notification_type not in _BADGE_PIXMAP_CACHE:
+            _BADGE_PIXMAP_CACHE[notification_type] = self.type_badge.grab()
+
+    @staticmethod
+    def _timestamp_bucket(seconds: int) -> tuple[int, int]:
+        """Return the display ``(bucket, value)`` for an age in seconds."""
+        if seconds < 60:
+            return 0, 0
+        elif seconds < 3600:
+            return 1, seconds // 60
+        elif seconds < 86400:
+            return 2, seconds // 3600
+        else:
+            return 3, seconds // 86400
 
     def _format_timestamp(self, timestamp: datetime) -> str:
         """Format timestamp for display."""
-        now = datetime.now(timezone.utc)
-        delta = now - timestamp
-
-        if delta.total_seconds() < 60:
-            return "Just now"
-        elif delta.total_seconds() < 3600:
-            minutes = int(delta.total_seconds() / 60)
-            return f"{minutes}m ago"
-        elif delta.total_seconds() < 86400:
-            hours = int(delta.total_seconds() / 3600)
-            return f"{hours}h ago"
-        else:
-            days = int(delta.total_seconds() / 86400)
-            return f"{days}d ago"
+        seconds = int((datetime.now(timezone.utc) - timestamp).total_seconds())
+        bucket, value = self._timestamp_bucket(seconds)
+        return _TIMESTAMP_FORMATS[bucket].format(value)
+
+    def refresh_timestamp(self, now: datetime):
+        """Update the timestamp label only if its displayed text would change."""
+        seconds = int((now - self.notification.timestamp).total_seconds())
+        bucket, value = self._timestamp_bucket(seconds)
+        if bucket == self._ts_bucket and value == self._ts_value:
+            return
+
+        self._ts_bucket = bucket
+        self._ts_value = value
+        self.timestamp_label.setText(_TIMESTAMP_FORMATS[bucket].format(value))
+
+        # A stale snapshot would keep showing the old text
+        self._refresh_snapshot()
 
     def mark_read(self):
         """Mark notification as read."""
@@ -243,6 +423,70 @@ class NotificationItem(QFrame):
         self.style().unpolish(self)
         self.style().polish(self)
 
+        self._schedule_snapshot()
+
+    def is_snapshot(self) -> bool:
+        """Return True while the item is displayed as a cached pixmap."""
+        return self._snapshot_label is not None and self._live.isHidden()
+
+    def _schedule_snapshot(self):
+        """Snapshot the item once pending layout/paint work has run."""
+        QTimer.singleShot(0, self, self._snapshot)
+
+    def _snapshot(self):
+        """Replace the live child widgets with a pixmap of their current look."""
+        if not self.notification.read or self.is_snapshot():
+            return
+        if not self.isVisible() or self.underMouse():
+            return
+
+        self._cached_pixmap = self._live.grab()
+        if self._snapshot_label is None:
+            self._snapshot_label = QLabel()
+            # Let the item shrink past the pixmap; resizeEvent re-takes it
+            self._snapshot_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
+            self.layout().addWidget(self._snapshot_label)
+        self._snapshot_label.setPixmap(self._cached_pixmap)
+        self._live.setVisible(False)
+        self._snapshot_label.setVisible(True)
+
+    def _refresh_snapshot(self):
+        """Re-take a shown snapshot so it matches the live widgets again."""
+        if self.is_snapshot():
+            self._restore_live()
+            self._schedule_snapshot()
+
+    def _restore_live(self):
+        """Swap the snapshot back for the interactive child widgets."""
+        if not self.is_snapshot():
+            return
+
+        self._snapshot_label.setVisible(False)
+        self._live.setVisible(True)
+        self._cached_pixmap = None
+
+    def resizeEvent(self, event):
+        """Drop a snapshot taken at the old size."""
+        super().resizeEvent(event)
+        self._refresh_snapshot()
+
+    def changeEvent(self, event):
+        """Drop a snapshot that no longer matches the style, palette or font."""
+        super().changeEvent(event)
+        if event.type() in _SNAPSHOT_STALE_EVENTS:
+            self._refresh_snapshot()
+
+    def enterEvent(self, event):
+        """Go live on hover so buttons respond normally."""
+        self._restore_live()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        """Return read items to their snapshot once the pointer leaves."""
+        super().leaveEvent(event)
+        if self.notification.read:
+            self._schedule_snapshot()
+
 
 # =============================================================================
 # NOTIFICATION PANEL
@@ -255,19 +499,28 @@ class NotificationPanel(QFrame):
     Displays a list of notifications with filtering and actions.
     """
 
-    notification_dismissed = pyqtSignal(str)  # notification_id
-    notification_action = pyqtSignal(str)  # notification_id
+    notification_dismissed = pyqtSignal(int)  # notification_id
+    notification_action = pyqtSignal(int)  # notification_id
+    unread_count_changed = pyqtSignal(int)  # unread count
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
-        self.notifications: List[Notification] = []
-        self.notification_items: Dict[str, NotificationItem] = {}
+        # Newest first; appendleft keeps head insertion O(1)
+        self.notifications: Deque[Notification] = deque()
+        self.notification_items: Dict[int, NotificationItem] = {}
+        # Maintained incrementally so badge refreshes never rescan the list
+        self._unread_count = 0
 
         self.setObjectName("Panel")
 
         self._build_ui()
 
+        # Relative timestamps ("5m ago") are refreshed once per second while shown
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(1000)
+        self._refresh_timer.timeout.connect(self._refresh_timestamps)
+
     def _build_ui(self):
         """Build notification panel UI."""
         layout = QVBoxLayout(self)
@@ -280,7 +533,7 @@ class NotificationPanel(QFrame):
         header_layout = QHBoxLayout(header)
 
         header_label = QLabel("Notifications")
-        header_label.setStyleSheet("font-weight: bold; font-size: 14pt;")
+        header_label.setStyleSheet(_PANEL_HEADER_QSS)
         header_layout.addWidget(header_label)
 
         header_layout.addStretch()
@@ -319,69 +572,133 @@ class NotificationPanel(QFrame):
         # Empty state
         self.empty_label = QLabel("No notifications")
         self.empty_label.setAlignment(Qt.AlignCenter)
-        self.empty_label.setStyleSheet(f"color: {theme.NEUTRAL_500}; padding: 40px;")
+        self.empty_label.setStyleSheet(_EMPTY_STATE_QSS)
         self.notifications_layout.insertWidget(0, self.empty_label)
 
     def add_notification(self, notification: Notification):
         """Add a new notification to the panel."""
+        if self._insert_notification(notification):
+            self._set_unread_count(self._unread_count + 1)
+
+    def add_notifications(self, notifications: Iterable[Notification]):
+        """Add several notifications with a single layout pass and count update."""
+        added_unread = 0
+        self.setUpdatesEnabled(False)
+        try:
+            for notification in notifications:
+                if self._insert_notification(notification):
+                    added_unread += 1
+        finally:
+            self.setUpdatesEnabled(True)
+
+        if added_unread:
+            self._set_unread_count(self._unread_count + added_unread)
+
+    def _insert_notification(self, notification: Notification) -> bool:
+        """Insert a notification item at the top; returns True if it is unread."""
         # Hide empty state if visible
-        if self.empty_label.isVisible():
+        if not self.empty_label.isHidden():
             self.empty_label.setVisible(False)
 
         # Create notification item
-        item = NotificationItem(notification)
-        item.dismissed.connect(self._on_notification_dismissed)
-        item.action_triggered.connect(self._on_notification_action)
+        item = NotificationItem(notification, panel=self)
 
         # Add to top of list
         self.notifications_layout.insertWidget(0, item)
-        self.notifications.insert(0, notification)
+        self.notifications.appendleft(notification)
         self.notification_items[notification.notification_id] = item
 
-    def remove_notification(self, notification_id: str):
+        return not notification.read
+
+    def remove_notification(self, notification_id: int):
         """Remove a notification from the panel."""
         if notification_id in self.notification_items:
             item = self.notification_items[notification_id]
+            was_unread = not item.notification.read
             self.notifications_layout.removeWidget(item)
             item.deleteLater()
             del self.notification_items[notification_id]
 
             # Remove from list
-            self.notifications = [
-                n for n in self.notifications
-                if n.notification_id != notification_id
-            ]
+            self.notifications.remove(item.notification)
 
             # Show empty state if no notifications
             if not self.notifications:
                 self.empty_label.setVisible(True)
 
+            if was_unread:
+                self._set_unread_count(self._unread_count - 1)
+
+    def showEvent(self, event):
+        """Bring timestamps up to date and resume the refresh timer."""
+        super().showEvent(event)
+        self._refresh_timestamps()
+        self._refresh_timer.start()
+
+    def hideEvent(self, event):
+        """Stop refreshing timestamps nobody can see."""
+        super().hideEvent(event)
+        self._refresh_timer.stop()
+
+    def _refresh_timestamps(self):
+        """Refresh relative timestamps on all notification items."""
+        if not self.isVisibleTo(self.window()):
+            return
+
+        now = datetime.now(timezone.utc)
+        for item in self.notification_items.values():
+            item.refresh_timestamp(now)
+
     def get_unread_count(self) -> int:
         """Get count of unread notifications."""
-        return sum(1 for n in self.notifications if not n.read)
+        return self._unread_count
+
+    def mark_read(self, notification_id: int):
+        """Mark a single notification as read."""
+        item = self.notification_items.get(notification_id)
+        if item is None or item.notification.read:
+            return
+
+        item.mark_read()
+        self._set_unread_count(self._unread_count - 1)
+
+    def _set_unread_count(self, count: int):
+        """Store the unread count and notify listeners."""
+        self._unread_count = count
+        self.unread_count_changed.emit(count)
 
     def _mark_all_read(self):
         """Mark all notifications as read."""
         for item in self.notification_items.values():
-            item.mark_read()
+            if not item.notification.read:
+                item.mark_read()
+
+        if self._unread_count:
+            self._set_unread_count(0)
 
     def _clear_all(self):
         """Clear all notifications."""
-        for notification_id in list(self.notification_items.keys()):
-            self.remove_notification(notification_id)
+        for item in self.notification_items.values():
+            self.notifications_layout.removeWidget(item)
+            item.deleteLater()
 
-    def _on_notification_dismissed(self, notification_id: str):
+        self.notification_items.clear()
+        self.notifications.clear()
+        self.empty_label.setVisible(True)
+
+        if self._unread_count:
+            self._set_unread_count(0)
+
+    def _on_notification_dismissed(self, notification_id: int):
         """Handle notification dismissal."""
         self.remove_notification(notification_id)
         self.notification_dismissed.emit(notification_id)
 
-    def _on_notification_action(self, notification_id: str):
+    def _on_notification_action(self, notification_id: int):
         """Handle notification action."""
         # Find notification and execute callback if present
-        notification = next(
-            (n for n in self.notifications if n.notification_id == notification_id),
-            None
-        )
+        item = self.notification_items.get(notification_id)
+        notification = item.notification if item is not None else None
 
         if notification and notification.action_callback:
             notification.action_callback()
@@ -403,17 +720,55 @@ class NotificationManager:
     def __init__(self, notification_panel: NotificationPanel):
         self.panel = notification_panel
         self._notification_counter = 0
+        self._batch_now: Optional[datetime] = None
+        self._pending: Optional[List[Notification]] = None
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group notifications created inside the block.
+
+        All helpers share one timestamp, and the panel receives the
+        notifications together when the block exits.
+        """
+        if self._pending is not None:
+            # Nested batch: the outermost block flushes
+            yield
+            return
+
+        self._batch_now = datetime.now(timezone.utc)
+        self._pending = []
+        try:
+            yield
+        finally:
+            pending = self._pending
+            self._batch_now = None
+            self._pending = None
+            if pending:
+                self.panel.add_notifications(pending)
+
+    def _now(self) -> datetime:
+        """Current timestamp, shared across a batch."""
+        return self._batch_now or datetime.now(timezone.utc)
+
+    def _submit(self, notification: Notification):
+        """Send a notification to the panel, or queue it inside a batch."""
+        if self._pending is not None:
+            self._pending.append(notification)
+        else:
+            self.panel.add_notification(notification)
 
-    def _generate_id(self) -> str:
+    def _generate_id(self) -> int:
         """Generate unique notification ID."""
         self._notification_counter += 1
-        return f"notification-{self._notification_counter}"
+        return self._notification_counter
 
     def add_escalation_notification(
         self,
         task_id: str,
         reason: str,
         action_callback: Optional[Callable] = None,
+        timestamp: Optional[datetime] = None,
     ):
         """Add an escalation notification."""
         notification = Notification(
@@ -421,19 +776,20 @@ class NotificationManager:
             notification_type=NotificationType.ESCALATION,
             title=f"Task {task_id} Escalated",
             message=f"Reason: {reason}",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=timestamp or self._now(),
             actionable=action_callback is not None,
             action_label="View Task" if action_callback else None,
             action_callback=action_callback,
         )
 
-        self.panel.add_notification(notification)
+        self._submit(notification)
 
     def add_assignment_notification(
         self,
         task_id: str,
         unit_ids: List[str],
         action_callback: Optional[Callable] = None,
+        timestamp: Optional[datetime] = None,
     ):
         """Add an assignment notification."""
         units_str = ", ".join(unit_ids)
@@ -442,13 +798,13 @@ class NotificationManager:
             notification_type=NotificationType.ASSIGNMENT,
             title="New Assignment",
             message=f"Task {task_id} assigned to: {units_str}",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=timestamp or self._now(),
             actionable=action_callback is not None,
             action_label="View Assignment" if action_callback else None,
             action_callback=action_callback,
         )
 
-        self.panel.add_notification(notification)
+        self._submit(notification)
 
     def add_system_notification(
         self,
@@ -456,6 +812,7 @@ class NotificationManager:
         message: str,
         action_callback: Optional[Callable] = None,
         action_label: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
     ):
         """Add a system notification."""
         notification = Notification(
@@ -463,34 +820,44 @@ class NotificationManager:
             notification_type=NotificationType.SYSTEM,
             title=title,
             message=message,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=timestamp or self._now(),
             actionable=action_callback is not None,
             action_label=action_label,
             action_callback=action_callback,
         )
 
-        self.panel.add_notification(notification)
+        self._submit(notification)
 
-    def add_warning_notification(self, title: str, message: str):
+    def add_warning_notification(
+        self,
+        title: str,
+        message: str,
+        timestamp: Optional[datetime] = None,
+    ):
         """Add a warning notification."""
         notification = Notification(
             notification_id=self._generate_id(),
             notification_type=NotificationType.WARNING,
             title=title,
             message=message,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=timestamp or self._now(),
         )
 
-        self.panel.add_notification(notification)
+        self._submit(notification)
 
-    def add_info_notification(self, title: str, message: str):
+    def add_info_notification(
+        self,
+        title: str,
+        message: str,
+        timestamp: Optional[datetime] = None,
+    ):
         """Add an info notification."""
         notification = Notification(
             notification_id=self._generate_id(),
             notification_type=NotificationType.INFO,
             title=title,
             message=message,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=timestamp or self._now(),
         )
 
-        self.panel.add_notification(notification)
+        self._submit(notification)
@@ -1,153 +1,213 @@
 """Centralized imports for PySide6 GUI classes used by HQ Command."""
 from __future__ import annotations
 
-from typing import Any
+import weakref
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Optional
 
 try:
-    from PySide6 import QtCore, QtGui, QtWidgets, QtSvg
+    from PySide6 import QtCore, QtGui, QtWidgets
+    from PySide6.QtCore import (
+        QAbstractItemModel,
+        QAbstractListModel,
+        QAbstractTableModel,
+        QEasingCurve,
+        QEvent,
+        QModelIndex,
+        QObject,
+        QParallelAnimationGroup,
+        QPoint,
+        QPointF,
+        QPropertyAnimation,
+        QRect,
+        QRectF,
+        QSequentialAnimationGroup,
+        QSize,
+        QSortFilterProxyModel,
+        Qt,
+        QTimer,
+    )
+    from PySide6.QtCore import Signal as pyqtSignal
+    from PySide6.QtGui import (
+        QAction,
+        QBrush,
+        QColor,
+        QFont,
+        QFontMetrics,
+        QIcon,
+        QKeySequence,
+        QPainter,
+        QPalette,
+        QPen,
+        QPixmap,
+        QPolygonF,
+        QScreen,
+        QShortcut,
+    )
+    from PySide6.QtWidgets import (
+        QAbstractItemView,
+        QApplication,
+        QCheckBox,
+        QComboBox,
+        QDialog,
+        QDialogButtonBox,
+        QFileDialog,
+        QFrame,
+        QGraphicsOpacityEffect,
+        QGridLayout,
+        QGroupBox,
+        QHBoxLayout,
+        QHeaderView,
+        QLabel,
+        QLineEdit,
+        QListView,
+        QListWidget,
+        QListWidgetItem,
+        QMainWindow,
+        QMenu,
+        QMessageBox,
+        QProgressBar,
+        QPushButton,
+        QScrollArea,
+        QSizePolicy,
+        QSpinBox,
+        QSplitter,
+        QStackedWidget,
+        QStyledItemDelegate,
+        QStyleOptionViewItem,
+        QTableView,
+        QTableWidget,
+        QTableWidgetItem,
+        QTabWidget,
+        QTextEdit,
+        QToolButton,
+        QVBoxLayout,
+        QWidget,
+    )
 except ImportError as exc:  # pragma: no cover - import-time guard
     raise ImportError("PySide6 is required to run the HQ Command GUI.") from exc
 
+if TYPE_CHECKING:
+    from PySide6 import QtSvg  # noqa: F401 - resolved lazily by __getattr__
+    from PySide6.QtSvg import QSvgRenderer  # noqa: F401
+
 QT_API = "PySide6"
 SUPPORTED_QT_BINDINGS: tuple[str, ...] = (QT_API,)
 
-# Core modules
-Qt = QtCore.Qt
-pyqtSignal = QtCore.Signal
-
-# QtCore exports
-QAbstractItemModel = QtCore.QAbstractItemModel
-QAbstractListModel = QtCore.QAbstractListModel
-QModelIndex = QtCore.QModelIndex
-QObject = QtCore.QObject
-QTimer = QtCore.QTimer
-QPoint = QtCore.QPoint
-QPointF = QtCore.QPointF
-QRect = QtCore.QRect
-QSize = QtCore.QSize
-QPropertyAnimation = QtCore.QPropertyAnimation
-QEasingCurve = QtCore.QEasingCurve
-QParallelAnimationGroup = QtCore.QParallelAnimationGroup
-QSequentialAnimationGroup = QtCore.QSequentialAnimationGroup
-
-# QtGui exports
-QAction = QtGui.QAction
-QBrush = QtGui.QBrush
-QColor = QtGui.QColor
-QFont = QtGui.QFont
-QIcon = QtGui.QIcon
-QKeySequence = QtGui.QKeySequence
-QPainter = QtGui.QPainter
-QPen = QtGui.QPen
-QPixmap = QtGui.QPixmap
-QPolygonF = QtGui.QPolygonF
-QScreen = QtGui.QScreen
-QShortcut = QtGui.QShortcut
-
-# QtSvg exports
-QSvgRenderer = QtSvg.QSvgRenderer
-
-# QtWidgets exports
-QAbstractItemView = QtWidgets.QAbstractItemView
-QApplication = QtWidgets.QApplication
-QCheckBox = QtWidgets.QCheckBox
-QTabWidget = QtWidgets.QTabWidget
-QComboBox = QtWidgets.QComboBox
-QDialog = QtWidgets.QDialog
-QDialogButtonBox = QtWidgets.QDialogButtonBox
-QFrame = QtWidgets.QFrame
-QGraphicsOpacityEffect = QtWidgets.QGraphicsOpacityEffect
-QGridLayout = QtWidgets.QGridLayout
-QGroupBox = QtWidgets.QGroupBox
-QHeaderView = QtWidgets.QHeaderView
-QHBoxLayout = QtWidgets.QHBoxLayout
-QLabel = QtWidgets.QLabel
-QLineEdit = QtWidgets.QLineEdit
-QListWidget = QtWidgets.QListWidget
-QListWidgetItem = QtWidgets.QListWidgetItem
-QMainWindow = QtWidgets.QMainWindow
-QMenu = QtWidgets.QMenu
-QProgressBar = QtWidgets.QProgressBar
-QPushButton = QtWidgets.QPushButton
-QScrollArea = QtWidgets.QScrollArea
-QSizePolicy = QtWidgets.QSizePolicy
-QSpinBox = QtWidgets.QSpinBox
-QSplitter = QtWidgets.QSplitter
-QStackedWidget = QtWidgets.QStackedWidget
-QStyledItemDelegate = QtWidgets.QStyledItemDelegate
-QTableView = QtWidgets.QTableView
-QTableWidget = QtWidgets.QTableWidget
-QTableWidgetItem = QtWidgets.QTableWidgetItem
-QTextEdit = QtWidgets.QTextEdit
-QToolButton = QtWidgets.QToolButton
-QVBoxLayout = QtWidgets.QVBoxLayout
-QWidget = QtWidgets.QWidget
-
-# Additional helpers
-QPalette = QtGui.QPalette
-QStyleOptionViewItem = QtWidgets.QStyleOptionViewItem
+# QtSvg is needed only by the icon colorizer, so its names are resolved on
+# first access (PEP 562); maps export name -> (Qt submodule, attribute or
+# None for the module itself).
+_LAZY_ATTRS: dict[str, tuple[str, Optional[str]]] = {
+    "QtSvg": ("QtSvg", None),
+    "QSvgRenderer": ("QtSvg", "QSvgRenderer"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported Qt names and cache them as module globals."""
+
+    spec = _LAZY_ATTRS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr = spec
+    module = import_module(f"{QT_API}.{module_name}")
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+# Resolved exec method name per class; only classes that define one are cached.
+_EXEC_METHODS: "weakref.WeakKeyDictionary[type, str]" = weakref.WeakKeyDictionary()
 
 
 def qt_exec(target: Any, *args: Any, **kwargs: Any) -> Any:
     """Execute dialogs or menus, honoring PySide6 exec variations."""
 
-    for method_name in ("exec", "exec_"):
-        method = getattr(target, method_name, None)
-        if callable(method):
-            return method(*args, **kwargs)
-    return None
+    cls = type(target)
+    method_name = _EXEC_METHODS.get(cls)
+    if method_name is None:
+        method_name = next(
+            (name for name in ("exec", "exec_") if callable(getattr(cls, name, None))),
+            None,
+        )
+        if method_name is None:
+            # Not on the class: the callable may live on the instance (mocks,
+            # namespaces), so look it up there without caching the miss
+            for name in ("exec", "exec_"):
+                method = getattr(target, name, None)
+                if callable(method):
+                    return method(*args, **kwargs)
+            return None
+        _EXEC_METHODS[cls] = method_name
+    return getattr(target, method_name)(*args, **kwargs)
 
 
 __all__ = [
     "QT_API",
-    "Qt",
     "QtCore",
     "QtGui",
     "QtWidgets",
     "SUPPORTED_QT_BINDINGS",
+    "pyqtSignal",
+    "qt_exec",
+    "Qt",
     "QAbstractItemModel",
     "QAbstractListModel",
-    "QAbstractItemView",
+    "QAbstractTableModel",
+    "QModelIndex",
+    "QEvent",
+    "QObject",
+    "QTimer",
+    "QPoint",
+    "QPointF",
+    "QRect",
+    "QRectF",
+    "QSize",
+    "QSortFilterProxyModel",
+    "QPropertyAnimation",
+    "QEasingCurve",
+    "QParallelAnimationGroup",
+    "QSequentialAnimationGroup",
     "QAction",
-    "QApplication",
     "QBrush",
-    "QCheckBox",
     "QColor",
+    "QFont",
+    "QFontMetrics",
+    "QIcon",
+    "QKeySequence",
+    "QPainter",
+    "QPalette",
+    "QPen",
+    "QPixmap",
+    "QPolygonF",
+    "QScreen",
+    "QShortcut",
+    "QAbstractItemView",
+    "QApplication",
+    "QCheckBox",
+    "QTabWidget",
     "QComboBox",
     "QDialog",
     "QDialogButtonBox",
+    "QFileDialog",
     "QFrame",
     "QGraphicsOpacityEffect",
     "QGridLayout",
     "QGroupBox",
     "QHeaderView",
     "QHBoxLayout",
-    "QIcon",
-    "QFont",
-    "QKeySequence",
     "QLabel",
     "QLineEdit",
+    "QListView",
     "QListWidget",
     "QListWidgetItem",
     "QMainWindow",
     "QMenu",
-    "QModelIndex",
-    "QObject",
-    "QPalette",
-    "QPainter",
-    "QPen",
-    "QPixmap",
-    "QPoint",
-    "QPointF",
-    "QPolygonF",
+    "QMessageBox",
     "QProgressBar",
-    "QPropertyAnimation",
     "QPushButton",
-    "QScreen",
     "QScrollArea",
-    "QSequentialAnimationGroup",
-    "QShortcut",
-    "QSize",
     "QSizePolicy",
     "QSpinBox",
     "QSplitter",
@@ -158,13 +218,7 @@ __all__ = [
     "QTableWidget",
     "QTableWidgetItem",
     "QTextEdit",
-    "QTimer",
     "QToolButton",
     "QVBoxLayout",
     "QWidget",
-    "QRect",
-    "QEasingCurve",
-    "QParallelAnimationGroup",
-    "pyqtSignal",
-    "qt_exec",
 ]
@@ -7,26 +7,45 @@ Provides components for:
 """
 
 from __future__ import annotations
-from typing import Optional, List, Dict, Any, Callable
+
+import hashlib
+import html
 import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from .components import Button, ButtonVariant, Card, Heading, Input
 from .qt_compat import (
-    QWidget,
+    QAbstractListModel,
+    QComboBox,
     QFrame,
-    QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QPushButton,
-    QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
-    QComboBox,
+    QModelIndex,
+    QObject,
     Qt,
+    QTimer,
+    QVBoxLayout,
+    QWidget,
     pyqtSignal,
 )
-from .styles import theme
-from .components import Input, Button, ButtonVariant, Card, Heading
+
+try:  # Optional C-accelerated JSON for preset files
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Rows laid out per pass when list views use batched layout.
+LIST_BATCH_SIZE = 64
+
+# Search scopes in scope-selector order, as emitted by search_requested.
+_SEARCH_SCOPES: Tuple[str, ...] = ("all", "tasks", "responders", "calls")
 
 
 # =============================================================================
@@ -42,10 +61,20 @@ class GlobalSearchBar(QWidget):
 
     search_requested = pyqtSignal(str, str)  # query, scope
 
+    # Searches submitted within this window are coalesced into one emit.
+    SEARCH_DEBOUNCE_MS = 150
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
         self.search_history: List[str] = []
+        self._history_set: Set[str] = set()
+
+        self._pending_search: Optional[Tuple[str, str]] = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._emit_timer.timeout.connect(self._emit_pending_search)
 
         self._context_label: Optional[QLabel] = None
 
@@ -58,12 +87,7 @@ class GlobalSearchBar(QWidget):
 
         # Scope selector
         self.scope_select = QComboBox()
-        self.scope_select.addItems([
-            "All",
-            "Tasks",
-            "Responders",
-            "Calls",
-        ])
+        self.scope_select.addItems([scope.title() for scope in _SEARCH_SCOPES])
         layout.addWidget(self.scope_select)
 
         # Search input
@@ -85,12 +109,24 @@ class GlobalSearchBar(QWidget):
             return
 
         # Add to history
-        if query not in self.search_history:
+        if query not in self._history_set:
             self.search_history.insert(0, query)
+            self._history_set.add(query)
             # Keep only last 10
-            self.search_history = self.search_history[:10]
+            for dropped in self.search_history[10:]:
+                self._history_set.discard(dropped)
+            del self.search_history[10:]
+
+        scope = _SEARCH_SCOPES[self.scope_select.currentIndex()]
+        self._pending_search = (query, scope)
+        self._emit_timer.start()
 
-        scope = self.scope_select.currentText().lower()
+    def _emit_pending_search(self):
+        """Emit the most recent search once a burst of submissions settles."""
+        if self._pending_search is None:
+            return
+        query, scope = self._pending_search
+        self._pending_search = None
         self.search_requested.emit(query, scope)
 
     def set_focus(self):
@@ -99,6 +135,67 @@ class GlobalSearchBar(QWidget):
         self.search_input.selectAll()
 
 
+@lru_cache(maxsize=4096)
+def _format_result_text(result_type: str, result_id: str, details: Tuple[Any, ...]) -> str:
+    """Format a search result line from its type, id and type-specific fields."""
+    if result_type == 'task':
+        priority, location = details
+        return f"[Task] {result_id} (P{priority}) - {location}"
+    elif result_type == 'responder':
+        status, capabilities = details
+        return f"[Responder] {result_id} ({status}) - {', '.join(capabilities)}"
+    elif result_type == 'call':
+        (incident,) = details
+        return f"[Call] {result_id} - {incident}"
+    else:
+        return f"[{result_type}] {result_id}"
+
+
+def _format_result(result: Dict[str, Any]) -> str:
+    """Format a search result dict for display."""
+    result_type = result.get('type', 'unknown')
+    result_id = result.get('id', 'unknown')
+
+    # Only the fields shown for each type go into the cache key, so the
+    # same row re-rendered for a later query is a cache hit.
+    details: Tuple[Any, ...]
+    if result_type == 'task':
+        details = (result.get('priority', ''), result.get('location', ''))
+    elif result_type == 'responder':
+        details = (result.get('status', ''), tuple(result.get('capabilities', [])))
+    elif result_type == 'call':
+        details = (result.get('incident_type', ''),)
+    else:
+        details = ()
+    return _format_result_text(result_type, result_id, details)
+
+
+class SearchResultsModel(QAbstractListModel):
+    """List model over search result dicts, formatting rows as they are drawn."""
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._results: List[Dict[str, Any]] = []
+
+    def rowCount(self, parent: Optional[QModelIndex] = None) -> int:  # type: ignore[override]
+        return len(self._results)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        row = index.row()
+        if row < 0 or row >= len(self._results):
+            return None
+        if role == Qt.DisplayRole:
+            return _format_result(self._results[row])
+        if role == Qt.UserRole:
+            return self._results[row]
+        return None
+
+    def set_results(self, results: List[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._results = results
+        self.endResetModel()
+
+
 class SearchResultsPanel(QFrame):
     """
     Search results panel (3-15).
@@ -124,64 +221,44 @@ class SearchResultsPanel(QFrame):
         # Header
         header_layout = QHBoxLayout()
         self.results_label = QLabel("Search Results")
-        self.results_label.setStyleSheet("font-weight: bold; font-size: 14pt;")
+        self.results_label.setObjectName("PanelTitle")
         header_layout.addWidget(self.results_label)
         layout.addLayout(header_layout)
 
-        # Results list
-        self.results_list = QListWidget()
-        self.results_list.itemClicked.connect(self._on_result_clicked)
+        # Results list; rows are formatted by the model only when drawn
+        self.results_model = SearchResultsModel(self)
+        self.results_list = QListView()
+        self.results_list.setModel(self.results_model)
+        self.results_list.setUniformItemSizes(True)
+        self.results_list.setLayoutMode(QListView.Batched)
+        self.results_list.setBatchSize(LIST_BATCH_SIZE)
+        self.results_list.clicked.connect(self._on_result_clicked)
         layout.addWidget(self.results_list)
 
         # Empty state
         self.empty_label = QLabel("No results found")
         self.empty_label.setAlignment(Qt.AlignCenter)
-        self.empty_label.setStyleSheet(f"color: {theme.NEUTRAL_500}; padding: 40px;")
+        self.empty_label.setObjectName("EmptyState")
         self.empty_label.setVisible(True)
         layout.addWidget(self.empty_label)
 
     def set_results(self, query: str, results: List[Dict[str, Any]]):
         """Set search results."""
         self.results = results
-        self.results_list.clear()
-
-        if not results:
-            self.results_label.setText("Search Results (0)")
-            self.empty_label.setVisible(True)
-            self.results_list.setVisible(False)
-            return
+        self.results_model.set_results(results)
 
+        has_results = bool(results)
         self.results_label.setText(f"Search Results ({len(results)})")
-        self.empty_label.setVisible(False)
-        self.results_list.setVisible(True)
-
-        for result in results:
-            item_text = self._format_result(result, query)
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, result)
-            self.results_list.addItem(item)
+        self.empty_label.setVisible(not has_results)
+        self.results_list.setVisible(has_results)
 
     def _format_result(self, result: Dict[str, Any], query: str) -> str:
         """Format result for display with highlighting."""
-        result_type = result.get('type', 'unknown')
-        result_id = result.get('id', 'unknown')
-
-        if result_type == 'task':
-            priority = result.get('priority', '')
-            return f"[Task] {result_id} (P{priority}) - {result.get('location', '')}"
-        elif result_type == 'responder':
-            status = result.get('status', '')
-            caps = ', '.join(result.get('capabilities', []))
-            return f"[Responder] {result_id} ({status}) - {caps}"
-        elif result_type == 'call':
-            incident = result.get('incident_type', '')
-            return f"[Call] {result_id} - {incident}"
-        else:
-            return f"[{result_type}] {result_id}"
-
-    def _on_result_clicked(self, item: QListWidgetItem):
+        return _format_result(result)
+
+    def _on_result_clicked(self, index: QModelIndex):
         """Handle result click."""
-        result = item.data(Qt.UserRole)
+        result = index.data(Qt.UserRole)
         self.result_selected.emit(result.get('type', ''), result)
 
 
@@ -189,6 +266,20 @@ class SearchResultsPanel(QFrame):
 # FILTER PERSISTENCE (3-16)
 # =============================================================================
 
+def _dumps_presets(data: Dict[str, Any]) -> bytes:
+    """Serialize preset data to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _loads_presets(raw: bytes) -> Dict[str, Any]:
+    """Parse preset JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class FilterPreset:
     """Filter preset data structure."""
 
@@ -198,17 +289,26 @@ class FilterPreset:
         filters: Dict[str, Any],
         description: str = "",
     ):
+        self._dict_cache: Optional[Dict[str, Any]] = None
         self.name = name
         self.filters = filters
         self.description = description
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != '_dict_cache':
+            # Any field reassignment invalidates the cached to_dict() result.
+            super().__setattr__('_dict_cache', None)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            'name': self.name,
-            'filters': self.filters,
-            'description': self.description,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'name': self.name,
+                'filters': self.filters,
+                'description': self.description,
+            }
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'FilterPreset':
@@ -232,8 +332,35 @@ class FilterManager:
             config_path = Path.home() / ".hq_command" / "filter_presets.json"
 
         self.config_path = config_path
-        self.presets: Dict[str, FilterPreset] = {}
-
+        self._presets: Dict[str, FilterPreset] = {}
+        # Presets are read from disk on first access rather than at startup.
+        self._loaded = False
+        self._names_cache: Optional[Tuple[str, ...]] = None
+
+        # Preset files are written by a single worker so saves never block
+        # the GUI thread and land on disk in submission order.
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending_write: Optional[Future] = None
+        # Digest of the file contents last loaded or written, to skip no-op saves.
+        self._last_saved_hash: Optional[bytes] = None
+
+    @property
+    def presets(self) -> Dict[str, FilterPreset]:
+        """Presets by key, loaded from disk on first access."""
+        self._ensure_loaded()
+        return self._presets
+
+    @presets.setter
+    def presets(self, presets: Dict[str, FilterPreset]) -> None:
+        self._loaded = True
+        self._presets = presets
+        self._names_cache = None
+
+    def _ensure_loaded(self):
+        """Create the config directory and load presets once."""
+        if self._loaded:
+            return
+        self._loaded = True
         self._ensure_config_dir()
         self._load_presets()
 
@@ -249,13 +376,14 @@ class FilterManager:
             return
 
         try:
-            with open(self.config_path, 'r') as f:
-                data = json.load(f)
+            raw = self.config_path.read_bytes()
+            data = _loads_presets(raw)
 
             self.presets = {
                 name: FilterPreset.from_dict(preset_data)
                 for name, preset_data in data.items()
             }
+            self._last_saved_hash = hashlib.blake2b(raw).digest()
         except Exception:
             # If loading fails, use defaults
             self._create_default_presets()
@@ -294,30 +422,60 @@ class FilterManager:
                 name: preset.to_dict()
                 for name, preset in self.presets.items()
             }
+            # Serialize here so the worker never reads presets that the GUI
+            # thread may be mutating.
+            payload = _dumps_presets(data)
+        except Exception:
+            return  # Fail silently
+
+        digest = hashlib.blake2b(payload).digest()
+        if digest == self._last_saved_hash:
+            return
+        self._last_saved_hash = digest
 
-            with open(self.config_path, 'w') as f:
-                json.dump(data, f, indent=2)
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="filter-presets"
+            )
+        self._pending_write = self._writer.submit(self._write_presets, payload)
+
+    def _write_presets(self, payload: bytes):
+        """Write serialized presets via a temp file and atomic rename."""
+        try:
+            tmp_path = self.config_path.with_suffix('.tmp')
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self.config_path)
         except Exception:
-            pass  # Fail silently
+            # Fail silently, but let the next save retry the write.
+            self._last_saved_hash = None
+
+    def flush(self):
+        """Block until the most recent preset save has reached disk."""
+        if self._pending_write is not None:
+            self._pending_write.result()
 
     def save_preset(self, preset: FilterPreset):
         """Save a filter preset."""
         self.presets[preset.name] = preset
+        self._names_cache = None
         self._save_presets()
 
     def delete_preset(self, name: str):
         """Delete a filter preset."""
         if name in self.presets:
             del self.presets[name]
+            self._names_cache = None
             self._save_presets()
 
     def get_preset(self, name: str) -> Optional[FilterPreset]:
         """Get a filter preset by name."""
         return self.presets.get(name)
 
-    def list_presets(self) -> List[str]:
+    def list_presets(self) -> Tuple[str, ...]:
         """List all preset names."""
-        return list(self.presets.keys())
+        if self._names_cache is None:
+            self._names_cache = tuple(self.presets)
+        return self._names_cache
 
 
 class FilterPresetsPanel(QFrame):
@@ -339,6 +497,10 @@ class FilterPresetsPanel(QFrame):
 
         self.filter_manager = filter_manager
         self.setObjectName("Panel")
+        # List items by preset key, reused across refreshes.
+        self._item_by_name: Dict[str, QListWidgetItem] = {}
+        # (name, description) each item's text was last rendered from.
+        self._item_source: Dict[str, Tuple[str, str]] = {}
 
         self._build_ui()
 
@@ -350,11 +512,15 @@ class FilterPresetsPanel(QFrame):
         layout.addWidget(Heading("Filter Presets", level=4))
 
         self._context_label = QLabel("")
-        self._context_label.setStyleSheet(f"color: {theme.NEUTRAL_500};")
+        self._context_label.setObjectName("MutedText")
         layout.addWidget(self._context_label)
 
         # Presets list
+        # Every preset row is two lines, so one size hint fits all rows
         self.presets_list = QListWidget()
+        self.presets_list.setUniformItemSizes(True)
+        self.presets_list.setLayoutMode(QListWidget.Batched)
+        self.presets_list.setBatchSize(LIST_BATCH_SIZE)
         self.presets_list.itemDoubleClicked.connect(self._apply_preset)
         self._refresh_presets_list()
         layout.addWidget(self.presets_list)
@@ -383,15 +549,32 @@ class FilterPresetsPanel(QFrame):
 
     def _refresh_presets_list(self):
         """Refresh the presets list."""
-        self.presets_list.clear()
+        presets = self.filter_manager.presets
 
-        for name in self.filter_manager.list_presets():
-            preset = self.filter_manager.get_preset(name)
-            if preset:
+        # Only touch rows whose preset was added, removed or edited.
+        self.presets_list.setUpdatesEnabled(False)
+        try:
+            for name in [n for n in self._item_by_name if n not in presets]:
+                item = self._item_by_name.pop(name)
+                self._item_source.pop(name, None)
+                self.presets_list.takeItem(self.presets_list.row(item))
+
+            for name, preset in presets.items():
+                source = (preset.name, preset.description)
+                if self._item_source.get(name) == source:
+                    continue
                 item_text = f"{preset.name}\n  {preset.description}"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.UserRole, name)
-                self.presets_list.addItem(item)
+                item = self._item_by_name.get(name)
+                if item is None:
+                    item = QListWidgetItem(item_text)
+                    item.setData(Qt.UserRole, name)
+                    self.presets_list.addItem(item)
+                    self._item_by_name[name] = item
+                else:
+                    item.setText(item_text)
+                self._item_source[name] = source
+        finally:
+            self.presets_list.setUpdatesEnabled(True)
 
     def _apply_preset(self, item: QListWidgetItem):
         """Apply selected preset."""
@@ -457,21 +640,20 @@ class ContextDrawerManager:
         card = Card()
         card.add_widget(Heading("Call Details", level=4))
 
-        # Caller info
-        caller_name = call_data.get('caller_name', 'Unknown')
-        callback = call_data.get('callback_number', 'N/A')
-        card.add_widget(QLabel(f"Caller: {caller_name}"))
-        card.add_widget(QLabel(f"Callback: {callback}"))
-
-        # Location
-        location = call_data.get('location', 'Unknown')
-        card.add_widget(QLabel(f"Location: {location}"))
-
-        # Incident details
-        incident_type = call_data.get('incident_type', 'Unknown')
-        severity = call_data.get('severity', 'Unknown')
-        card.add_widget(QLabel(f"Type: {incident_type}"))
-        card.add_widget(QLabel(f"Severity: {severity}"))
+        # Caller, location and incident details share one rich-text label
+        details = (
+            ("Caller", call_data.get('caller_name', 'Unknown')),
+            ("Callback", call_data.get('callback_number', 'N/A')),
+            ("Location", call_data.get('location', 'Unknown')),
+            ("Type", call_data.get('incident_type', 'Unknown')),
+            ("Severity", call_data.get('severity', 'Unknown')),
+        )
+        details_label = QLabel("<br>".join(
+            f"<b>{field}:</b> {html.escape(str(value))}" for field, value in details
+        ))
+        details_label.setTextFormat(Qt.RichText)
+        details_label.setWordWrap(True)
+        card.add_widget(details_label)
 
         # Description
         description = call_data.get('description', '')
@@ -496,17 +678,21 @@ class ContextDrawerManager:
         card = Card()
         card.add_widget(Heading(f"Active Responders ({len(responders)})", level=4))
 
-        for responder in responders[:10]:  # Show first 10
-            unit_id = responder.get('unit_id', '')
-            status = responder.get('status', '')
-            caps = ', '.join(responder.get('capabilities', [])[:3])  # First 3 caps
-
-            responder_label = QLabel(f"• {unit_id} ({status}) - {caps}")
+        # One multi-line label for the first 10 (first 3 caps each), so the
+        # card lays out a single widget instead of one per responder.
+        lines = [
+            f"• {r.get('unit_id', '')} ({r.get('status', '')}) - "
+            f"{', '.join(r.get('capabilities', [])[:3])}"
+            for r in responders[:10]
+        ]
+        if lines:
+            responder_label = QLabel("\n".join(lines))
+            responder_label.setTextFormat(Qt.PlainText)
             card.add_widget(responder_label)
 
         if len(responders) > 10:
             more_label = QLabel(f"... and {len(responders) - 10} more")
-            more_label.setStyleSheet(f"color: {theme.NEUTRAL_500};")
+            more_label.setObjectName("MutedText")
             card.add_widget(more_label)
 
         self.context_drawer.add_content(card)
@@ -521,9 +707,10 @@ class ContextDrawerManager:
         card.add_widget(Heading("System Metrics", level=4))
 
         # Display key metrics
-        for key, value in analytics.items():
-            metric_label = QLabel(f"{key}: {value}")
-            card.add_widget(metric_label)
+        if analytics:
+            metrics_label = QLabel("\n".join(f"{key}: {value}" for key, value in analytics.items()))
+            metrics_label.setTextFormat(Qt.PlainText)
+            card.add_widget(metrics_label)
 
         self.context_drawer.add_content(card)
         self.context_drawer.open_drawer()
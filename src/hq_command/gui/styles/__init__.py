@@ -65,6 +65,8 @@ from .theme import (
     build_palette,
     component_styles,
     focus_ring_stylesheet,
+    prewarm_component_styles,
+    qcolor,
     Theme,
     ThemeVariant,
     DEFAULT_THEME,
@@ -130,6 +132,8 @@ __all__ = [
     "build_palette",
     "component_styles",
     "focus_ring_stylesheet",
+    "prewarm_component_styles",
+    "qcolor",
     "Theme",
     "ThemeVariant",
     "DEFAULT_THEME",
@@ -8,8 +8,12 @@ Based on FieldOps GUI Style Guide (docs/fieldops_gui_style.md) and
 HQ Command GUI Design Blueprint (docs/hq_command_gui_design.md).
 """
 
+import threading
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Any
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from ..qt_compat import QPalette, QColor, QFont
 
 if QFont is None:  # pragma: no cover - executed when Qt bindings missing
@@ -174,6 +178,67 @@ class ThemeVariant(Enum):
     HIGH_CONTRAST = "high_contrast"
 
 
+# Read-only color schemes shared by every Theme of the same variant.
+_COLOR_SCHEMES: Mapping[ThemeVariant, Mapping[str, str]] = {
+    ThemeVariant.LIGHT: MappingProxyType({
+        "background": BACKGROUND_LIGHT,
+        "surface": SURFACE_LIGHT,
+        "surface_elevated": SURFACE_ELEVATED_LIGHT,
+        "text_primary": NEUTRAL_900,
+        "text_secondary": NEUTRAL_700,
+        "text_tertiary": NEUTRAL_500,
+        "border": NEUTRAL_200,
+        "border_strong": NEUTRAL_300,
+        "divider": NEUTRAL_200,
+    }),
+    ThemeVariant.DARK: MappingProxyType({
+        "background": BACKGROUND_DARK,
+        "surface": SURFACE_DARK,
+        "surface_elevated": SURFACE_ELEVATED_DARK,
+        "text_primary": NEUTRAL_100,
+        "text_secondary": NEUTRAL_300,
+        "text_tertiary": NEUTRAL_400,
+        "border": NEUTRAL_700,
+        "border_strong": NEUTRAL_600,
+        "divider": NEUTRAL_700,
+    }),
+    ThemeVariant.HIGH_CONTRAST: MappingProxyType({
+        "background": "#000000",
+        "surface": "#000000",
+        "surface_elevated": "#1A1A1A",
+        "text_primary": "#FFFFFF",
+        "text_secondary": "#FFFFFF",
+        "text_tertiary": "#CCCCCC",
+        "border": "#FFFFFF",
+        "border_strong": "#FFFFFF",
+        "divider": "#FFFFFF",
+    }),
+}
+
+
+@dataclass(frozen=True)
+class ResolvedTheme:
+    """Theme colors used by the component stylesheet, resolved once per variant."""
+    bg: str
+    surface: str
+    surface_elevated: str
+    text_primary: str
+    text_secondary: str
+    border: str
+
+
+_RESOLVED_THEMES: Mapping[ThemeVariant, ResolvedTheme] = {
+    variant: ResolvedTheme(
+        bg=scheme["background"],
+        surface=scheme["surface"],
+        surface_elevated=scheme["surface_elevated"],
+        text_primary=scheme["text_primary"],
+        text_secondary=scheme["text_secondary"],
+        border=scheme["border"],
+    )
+    for variant, scheme in _COLOR_SCHEMES.items()
+}
+
 class Theme:
     """
     Theme configuration container.
@@ -183,56 +248,26 @@ class Theme:
 
     def __init__(self, variant: ThemeVariant = ThemeVariant.LIGHT):
         self.variant = variant
-        self._colors = self._build_color_scheme(variant)
-
-    def _build_color_scheme(self, variant: ThemeVariant) -> Dict[str, str]:
-        """Build color scheme based on theme variant."""
-        if variant == ThemeVariant.LIGHT:
-            return {
-                "background": BACKGROUND_LIGHT,
-                "surface": SURFACE_LIGHT,
-                "surface_elevated": SURFACE_ELEVATED_LIGHT,
-                "text_primary": NEUTRAL_900,
-                "text_secondary": NEUTRAL_700,
-                "text_tertiary": NEUTRAL_500,
-                "border": NEUTRAL_200,
-                "border_strong": NEUTRAL_300,
-                "divider": NEUTRAL_200,
-            }
-        elif variant == ThemeVariant.DARK:
-            return {
-                "background": BACKGROUND_DARK,
-                "surface": SURFACE_DARK,
-                "surface_elevated": SURFACE_ELEVATED_DARK,
-                "text_primary": NEUTRAL_100,
-                "text_secondary": NEUTRAL_300,
-                "text_tertiary": NEUTRAL_400,
-                "border": NEUTRAL_700,
-                "border_strong": NEUTRAL_600,
-                "divider": NEUTRAL_700,
-            }
-        else:  # HIGH_CONTRAST
-            return {
-                "background": "#000000",
-                "surface": "#000000",
-                "surface_elevated": "#1A1A1A",
-                "text_primary": "#FFFFFF",
-                "text_secondary": "#FFFFFF",
-                "text_tertiary": "#CCCCCC",
-                "border": "#FFFFFF",
-                "border_strong": "#FFFFFF",
-                "divider": "#FFFFFF",
-            }
+        self._colors = _COLOR_SCHEMES[variant]
 
     def get_color(self, name: str) -> str:
         """Get a theme-specific color by name."""
         return self._colors.get(name, "#FF00FF")  # Magenta fallback for missing colors
 
+    def get_qcolor(self, name: str) -> QColor:
+        """Get a theme-specific color by name as a shared QColor."""
+        return qcolor(self.get_color(name))
+
     def to_dict(self) -> Dict[str, Any]:
         """Export theme as dictionary."""
+        return self.as_dict
+
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Theme export built on first access and shared afterwards."""
         return {
             "variant": self.variant.value,
-            "colors": self._colors,
+            "colors": dict(self._colors),
             "typography": {
                 "font_family": FONT_FAMILY,
                 "font_sizes": {
@@ -286,6 +321,21 @@ DIVIDER_COLOR = DEFAULT_THEME.get_color("divider")
 # THEME BUILDER FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=256)
+def qcolor(value: str) -> QColor:
+    """
+    Return a cached QColor for a color string.
+
+    Paint code can pass token strings straight through without re-parsing
+    them every frame. The result is shared, so callers must not mutate it.
+    """
+    return QColor(value)
+
+
+# Palettes built so far, one per variant; build_palette hands out copies.
+_PALETTES: Dict[ThemeVariant, QPalette] = {}
+
+
 def build_palette(variant: ThemeVariant = ThemeVariant.LIGHT) -> QPalette:
     """
     Build a QPalette for the specified theme variant.
@@ -299,64 +349,73 @@ def build_palette(variant: ThemeVariant = ThemeVariant.LIGHT) -> QPalette:
     if QPalette is None or QColor is None:
         raise RuntimeError("Qt palette support requires an available Qt binding.")
 
+    palette = _PALETTES.get(variant)
+    if palette is None:
+        palette = _PALETTES[variant] = _create_palette(variant)
+    # QPalette copies are implicitly shared, so this is cheap.
+    return QPalette(palette)
+
+
+def _create_palette(variant: ThemeVariant) -> QPalette:
+    """Populate a new QPalette with the colors for a theme variant."""
     palette = QPalette()
-    theme = Theme(variant)
 
     if variant == ThemeVariant.LIGHT:
         # Light mode palette
-        palette.setColor(QPalette.Window, QColor(SURFACE_LIGHT))
-        palette.setColor(QPalette.WindowText, QColor(NEUTRAL_900))
-        palette.setColor(QPalette.Base, QColor(BACKGROUND_LIGHT))
-        palette.setColor(QPalette.AlternateBase, QColor(SURFACE_LIGHT))
-        palette.setColor(QPalette.Text, QColor(NEUTRAL_900))
-        palette.setColor(QPalette.Button, QColor(SURFACE_ELEVATED_LIGHT))
-        palette.setColor(QPalette.ButtonText, QColor(NEUTRAL_900))
-        palette.setColor(QPalette.BrightText, QColor(PRIMARY_CONTRAST))
-        palette.setColor(QPalette.Link, QColor(PRIMARY))
-        palette.setColor(QPalette.Highlight, QColor(PRIMARY))
-        palette.setColor(QPalette.HighlightedText, QColor(PRIMARY_CONTRAST))
+        palette.setColor(QPalette.Window, qcolor(SURFACE_LIGHT))
+        palette.setColor(QPalette.WindowText, qcolor(NEUTRAL_900))
+        palette.setColor(QPalette.Base, qcolor(BACKGROUND_LIGHT))
+        palette.setColor(QPalette.AlternateBase, qcolor(SURFACE_LIGHT))
+        palette.setColor(QPalette.Text, qcolor(NEUTRAL_900))
+        palette.setColor(QPalette.Button, qcolor(SURFACE_ELEVATED_LIGHT))
+        palette.setColor(QPalette.ButtonText, qcolor(NEUTRAL_900))
+        palette.setColor(QPalette.BrightText, qcolor(PRIMARY_CONTRAST))
+        palette.setColor(QPalette.Link, qcolor(PRIMARY))
+        palette.setColor(QPalette.Highlight, qcolor(PRIMARY))
+        palette.setColor(QPalette.HighlightedText, qcolor(PRIMARY_CONTRAST))
 
         # Disabled state
-        palette.setColor(QPalette.Disabled, QPalette.WindowText, QColor(NEUTRAL_500))
-        palette.setColor(QPalette.Disabled, QPalette.Text, QColor(NEUTRAL_500))
-        palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(NEUTRAL_500))
+        palette.setColor(QPalette.Disabled, QPalette.WindowText, qcolor(NEUTRAL_500))
+        palette.setColor(QPalette.Disabled, QPalette.Text, qcolor(NEUTRAL_500))
+        palette.setColor(QPalette.Disabled, QPalette.ButtonText, qcolor(NEUTRAL_500))
 
     elif variant == ThemeVariant.DARK:
         # Dark mode palette
-        palette.setColor(QPalette.Window, QColor(SURFACE_DARK))
-        palette.setColor(QPalette.WindowText, QColor(NEUTRAL_100))
-        palette.setColor(QPalette.Base, QColor(BACKGROUND_DARK))
-        palette.setColor(QPalette.AlternateBase, QColor(SURFACE_DARK))
-        palette.setColor(QPalette.Text, QColor(NEUTRAL_100))
-        palette.setColor(QPalette.Button, QColor(SURFACE_ELEVATED_DARK))
-        palette.setColor(QPalette.ButtonText, QColor(NEUTRAL_100))
-        palette.setColor(QPalette.BrightText, QColor(PRIMARY_CONTRAST))
-        palette.setColor(QPalette.Link, QColor(PRIMARY_LIGHT))
-        palette.setColor(QPalette.Highlight, QColor(PRIMARY_LIGHT))
-        palette.setColor(QPalette.HighlightedText, QColor(PRIMARY_CONTRAST))
+        palette.setColor(QPalette.Window, qcolor(SURFACE_DARK))
+        palette.setColor(QPalette.WindowText, qcolor(NEUTRAL_100))
+        palette.setColor(QPalette.Base, qcolor(BACKGROUND_DARK))
+        palette.setColor(QPalette.AlternateBase, qcolor(SURFACE_DARK))
+        palette.setColor(QPalette.Text, qcolor(NEUTRAL_100))
+        palette.setColor(QPalette.Button, qcolor(SURFACE_ELEVATED_DARK))
+        palette.setColor(QPalette.ButtonText, qcolor(NEUTRAL_100))
+        palette.setColor(QPalette.BrightText, qcolor(PRIMARY_CONTRAST))
+        palette.setColor(QPalette.Link, qcolor(PRIMARY_LIGHT))
+        palette.setColor(QPalette.Highlight, qcolor(PRIMARY_LIGHT))
+        palette.setColor(QPalette.HighlightedText, qcolor(PRIMARY_CONTRAST))
 
         # Disabled state
-        palette.setColor(QPalette.Disabled, QPalette.WindowText, QColor(NEUTRAL_400))
-        palette.setColor(QPalette.Disabled, QPalette.Text, QColor(NEUTRAL_400))
-        palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(NEUTRAL_400))
+        palette.setColor(QPalette.Disabled, QPalette.WindowText, qcolor(NEUTRAL_400))
+        palette.setColor(QPalette.Disabled, QPalette.Text, qcolor(NEUTRAL_400))
+        palette.setColor(QPalette.Disabled, QPalette.ButtonText, qcolor(NEUTRAL_400))
 
     else:  # HIGH_CONTRAST
         # High contrast palette
-        palette.setColor(QPalette.Window, QColor("#000000"))
-        palette.setColor(QPalette.WindowText, QColor("#FFFFFF"))
-        palette.setColor(QPalette.Base, QColor("#000000"))
-        palette.setColor(QPalette.AlternateBase, QColor("#1A1A1A"))
-        palette.setColor(QPalette.Text, QColor("#FFFFFF"))
-        palette.setColor(QPalette.Button, QColor("#1A1A1A"))
-        palette.setColor(QPalette.ButtonText, QColor("#FFFFFF"))
-        palette.setColor(QPalette.BrightText, QColor("#FFFFFF"))
-        palette.setColor(QPalette.Link, QColor("#00BFFF"))
-        palette.setColor(QPalette.Highlight, QColor("#FFFF00"))
-        palette.setColor(QPalette.HighlightedText, QColor("#000000"))
+        palette.setColor(QPalette.Window, qcolor("#000000"))
+        palette.setColor(QPalette.WindowText, qcolor("#FFFFFF"))
+        palette.setColor(QPalette.Base, qcolor("#000000"))
+        palette.setColor(QPalette.AlternateBase, qcolor("#1A1A1A"))
+        palette.setColor(QPalette.Text, qcolor("#FFFFFF"))
+        palette.setColor(QPalette.Button, qcolor("#1A1A1A"))
+        palette.setColor(QPalette.ButtonText, qcolor("#FFFFFF"))
+        palette.setColor(QPalette.BrightText, qcolor("#FFFFFF"))
+        palette.setColor(QPalette.Link, qcolor("#00BFFF"))
+        palette.setColor(QPalette.Highlight, qcolor("#FFFF00"))
+        palette.setColor(QPalette.HighlightedText, qcolor("#000000"))
 
     return palette
 
 
+@lru_cache(maxsize=1)
 def focus_ring_stylesheet() -> str:
     """
     Generate stylesheet for accessible focus rings.
@@ -372,6 +431,7 @@ def focus_ring_stylesheet() -> str:
     """
 
 
+@lru_cache(maxsize=len(ThemeVariant))
 def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
     """
     Generate comprehensive component stylesheets.
@@ -382,13 +442,7 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
     Returns:
         Complete QSS stylesheet string for all components
     """
-    theme = Theme(variant)
-    bg = theme.get_color("background")
-    surface = theme.get_color("surface")
-    surface_elevated = theme.get_color("surface_elevated")
-    text_primary = theme.get_color("text_primary")
-    text_secondary = theme.get_color("text_secondary")
-    border = theme.get_color("border")
+    colors = _RESOLVED_THEMES[variant]
 
     return f"""
     /* =================================================================
@@ -398,8 +452,8 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
     QWidget {{
         font-family: "{FONT_FAMILY}", Arial, sans-serif;
         font-size: {FONT_SIZE_BODY}pt;
-        color: {text_primary};
-        background-color: {bg};
+        color: {colors.text_primary};
+        background-color: {colors.bg};
     }}
 
     /* =================================================================
@@ -443,14 +497,14 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
        ================================================================= */
 
     QWidget#StatusBar {{
-        background-color: {surface};
+        background-color: {colors.surface};
         min-height: {STATUS_BAR_HEIGHT}px;
         max-height: {STATUS_BAR_HEIGHT}px;
-        border-bottom: 1px solid {border};
+        border-bottom: 1px solid {colors.border};
     }}
 
     QLabel#StatusLabel {{
-        color: {text_primary};
+        color: {colors.text_primary};
         font-size: {FONT_SIZE_BODY}pt;
         padding: 0 {SPACING_MD}px;
     }}
@@ -498,8 +552,8 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
     }}
 
     QPushButton:disabled {{
-        background-color: {border};
-        color: {text_secondary};
+        background-color: {colors.border};
+        color: {colors.text_secondary};
     }}
 
     QPushButton#SecondaryButton {{
@@ -536,9 +590,9 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
        ================================================================= */
 
     QLineEdit, QTextEdit, QPlainTextEdit {{
-        background-color: {surface_elevated};
-        color: {text_primary};
-        border: 1px solid {border};
+        background-color: {colors.surface_elevated};
+        color: {colors.text_primary};
+        border: 1px solid {colors.border};
         border-radius: {BORDER_RADIUS_SM}px;
         padding: {SPACING_SM}px {SPACING_MD}px;
         min-height: {MIN_TOUCH_TARGET}px;
@@ -551,9 +605,9 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
     }}
 
     QLineEdit:disabled, QTextEdit:disabled, QPlainTextEdit:disabled {{
-        background-color: {surface};
-        color: {text_secondary};
-        border-color: {border};
+        background-color: {colors.surface};
+        color: {colors.text_secondary};
+        border-color: {colors.border};
     }}
 
     /* =================================================================
@@ -561,9 +615,9 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
        ================================================================= */
 
     QComboBox {{
-        background-color: {surface_elevated};
-        color: {text_primary};
-        border: 1px solid {border};
+        background-color: {colors.surface_elevated};
+        color: {colors.text_primary};
+        border: 1px solid {colors.border};
         border-radius: {BORDER_RADIUS_SM}px;
         padding: {SPACING_SM}px {SPACING_MD}px;
         min-height: {MIN_TOUCH_TARGET}px;
@@ -585,9 +639,9 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
     }}
 
     QComboBox QAbstractItemView {{
-        background-color: {surface_elevated};
-        color: {text_primary};
-        border: 1px solid {border};
+        background-color: {colors.surface_elevated};
+        color: {colors.text_primary};
+        border: 1px solid {colors.border};
         selection-background-color: {PRIMARY};
         selection-color: {PRIMARY_CONTRAST};
     }}
@@ -597,7 +651,7 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
        ================================================================= */
 
     QCheckBox, QRadioButton {{
-        color: {text_primary};
+        color: {colors.text_primary};
         spacing: {SPACING_SM}px;
         font-size: {FONT_SIZE_BODY}pt;
     }}
@@ -605,8 +659,8 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
     QCheckBox::indicator, QRadioButton::indicator {{
         width: {SPACING_LG}px;
         height: {SPACING_LG}px;
-        border: 2px solid {border};
-        background-color: {surface_elevated};
+        border: 2px solid {colors.border};
+        background-color: {colors.surface_elevated};
     }}
 
     QCheckBox::indicator {{
@@ -631,37 +685,51 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
        ================================================================= */
 
     QLabel {{
-        color: {text_primary};
+        color: {colors.text_primary};
         font-size: {FONT_SIZE_BODY}pt;
     }}
 
     QLabel#H1 {{
         font-size: {FONT_SIZE_H1}pt;
         font-weight: bold;
-        color: {text_primary};
+        color: {colors.text_primary};
     }}
 
     QLabel#H2 {{
         font-size: {FONT_SIZE_H2}pt;
         font-weight: bold;
-        color: {text_primary};
+        color: {colors.text_primary};
     }}
 
     QLabel#H3 {{
         font-size: {FONT_SIZE_H3}pt;
         font-weight: 600;
-        color: {text_primary};
+        color: {colors.text_primary};
     }}
 
     QLabel#H4 {{
         font-size: {FONT_SIZE_H4}pt;
         font-weight: 600;
-        color: {text_primary};
+        color: {colors.text_primary};
     }}
 
     QLabel#Caption {{
         font-size: {FONT_SIZE_SMALL}pt;
-        color: {text_secondary};
+        color: {colors.text_secondary};
+    }}
+
+    QLabel#PanelTitle {{
+        font-size: 14pt;
+        font-weight: bold;
+    }}
+
+    QLabel#MutedText {{
+        color: {NEUTRAL_500};
+    }}
+
+    QLabel#EmptyState {{
+        color: {NEUTRAL_500};
+        padding: 40px;
     }}
 
     /* =================================================================
@@ -702,25 +770,30 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
        ================================================================= */
 
     QFrame#Card {{
-        background-color: {surface_elevated};
-        border: 1px solid {border};
+        background-color: {colors.surface_elevated};
+        border: 1px solid {colors.border};
         border-radius: {BORDER_RADIUS_MD}px;
         padding: {SPACING_MD}px;
     }}
 
     QFrame#Panel {{
-        background-color: {surface};
-        border: 1px solid {border};
+        background-color: {colors.surface};
+        border: 1px solid {colors.border};
         border-radius: {BORDER_RADIUS_SM}px;
     }}
 
+    QToolButton#NotifDismiss {{
+        background: transparent;
+        border: none;
+    }}
+
     /* =================================================================
        CONTEXT DRAWER
        ================================================================= */
 
     QWidget#ContextDrawer {{
-        background-color: {surface_elevated};
-        border-left: 1px solid {border};
+        background-color: {colors.surface_elevated};
+        border-left: 1px solid {colors.border};
         min-width: {CONTEXT_DRAWER_WIDTH}px;
         max-width: {CONTEXT_DRAWER_WIDTH}px;
     }}
@@ -730,19 +803,19 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
        ================================================================= */
 
     QScrollBar:vertical {{
-        background: {surface};
+        background: {colors.surface};
         width: {SCROLLBAR_WIDTH}px;
         border-radius: {BORDER_RADIUS_SM}px;
     }}
 
     QScrollBar::handle:vertical {{
-        background: {border};
+        background: {colors.border};
         min-height: {SPACING_LG}px;
         border-radius: {BORDER_RADIUS_SM}px;
     }}
 
     QScrollBar::handle:vertical:hover {{
-        background: {text_secondary};
+        background: {colors.text_secondary};
     }}
 
     QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
@@ -750,19 +823,19 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
     }}
 
     QScrollBar:horizontal {{
-        background: {surface};
+        background: {colors.surface};
         height: {SCROLLBAR_WIDTH}px;
         border-radius: {BORDER_RADIUS_SM}px;
     }}
 
     QScrollBar::handle:horizontal {{
-        background: {border};
+        background: {colors.border};
         min-width: {SPACING_LG}px;
         border-radius: {BORDER_RADIUS_SM}px;
     }}
 
     QScrollBar::handle:horizontal:hover {{
-        background: {text_secondary};
+        background: {colors.text_secondary};
     }}
 
     QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
@@ -774,20 +847,20 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
        ================================================================= */
 
     QTableView, QListView, QTreeView {{
-        background-color: {surface_elevated};
-        color: {text_primary};
-        border: 1px solid {border};
-        gridline-color: {border};
+        background-color: {colors.surface_elevated};
+        color: {colors.text_primary};
+        border: 1px solid {colors.border};
+        gridline-color: {colors.border};
         selection-background-color: {PRIMARY};
         selection-color: {PRIMARY_CONTRAST};
-        alternate-background-color: {surface};
+        alternate-background-color: {colors.surface};
     }}
 
     QHeaderView::section {{
-        background-color: {surface};
-        color: {text_primary};
+        background-color: {colors.surface};
+        color: {colors.text_primary};
         border: none;
-        border-bottom: 2px solid {border};
+        border-bottom: 2px solid {colors.border};
         padding: {SPACING_SM}px {SPACING_MD}px;
         font-weight: 600;
     }}
@@ -797,14 +870,14 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
        ================================================================= */
 
     QTabWidget::pane {{
-        border: 1px solid {border};
+        border: 1px solid {colors.border};
         border-radius: {BORDER_RADIUS_SM}px;
-        background-color: {surface_elevated};
+        background-color: {colors.surface_elevated};
     }}
 
     QTabBar::tab {{
-        background-color: {surface};
-        color: {text_secondary};
+        background-color: {colors.surface};
+        color: {colors.text_secondary};
         border: none;
         padding: {SPACING_SM}px {SPACING_MD}px;
         min-width: {MIN_TOUCH_TARGET}px;
@@ -828,7 +901,7 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
        ================================================================= */
 
     QDialog {{
-        background-color: {surface_elevated};
+        background-color: {colors.surface_elevated};
         border-radius: {BORDER_RADIUS_LG}px;
     }}
 
@@ -850,8 +923,8 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
        ================================================================= */
 
     QProgressBar {{
-        background-color: {surface};
-        border: 1px solid {border};
+        background-color: {colors.surface};
+        border: 1px solid {colors.border};
         border-radius: {BORDER_RADIUS_SM}px;
         height: {SPACING_SM}px;
         text-align: center;
@@ -867,7 +940,7 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
        ================================================================= */
 
     QSplitter::handle {{
-        background-color: {border};
+        background-color: {colors.border};
     }}
 
     QSplitter::handle:horizontal {{
@@ -882,3 +955,23 @@ def component_styles(variant: ThemeVariant = ThemeVariant.LIGHT) -> str:
         background-color: {PRIMARY};
     }}
     """
+
+
+def prewarm_component_styles() -> threading.Thread:
+    """
+    Build the stylesheet for every theme variant on a background thread.
+
+    Called at startup so a later theme switch finds its stylesheet in the
+    ``component_styles`` cache. Only the string is prepared ahead of time;
+    Qt still parses it on the GUI thread in ``setStyleSheet``.
+
+    Returns:
+        The started daemon thread
+    """
+    thread = threading.Thread(
+        target=lambda: [component_styles(variant) for variant in ThemeVariant],
+        daemon=True,
+        name="ThemeStylesPrewarm",
+    )
+    thread.start()
+    return thread
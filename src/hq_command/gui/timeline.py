@@ -7,17 +7,33 @@ Implements tasks 2-11 to 2-13.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 
 from .qt_compat import (
+    QAbstractListModel,
+    QColor,
+    QFont,
+    QFontMetrics,
+    QListView,
+    QModelIndex,
+    QObject,
+    QPainter,
+    QPen,
+    QRect,
+    QRectF,
+    QSize,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTimer,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QFrame,
     QPushButton,
-    QScrollArea,
     Qt,
     pyqtSignal,
 )
@@ -25,6 +41,71 @@ from .components import Card, Heading, Caption, Badge, BadgeType, Input, Select
 from .styles import theme
 
 
+# Event types are a small closed set, so these caches fill up immediately
+@lru_cache(maxsize=256)
+def _badge_type_for(event_type: str) -> BadgeType:
+    """Determine badge type based on event type."""
+    event_type = event_type.lower()
+    if "escalat" in event_type:
+        return BadgeType.DANGER
+    elif "complet" in event_type:
+        return BadgeType.SUCCESS
+    elif "assign" in event_type:
+        return BadgeType.INFO
+    elif "creat" in event_type:
+        return BadgeType.DEFAULT
+    else:
+        return BadgeType.WARNING
+
+
+@lru_cache(maxsize=256)
+def _format_event_type(event_type: str) -> str:
+    """Format event type for display."""
+    return event_type.replace("_", " ").title()
+
+
+@lru_cache(maxsize=16384)
+def _parse_timestamp(timestamp: str) -> Optional[datetime]:
+    """Parse an ISO timestamp once; None if it is not a valid timestamp."""
+    try:
+        if timestamp.endswith('Z'):
+            timestamp = timestamp[:-1] + '+00:00'
+        return datetime.fromisoformat(timestamp)
+    except (ValueError, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _date_heading(group: str) -> str:
+    """Format a ``YYYY-MM-DD`` day key as a timeline date header."""
+    return datetime.strptime(group, "%Y-%m-%d").strftime("%B %d, %Y")
+
+
+def _format_timestamp(timestamp: str) -> str:
+    """Format timestamp for display."""
+    dt = _parse_timestamp(timestamp)
+    if dt is None:
+        return timestamp
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _insertion_index(events: List[Dict[str, Any]], timestamp: str) -> int:
+    """Return where an event with ``timestamp`` goes in time-ordered ``events``."""
+    # Live events are usually the newest, so check the end first
+    if not events or events[-1].get("timestamp", "") <= timestamp:
+        return len(events)
+
+    # bisect_right on the timestamps (bisect has no key= before Python 3.10)
+    lo, hi = 0, len(events)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if timestamp < events[mid].get("timestamp", ""):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
 class EventCard(Card):
     """
     Card component for displaying a single timeline event.
@@ -74,28 +155,312 @@ class EventCard(Card):
 
     def _get_badge_type(self, event_type: str) -> BadgeType:
         """Determine badge type based on event type."""
-        if "escalat" in event_type.lower():
-            return BadgeType.DANGER
-        elif "complet" in event_type.lower():
-            return BadgeType.SUCCESS
-        elif "assign" in event_type.lower():
-            return BadgeType.INFO
-        elif "creat" in event_type.lower():
-            return BadgeType.DEFAULT
-        else:
-            return BadgeType.WARNING
+        return _badge_type_for(event_type)
 
     def _format_event_type(self, event_type: str) -> str:
         """Format event type for display."""
-        return event_type.replace("_", " ").title()
+        return _format_event_type(event_type)
 
     def _format_timestamp(self, timestamp: str) -> str:
         """Format timestamp for display."""
-        try:
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except (ValueError, AttributeError):
-            return timestamp
+        return _format_timestamp(timestamp)
+
+
+# =============================================================================
+# TIMELINE MODEL / DELEGATE
+# =============================================================================
+
+# Rows laid out per pass by the timeline list view.
+TIMELINE_BATCH_SIZE = 64
+
+# Badge fill and text colors, matching the QLabel#Badge stylesheet rules.
+_BADGE_COLORS: Dict[BadgeType, Tuple[str, str]] = {
+    BadgeType.DEFAULT: (theme.NEUTRAL_200, theme.NEUTRAL_900),
+    BadgeType.SUCCESS: (theme.SUCCESS, "#FFFFFF"),
+    BadgeType.WARNING: (theme.WARNING, theme.ACCENT_CONTRAST),
+    BadgeType.DANGER: (theme.DANGER, "#FFFFFF"),
+    BadgeType.INFO: (theme.INFO, "#FFFFFF"),
+}
+
+
+@dataclass
+class _TimelineRow:
+    """A timeline row: a date header when ``event`` is None, else an event."""
+    header: str = ""
+    group: Optional[str] = None
+    event: Optional[Dict[str, Any]] = None
+    badge_text: str = ""
+    badge_type: BadgeType = BadgeType.DEFAULT
+    time_text: str = ""
+    details: str = ""
+
+
+class TimelineModel(QAbstractListModel):
+    """
+    List model behind TimelineView.
+
+    Rows are date headers interleaved with events, newest first. Display
+    strings are resolved when the rows are built, so painting only reads them.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._rows: List[_TimelineRow] = []
+
+    def rowCount(self, parent: Optional[QModelIndex] = None) -> int:  # type: ignore[override]
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        row = index.row()
+        if row < 0 or row >= len(self._rows):
+            return None
+        entry = self._rows[row]
+        if role == Qt.DisplayRole:
+            return entry.header if entry.event is None else entry.details
+        if role == Qt.UserRole:
+            return entry.event
+        return None
+
+    def row_at(self, row: int) -> _TimelineRow:
+        """Return the row record without converting it through QVariant."""
+        return self._rows[row]
+
+    def set_events(self, events: Iterable[Dict[str, Any]]) -> None:
+        """Replace the rows with ``events`` (newest first), grouped by day."""
+        rows: List[_TimelineRow] = []
+        append = rows.append
+        make_row = self._make_row
+        current_group = None
+        for event in events:
+            entry = make_row(event)
+            group = entry.group
+            if group is not None and group != current_group:
+                current_group = group
+                append(_TimelineRow(header=_date_heading(group), group=group))
+            append(entry)
+
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def insert_event(self, event: Dict[str, Any]) -> None:
+        """
+        Insert a single event at its newest-first position.
+
+        Adds a date header as well when the event starts a new day, so the
+        rows match what ``set_events`` would build.
+        """
+        entry = self._make_row(event)
+        group = entry.group
+        timestamp = event.get("timestamp", "")
+        rows = self._rows
+
+        # First event that is not newer, so the latest arrival among equal
+        # timestamps comes first; new events usually land at the top
+        pos = next(
+            (
+                row for row, existing in enumerate(rows)
+                if existing.event is not None
+                and existing.event.get("timestamp", "") <= timestamp
+            ),
+            len(rows),
+        )
+        # Go above that event's date header unless the event joins its day
+        if pos > 0 and rows[pos - 1].event is None and rows[pos - 1].group != group:
+            pos -= 1
+
+        new_rows = [entry]
+        if group is not None and (pos == 0 or rows[pos - 1].group != group):
+            new_rows.insert(0, _TimelineRow(header=_date_heading(group), group=group))
+
+        self.beginInsertRows(QModelIndex(), pos, pos + len(new_rows) - 1)
+        rows[pos:pos] = new_rows
+        self.endInsertRows()
+
+    @staticmethod
+    def _make_row(event: Dict[str, Any]) -> _TimelineRow:
+        """Build the event row for ``event``; ``group`` is its day, if known."""
+        timestamp = event.get("timestamp", "")
+        dt = _parse_timestamp(timestamp)
+        group = None
+        time_text = timestamp
+        if dt is not None:
+            # One strftime per event; the day key is the caption's date part
+            time_text = dt.strftime("%Y-%m-%d %H:%M:%S")
+            group = time_text[:10]
+
+        event_type = event.get("event_type", "")
+        entry = _TimelineRow(
+            group=group,
+            event=event,
+            badge_text=_format_event_type(event_type),
+            badge_type=_badge_type_for(event_type),
+            time_text=time_text,
+            details=event.get("details", ""),
+        )
+        return entry
+
+
+class TimelineEventDelegate(QStyledItemDelegate):
+    """
+    Paints timeline rows directly with QPainter.
+
+    Events are drawn as cards (badge, timestamp, wrapped details) and date
+    headers as headings, so the view never creates a widget per event.
+    Surface and text colors come from the theme set with ``set_theme``.
+    """
+
+    def __init__(self, model: TimelineModel, view: QListView):
+        super().__init__(view)
+        self._model = model
+        self._view = view
+        self._fonts: Optional[Tuple[QFont, QFont, QFont, QFont]] = None
+        self._metrics: Optional[Tuple[QFontMetrics, QFontMetrics, QFontMetrics]] = None
+        self._header_height = 0
+        self._card_chrome_height = 0
+        self._colors: Tuple[QColor, QColor, QColor, QColor] = self._theme_colors(theme.DEFAULT_THEME)
+
+        # Wrapped details height per text, valid for one viewport width.
+        # Rows are re-measured for every reset and resize, and most of
+        # them keep their text, so the text layout is reused.
+        self._details_heights: Dict[str, int] = {}
+        self._details_width = -1
+
+    @staticmethod
+    def _theme_colors(active: theme.Theme) -> Tuple[QColor, QColor, QColor, QColor]:
+        """Return (text primary, text secondary, border, card surface) colors."""
+        return (
+            active.get_qcolor("text_primary"),
+            active.get_qcolor("text_secondary"),
+            active.get_qcolor("border"),
+            active.get_qcolor("surface_elevated"),
+        )
+
+    def set_theme(self, active: theme.Theme) -> None:
+        """Paint with ``active``'s colors from the next repaint on."""
+        self._colors = self._theme_colors(active)
+
+    def _get_fonts(self, base: QFont) -> Tuple[QFont, QFont, QFont, QFont]:
+        """Return (body, caption, badge, header) fonts, built once."""
+        if self._fonts is None:
+            body = QFont(base)
+            body.setPointSize(theme.FONT_SIZE_BODY)
+            caption = QFont(base)
+            caption.setPointSize(theme.FONT_SIZE_SMALL)
+            badge = QFont(caption)
+            badge.setWeight(QFont.DemiBold)
+            header = QFont(base)
+            header.setPointSize(theme.FONT_SIZE_H5)
+            header.setWeight(QFont.DemiBold)
+            self._fonts = (body, caption, badge, header)
+
+            # (body, caption, badge) metrics and the fixed row heights
+            self._metrics = (QFontMetrics(body), QFontMetrics(caption), QFontMetrics(badge))
+            self._header_height = theme.SPACING_MD + QFontMetrics(header).height() + theme.SPACING_XS
+            self._card_chrome_height = (
+                2 * theme.SPACING_MD
+                + self._metrics[2].height() + 2 * theme.SPACING_XS
+                + theme.SPACING_SM
+                + self._metrics[1].height()
+                + theme.SPACING_SM
+                + theme.SPACING_SM  # gap below the card
+            )
+        return self._fonts
+
+    def _details_height(self, width: int, details: str) -> int:
+        """Return the wrapped height of ``details`` at ``width``."""
+        if width != self._details_width:
+            self._details_heights.clear()
+            self._details_width = width
+        height = self._details_heights.get(details)
+        if height is None:
+            height = self._metrics[0].boundingRect(
+                QRect(0, 0, max(width, 1), 0), int(Qt.TextWordWrap), details
+            ).height()
+            self._details_heights[details] = height
+        return height
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Return the row height for the current viewport width."""
+        entry = self._model.row_at(index.row())
+        self._get_fonts(option.font)
+        width = self._view.viewport().width()
+
+        if entry.event is None:
+            return QSize(width, self._header_height)
+
+        inner_width = width - 2 * theme.SPACING_MD
+        return QSize(width, self._card_chrome_height + self._details_height(inner_width, entry.details))
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        """Paint a date header or an event card."""
+        entry = self._model.row_at(index.row())
+        body, caption, badge, header = self._get_fonts(option.font)
+        _, caption_metrics, badge_metrics = self._metrics
+        text_primary, text_secondary, border, surface = self._colors
+        rect = option.rect
+
+        painter.save()
+        if entry.event is None:
+            painter.setFont(header)
+            painter.setPen(text_secondary)
+            painter.drawText(
+                rect.adjusted(0, theme.SPACING_MD, 0, 0),
+                int(Qt.AlignLeft | Qt.AlignVCenter),
+                entry.header,
+            )
+            painter.restore()
+            return
+
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Card background
+        card = QRectF(rect.adjusted(0, 0, 0, -theme.SPACING_SM)).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(surface)
+        painter.drawRoundedRect(card, theme.BORDER_RADIUS_MD, theme.BORDER_RADIUS_MD)
+
+        inner = rect.adjusted(
+            theme.SPACING_MD, theme.SPACING_MD, -theme.SPACING_MD, -theme.SPACING_MD - theme.SPACING_SM
+        )
+
+        # Event type badge
+        badge_height = badge_metrics.height() + 2 * theme.SPACING_XS
+        badge_rect = QRect(
+            inner.left(),
+            inner.top(),
+            badge_metrics.horizontalAdvance(entry.badge_text) + 2 * theme.SPACING_SM,
+            badge_height,
+        )
+        fill, text_color = _BADGE_COLORS[entry.badge_type]
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(theme.qcolor(fill))
+        painter.drawRoundedRect(QRectF(badge_rect), badge_height / 2, badge_height / 2)
+        painter.setFont(badge)
+        painter.setPen(theme.qcolor(text_color))
+        painter.drawText(badge_rect, int(Qt.AlignCenter), entry.badge_text)
+
+        # Timestamp
+        y = badge_rect.bottom() + 1 + theme.SPACING_SM
+        caption_height = caption_metrics.height()
+        painter.setFont(caption)
+        painter.setPen(text_secondary)
+        painter.drawText(
+            QRect(inner.left(), y, inner.width(), caption_height),
+            int(Qt.AlignLeft | Qt.AlignVCenter),
+            entry.time_text,
+        )
+
+        # Details
+        y += caption_height + theme.SPACING_SM
+        painter.setFont(body)
+        painter.setPen(text_primary)
+        painter.drawText(
+            QRect(inner.left(), y, inner.width(), max(inner.bottom() - y + 1, 0)),
+            int(Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap),
+            entry.details,
+        )
+        painter.restore()
 
 
 class TimelineView(QWidget):
@@ -116,12 +481,29 @@ class TimelineView(QWidget):
     # Signals
     export_requested = pyqtSignal()
 
+    SEARCH_DEBOUNCE_MS = 120
+
+    # Type filter labels that don't map to their snake_case event type
+    _TYPE_MAP: Dict[str, str] = {
+        "Task Created": "task_created",
+        "Task Assigned": "task_assigned",
+        "Task Escalated": "task_escalated",
+        "Task Completed": "task_completed",
+        "Status Change": "status_change",
+    }
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
 
         self._events: List[Dict[str, Any]] = []
         self._filtered_events: List[Dict[str, Any]] = []
 
+        # Filter changes are coalesced into one pass: search edits wait for
+        # typing to pause, dropdown changes run on the next event loop turn
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(self._apply_filters)
+
         self._setup_ui()
         self._connect_signals()
 
@@ -170,19 +552,25 @@ class TimelineView(QWidget):
 
         layout.addLayout(header_layout)
 
-        # Scrollable event container
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(QFrame.NoFrame)
-
-        self._events_container = QWidget()
-        self._events_layout = QVBoxLayout(self._events_container)
-        self._events_layout.setSpacing(theme.SPACING_SM)
-        self._events_layout.addStretch()
-
-        scroll_area.setWidget(self._events_container)
-
-        layout.addWidget(scroll_area)
+        # Event list; rows are painted by the delegate, so only the visible
+        # ones cost anything regardless of how many events are loaded
+        self._model = TimelineModel(self)
+        self._event_list = QListView()
+        self._event_list.setModel(self._model)
+        self._delegate = TimelineEventDelegate(self._model, self._event_list)
+        self._event_list.setItemDelegate(self._delegate)
+        self._event_list.setFrameShape(QFrame.NoFrame)
+        self._event_list.setSelectionMode(QListView.NoSelection)
+        self._event_list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self._event_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # Re-measure wrapped details when the width changes
+        self._event_list.setResizeMode(QListView.Adjust)
+        # Rows have varying heights, so after a reset or resize every row is
+        # measured; do it in batches between events instead of in one block
+        self._event_list.setLayoutMode(QListView.Batched)
+        self._event_list.setBatchSize(TIMELINE_BATCH_SIZE)
+
+        layout.addWidget(self._event_list)
 
     def _connect_signals(self) -> None:
         """Connect UI signals."""
@@ -191,6 +579,11 @@ class TimelineView(QWidget):
         self._search_input.textChanged.connect(self._on_search_changed)
         self._export_button.clicked.connect(self.export_requested.emit)
 
+    def set_theme(self, active: theme.Theme) -> None:
+        """Repaint the event list with ``active``'s colors."""
+        self._delegate.set_theme(active)
+        self._event_list.viewport().update()
+
     def add_event(
         self,
         event_type: str,
@@ -214,8 +607,14 @@ class TimelineView(QWidget):
             "metadata": metadata or {},
         }
 
-        self._events.append(event_data)
-        self._apply_filters()
+        # Both lists are kept in timestamp order
+        self._events.insert(_insertion_index(self._events, timestamp), event_data)
+
+        # Only the new event needs checking; the rows already shown stay put
+        if self._event_matches_current_filters(event_data):
+            filtered = self._filtered_events
+            filtered.insert(_insertion_index(filtered, timestamp), event_data)
+            self._model.insert_event(event_data)
 
     def set_events(self, events: List[Dict[str, Any]]) -> None:
         """
@@ -224,122 +623,105 @@ class TimelineView(QWidget):
         Args:
             events: List of event dictionaries with keys: event_type, timestamp, details, metadata
         """
-        self._events = events
+        # Sorted once here so filtering preserves timestamp order
+        self._events = sorted(events, key=lambda e: e.get("timestamp", ""))
         self._apply_filters()
 
     def _apply_filters(self) -> None:
         """Apply current filters to events and update display."""
-        # Start with all events
-        filtered = self._events.copy()
+        self._filter_timer.stop()
+        self._filtered_events = self._filter_events(self._events)
+        self._update_display()
 
-        # Apply time filter
+    def _event_matches_current_filters(self, event: Dict[str, Any]) -> bool:
+        """Return True if ``event`` passes the current filters."""
+        return bool(self._filter_events([event]))
+
+    def _filter_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the events that pass the time, type and search filters."""
         time_range = self._time_filter.currentText()
-        if time_range != "All Time":
-            filtered = self._filter_by_time(filtered, time_range)
+        in_range = self._time_predicate(time_range) if time_range != "All Time" else None
 
-        # Apply type filter
         event_type = self._type_filter.currentText()
-        if event_type != "All Events":
-            filtered = self._filter_by_type(filtered, event_type)
+        target_type = self._target_type(event_type) if event_type != "All Events" else None
 
-        # Apply search filter
         search_text = self._search_input.text().lower().strip()
-        if search_text:
-            filtered = [
-                e for e in filtered
-                if search_text in e.get("details", "").lower()
-                or search_text in e.get("event_type", "").lower()
-            ]
 
-        self._filtered_events = filtered
-        self._update_display()
+        # One pass over the events, checking the cheapest filters first
+        return [
+            e for e in events
+            if (target_type is None or e.get("event_type", "").lower() == target_type)
+            and (
+                not search_text
+                or search_text in e.get("details", "").lower()
+                or search_text in e.get("event_type", "").lower()
+            )
+            and (in_range is None or in_range(e))
+        ]
 
     def _filter_by_time(self, events: List[Dict[str, Any]], time_range: str) -> List[Dict[str, Any]]:
         """Filter events by time range."""
+        in_range = self._time_predicate(time_range)
+        return [e for e in events if in_range(e)]
+
+    def _time_predicate(self, time_range: str) -> Callable[[Dict[str, Any]], bool]:
+        """Return a predicate testing whether an event falls in ``time_range``."""
         now = datetime.now()
+        parse = _parse_timestamp
+
+        # Work out the time bounds once instead of doing date arithmetic per event
+        end = None
+        if time_range == "Last Hour":
+            start = now - timedelta(hours=1)
+        elif time_range == "Today":
+            start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            end = start + timedelta(days=1)
+        elif time_range == "This Week":
+            # Less than eight whole days old, matching ``(now - dt).days <= 7``
+            start = now - timedelta(days=8)
+        else:
+            return lambda event: parse(event.get("timestamp", "")) is None
 
-        filtered = []
-        for event in events:
-            try:
-                timestamp = event.get("timestamp", "")
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-
-                if time_range == "Last Hour":
-                    if (now - dt).total_seconds() <= 3600:
-                        filtered.append(event)
-                elif time_range == "Today":
-                    if dt.date() == now.date():
-                        filtered.append(event)
-                elif time_range == "This Week":
-                    if (now - dt).days <= 7:
-                        filtered.append(event)
-            except (ValueError, AttributeError):
+        # Timestamps with a UTC offset are compared against aware bounds
+        aware_start = start.astimezone(timezone.utc)
+        aware_end = end.astimezone(timezone.utc) if end is not None else None
+
+        def in_range(event: Dict[str, Any]) -> bool:
+            dt = parse(event.get("timestamp", ""))
+            if dt is None:
                 # Include events with invalid timestamps
-                filtered.append(event)
+                return True
+            if dt.tzinfo is None:
+                return dt >= start and (end is None or dt < end)
+            return dt >= aware_start and (aware_end is None or dt < aware_end)
 
-        return filtered
+        return in_range
 
     def _filter_by_type(self, events: List[Dict[str, Any]], event_type: str) -> List[Dict[str, Any]]:
         """Filter events by type."""
-        type_map = {
-            "Task Created": "task_created",
-            "Task Assigned": "task_assigned",
-            "Task Escalated": "task_escalated",
-            "Task Completed": "task_completed",
-            "Status Change": "status_change",
-        }
-
-        target_type = type_map.get(event_type, event_type.lower().replace(" ", "_"))
-
+        target_type = self._target_type(event_type)
         return [e for e in events if e.get("event_type", "").lower() == target_type]
 
+    def _target_type(self, event_type: str) -> str:
+        """Map a type filter label to the event type it selects."""
+        target_type = self._TYPE_MAP.get(event_type)
+        if target_type is None:
+            target_type = event_type.lower().replace(" ", "_")
+        return target_type
+
     def _update_display(self) -> None:
         """Update the event display with filtered events."""
-        # Clear existing event cards
-        while self._events_layout.count() > 1:  # Keep the stretch
-            item = self._events_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Sort events by timestamp (newest first)
-        sorted_events = sorted(
-            self._filtered_events,
-            key=lambda e: e.get("timestamp", ""),
-            reverse=True,
-        )
-
-        # Group events by day
-        current_group = None
-        for event in sorted_events:
-            # Add date separator if needed
-            timestamp = event.get("timestamp", "")
-            try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                date_str = dt.strftime("%Y-%m-%d")
-
-                if date_str != current_group:
-                    current_group = date_str
-                    separator = Heading(dt.strftime("%B %d, %Y"), level=5)
-                    separator.setStyleSheet(f"color: {theme.TEXT_SECONDARY}; margin-top: {theme.SPACING_MD}px;")
-                    self._events_layout.insertWidget(self._events_layout.count() - 1, separator)
-            except (ValueError, AttributeError):
-                pass
-
-            # Add event card
-            event_card = EventCard(
-                event_type=event.get("event_type", ""),
-                timestamp=timestamp,
-                details=event.get("details", ""),
-            )
-            self._events_layout.insertWidget(self._events_layout.count() - 1, event_card)
+        # Filtered events are already in timestamp order; show newest first
+        self._model.set_events(reversed(self._filtered_events))
 
     def _on_filter_changed(self, _text: str = "") -> None:
         """Handle filter changes."""
-        self._apply_filters()
+        self._filter_timer.start(0)
 
     def _on_search_changed(self, _text: str) -> None:
         """Handle search text changes."""
-        self._apply_filters()
+        if not self._filter_timer.isActive() or self._filter_timer.interval() != 0:
+            self._filter_timer.start(self.SEARCH_DEBOUNCE_MS)
 
     def get_events(self) -> List[Dict[str, Any]]:
         """Get all events (for export)."""
@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from threading import Lock
-from typing import Callable, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, TypeVar
 
 
 T = TypeVar("T")
 
+# Upper bound on page cache shards; must be a power of two.
+MAX_CACHE_SHARDS = 8
+
+# Each shard evicts on its own, so pages that share a small shard would
+# evict each other while the overall budget still has room. Shards are
+# only split off while every one keeps at least this many pages.
+MIN_PAGES_PER_SHARD = 4
+
+# Background threads used to prefetch pages.
+PREFETCH_WORKERS = 2
+
 
 @dataclass(slots=True)
 class VirtualWindow(Generic[T]):
@@ -26,8 +38,28 @@ class VirtualWindow(Generic[T]):
         return iter(self.items)
 
 
+@dataclass(slots=True)
+class _PageShard(Generic[T]):
+    """One independently locked slice of the page cache."""
+
+    capacity: int
+    lock: Lock = field(default_factory=Lock)
+    pages: OrderedDict[int, List[T]] = field(default_factory=OrderedDict)
+    hits: int = 0
+    misses: int = 0
+    # Most recently used page, so repeat hits can skip ``move_to_end``
+    recent: int = -1
+
+
 class VirtualizedSequence(Generic[T]):
-    """Provide indexed access to large datasets without loading everything."""
+    """Provide indexed access to large datasets without loading everything.
+
+    ``fetch_page(page, page_size)`` is called from the reading thread and,
+    once :meth:`prefetch` is used, from background worker threads, possibly
+    for different pages at the same time. It must be thread-safe and must
+    not touch Qt widgets. Call :meth:`close` when the sequence is discarded
+    to stop the prefetch workers.
+    """
 
     def __init__(
         self,
@@ -48,10 +80,27 @@ class VirtualizedSequence(Generic[T]):
         self._total = total_count
         self._page_size = page_size
         self._cache_pages = cache_pages
-        self._cache: OrderedDict[int, List[T]] = OrderedDict()
-        self._lock = Lock()
-        self.page_hits = 0
-        self.page_misses = 0
+
+        # Pages are spread over shards by ``page & mask`` so readers of
+        # different pages (UI thread, prefetch) don't contend on one lock.
+        # The shards split ``cache_pages`` between them, keeping the total;
+        # small budgets stay in a single shard.
+        shard_count = 1
+        while shard_count * 2 <= min(cache_pages // MIN_PAGES_PER_SHARD, MAX_CACHE_SHARDS):
+            shard_count *= 2
+        base, extra = divmod(cache_pages, shard_count)
+        self._shards: List[_PageShard[T]] = [
+            _PageShard(capacity=base + (1 if shard < extra else 0)) for shard in range(shard_count)
+        ]
+        self._shard_mask = shard_count - 1
+
+        # Prefetching runs on a pool created on first use; pages being
+        # fetched are tracked so overlapping requests, and readers of those
+        # pages, wait for the fetch instead of repeating it
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self._prefetch_lock = Lock()
+        self._pending: Dict[int, Future] = {}
+        self._closed = False
 
     def __len__(self) -> int:  # pragma: no cover - trivial
         return self._total
@@ -60,36 +109,72 @@ class VirtualizedSequence(Generic[T]):
     def total(self) -> int:
         return self._total
 
+    @property
+    def page_hits(self) -> int:
+        return sum(shard.hits for shard in self._shards)
+
+    @property
+    def page_misses(self) -> int:
+        return sum(shard.misses for shard in self._shards)
+
     def _load_page(self, page: int) -> List[T]:
         if page < 0:
             raise IndexError("page cannot be negative")
-        with self._lock:
-            if page in self._cache:
-                self._cache.move_to_end(page)
-                self.page_hits += 1
-                return self._cache[page]
+        shard = self._shards[page & self._shard_mask]
 
+        items = self._cached_page(shard, page)
+        if items is not None:
+            return items
+
+        pending = self._pending.get(page)
+        if pending is not None:
+            # Being prefetched: wait for that fetch rather than repeating it
+            try:
+                pending.result()
+            except Exception:  # failed or cancelled; fetch it here instead
+                pass
+            else:
+                items = self._cached_page(shard, page)
+                if items is not None:
+                    return items
+        return self._fetch_into_cache(shard, page)
+
+    @staticmethod
+    def _cached_page(shard: _PageShard[T], page: int) -> Optional[List[T]]:
+        # Hits don't take the lock: the lookup and the recency update are
+        # single OrderedDict calls, which the GIL keeps atomic. The hit
+        # counter may drop an increment under concurrent readers.
+        pages = shard.pages
+        items = pages.get(page)
+        if items is not None:
+            shard.hits += 1
+            if shard.recent != page:
+                shard.recent = page
+                try:
+                    pages.move_to_end(page)
+                except KeyError:  # evicted by another thread since the lookup
+                    pass
+        return items
+
+    def _fetch_into_cache(self, shard: _PageShard[T], page: int) -> List[T]:
         items = list(self._fetch_page(page, self._page_size))
-        with self._lock:
-            self._cache[page] = items
-            self._cache.move_to_end(page)
-            self.page_misses += 1
-            while len(self._cache) > self._cache_pages:
-                self._cache.popitem(last=False)
+        pages = shard.pages
+        with shard.lock:
+            pages[page] = items
+            pages.move_to_end(page)
+            shard.recent = page
+            shard.misses += 1
+            # Trim everything over budget in one pass under the lock
+            for _ in range(len(pages) - shard.capacity):
+                pages.popitem(last=False)
         return items
 
-    def _page_for_index(self, index: int) -> Tuple[int, int]:
+    def __getitem__(self, index: int) -> T:
         if not 0 <= index < self._total:
             raise IndexError("index out of range")
-        page = index // self._page_size
-        offset = index % self._page_size
-        return page, offset
-
-    def __getitem__(self, index: int) -> T:
-        page, offset = self._page_for_index(index)
+        page, offset = divmod(index, self._page_size)
         items = self._load_page(page)
-        if offset >= len(items):
-            raise IndexError("offset outside of loaded page")
+        # A short page raises IndexError from the list itself
         return items[offset]
 
     def window(self, start: int, stop: Optional[int] = None) -> VirtualWindow[T]:
@@ -100,25 +185,94 @@ class VirtualizedSequence(Generic[T]):
         if stop > self._total:
             stop = self._total
 
+        if stop == start:
+            return VirtualWindow(start=start, items=[])
+
+        page_size = self._page_size
+        first_page = start // page_size
+        last_page = (stop - 1) // page_size
+        if first_page == last_page:
+            # Typical viewport request: one slice of one cached page
+            page_start = first_page * page_size
+            items = self._load_page(first_page)
+            return VirtualWindow(start=start, items=items[start - page_start:stop - page_start])
+
+        # One cache lookup per page, copying each page's slice in bulk
         collected: List[T] = []
-        for index in range(start, stop):
-            page, offset = self._page_for_index(index)
+        for page in range(first_page, last_page + 1):
+            page_start = page * page_size
             items = self._load_page(page)
-            if offset < len(items):
-                collected.append(items[offset])
-        return VirtualWindow(start=start, items=tuple(collected))
+            collected.extend(items[max(start - page_start, 0):stop - page_start])
+        return VirtualWindow(start=start, items=collected)
 
-    def prefetch(self, start: int, stop: Optional[int] = None) -> None:
+    def prefetch(self, start: int, stop: Optional[int] = None) -> List[Future]:
+        """
+        Load the pages covering ``[start, stop)`` in the background.
+
+        Returns immediately with the futures of the fetches it started;
+        pages already cached or being fetched are skipped. A shard is given
+        at most as many pages as it holds, so a wide range doesn't evict
+        pages it just fetched.
+        """
         if stop is None:
             stop = start + self._page_size
         if start < 0:
             start = 0
         if stop > self._total:
             stop = self._total
-        for index in range(start, stop, self._page_size):
-            page = index // self._page_size
-            self._load_page(page)
+        if stop <= start:
+            return []
+
+        futures: List[Future] = []
+        scheduled = [0] * len(self._shards)
+        with self._prefetch_lock:
+            if self._closed:
+                return []
+            for page in range(start // self._page_size, (stop - 1) // self._page_size + 1):
+                slot = page & self._shard_mask
+                shard = self._shards[slot]
+                if page in self._pending or page in shard.pages or scheduled[slot] >= shard.capacity:
+                    continue
+                scheduled[slot] += 1
+                if self._prefetch_pool is None:
+                    self._prefetch_pool = ThreadPoolExecutor(
+                        max_workers=PREFETCH_WORKERS, thread_name_prefix="VirtualizedPrefetch"
+                    )
+                future = self._prefetch_pool.submit(self._prefetch_page, page)
+                self._pending[page] = future
+                futures.append(future)
+        return futures
+
+    def _prefetch_page(self, page: int) -> None:
+        try:
+            shard = self._shards[page & self._shard_mask]
+            if page not in shard.pages:
+                self._fetch_into_cache(shard, page)
+        finally:
+            with self._prefetch_lock:
+                self._pending.pop(page, None)
+
+    def close(self) -> None:
+        """Stop prefetching: queued fetches are cancelled and the workers exit.
+
+        Reads keep working afterwards, fetching synchronously.
+        """
+        with self._prefetch_lock:
+            self._closed = True
+            pool, self._prefetch_pool = self._prefetch_pool, None
+        if pool is None:
+            return
+        pool.shutdown(wait=False, cancel_futures=True)
+        with self._prefetch_lock:
+            # Cancelled fetches never reach _prefetch_page's cleanup
+            self._pending = {
+                page: future for page, future in self._pending.items() if not future.cancelled()
+            }
 
     def metrics(self) -> Dict[str, int]:
-        return {"page_hits": self.page_hits, "page_misses": self.page_misses, "cache_size": len(self._cache)}
+        return {
+            "page_hits": self.page_hits,
+            "page_misses": self.page_misses,
+            "cache_size": sum(len(shard.pages) for shard in self._shards),
+        }
 
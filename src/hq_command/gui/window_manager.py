@@ -5,10 +5,30 @@ Provides window state persistence, positioning, and configuration.
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Dict, Optional
 
-from .qt_compat import QWidget, QMainWindow, QScreen, Qt
+from .qt_compat import QMainWindow, QScreen
+
+try:  # Optional C-accelerated JSON for the state file
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps_state(state: Dict[str, Any]) -> bytes:
+    """Serialize window state to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(state)
+    return json.dumps(state, separators=(",", ":")).encode("utf-8")
+
+
+def _loads_state(raw: bytes) -> Dict[str, Any]:
+    """Parse window state JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class WindowManager:
@@ -32,6 +52,10 @@ class WindowManager:
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.state_file = self.config_dir / "window_state.json"
 
+        # This process is the only writer, so the file is read once and the
+        # in-memory copy stays authoritative afterwards
+        self._state_cache: Dict[str, Any] = self._load_state_file()
+
     def save_window_state(self, window: QMainWindow, window_id: str = "main"):
         """
         Save window state to config file.
@@ -51,13 +75,15 @@ class WindowManager:
             "is_fullscreen": window.isFullScreen(),
         }
 
-        # Load existing state
-        all_state = self._load_state_file()
+        all_state = self._state_cache
         all_state[window_id] = state
 
-        # Save to file
-        with open(self.state_file, "w") as f:
-            json.dump(all_state, f, indent=2)
+        # Serialize up front and write in one call; the temp file + replace
+        # keeps a crash mid-write from leaving a truncated state file
+        data = _dumps_state(all_state)
+        tmp_path = self.state_file.with_suffix(".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.state_file)
 
     def restore_window_state(
         self,
@@ -75,8 +101,7 @@ class WindowManager:
             default_width: Default width if no saved state
             default_height: Default height if no saved state
         """
-        all_state = self._load_state_file()
-        state = all_state.get(window_id)
+        state = self._state_cache.get(window_id)
 
         if state:
             # Restore geometry
@@ -100,13 +125,10 @@ class WindowManager:
 
     def _load_state_file(self) -> Dict[str, Any]:
         """Load state from config file."""
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {}
-        return {}
+        try:
+            return _loads_state(self.state_file.read_bytes())
+        except (ValueError, OSError):
+            return {}
 
     def _center_window(self, window: QMainWindow):
         """Center window on primary screen."""
@@ -10,11 +10,17 @@ Provides interactive components for:
 """
 
 from __future__ import annotations
-from typing import Optional, List, Dict, Any, Callable
+from array import array
+from typing import Optional, List, Dict, Any, Callable, Set
 from datetime import datetime, timezone
 from dataclasses import dataclass
 
 from .qt_compat import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QSortFilterProxyModel,
+    QTableView,
     QWidget,
     QDialog,
     QVBoxLayout,
@@ -30,13 +36,13 @@ from .qt_compat import (
     QComboBox,
     QTextEdit,
     QSpinBox,
-    QCheckBox,
     QGroupBox,
     QScrollArea,
     QListWidget,
     QListWidgetItem,
     QTabWidget,
     QDialogButtonBox,
+    QTimer,
     Qt,
     pyqtSignal,
 )
@@ -73,6 +79,150 @@ class UnitRecommendation:
     match_reason: str  # Human-readable explanation
 
 
+@dataclass(slots=True)
+class UnitColumns:
+    """Unit roster stored column-wise for the assignment dialog.
+
+    The model and the validator read one field across many units, so
+    each field lives in its own list or array instead of per-unit dicts.
+    """
+    unit_ids: List[str]
+    caps: List[frozenset]
+    caps_text: List[str]
+    statuses: List[str]
+    current_load: array  # 'I': number of current tasks
+    max_capacity: array  # 'I': max concurrent tasks
+    fatigue: array  # 'd'
+    row_by_id: Dict[str, int]
+
+    @classmethod
+    def from_units(cls, units: List[Dict[str, Any]]) -> "UnitColumns":
+        unit_ids = [unit.get('unit_id', '') for unit in units]
+        return cls(
+            unit_ids=unit_ids,
+            caps=[frozenset(unit.get('capabilities', ())) for unit in units],
+            caps_text=[", ".join(unit.get('capabilities', [])) for unit in units],
+            statuses=[unit.get('status', 'unknown') for unit in units],
+            current_load=array('I', [len(unit.get('current_tasks', [])) for unit in units]),
+            max_capacity=array('I', [unit.get('max_concurrent_tasks', 1) for unit in units]),
+            fatigue=array('d', [unit.get('fatigue', 0.0) for unit in units]),
+            row_by_id={unit_id: row for row, unit_id in enumerate(unit_ids)},
+        )
+
+    def __len__(self) -> int:
+        return len(self.unit_ids)
+
+
+class UnitsTableModel(QAbstractTableModel):
+    """
+    Table model for the units offered in the manual assignment dialog.
+
+    Cells are formatted on request, so the view only pays for visible rows.
+    Column 0 is a checkbox tracking which units are selected.
+    """
+
+    HEADERS = ("Select", "Unit ID", "Capabilities", "Status", "Load", "Fatigue")
+    # Lowercased text matched by the unit filter: unit ID and capabilities
+    FILTER_ROLE = Qt.UserRole + 1
+
+    check_changed = pyqtSignal(str, bool)  # unit_id, checked
+
+    def __init__(self, units: List[Dict[str, Any]], parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.columns = UnitColumns.from_units([])
+        self._filter_keys: List[str] = []
+        self._checked: Set[str] = set()
+        self.load(units)
+
+    def load(self, units: List[Dict[str, Any]]) -> None:
+        """Replace the unit rows in a single model reset.
+
+        Checks are kept for units that are still present; dropped units
+        are reported through ``check_changed`` after the reset.
+        """
+        self.beginResetModel()
+        columns = self.columns = UnitColumns.from_units(units)
+        # Built once so filtering is a plain substring test per row
+        self._filter_keys = [
+            f"{unit_id}\n{caps}".lower()
+            for unit_id, caps in zip(columns.unit_ids, columns.caps_text)
+        ]
+        dropped = self._checked - columns.row_by_id.keys()
+        self._checked -= dropped
+        self.endResetModel()
+        for unit_id in sorted(dropped):
+            self.check_changed.emit(unit_id, False)
+
+    def rowCount(self, parent: Optional[QModelIndex] = None) -> int:  # type: ignore[override]
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.columns)
+
+    def columnCount(self, parent: Optional[QModelIndex] = None) -> int:  # type: ignore[override]
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        columns = self.columns
+        row = index.row()
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 1:
+                return columns.unit_ids[row]
+            if column == 2:
+                return columns.caps_text[row] or "None"
+            if column == 3:
+                return columns.statuses[row]
+            if column == 4:
+                return f"{columns.current_load[row]}/{columns.max_capacity[row]}"
+            if column == 5:
+                return f"{columns.fatigue[row]:.1f}"
+            return None
+        if role == Qt.CheckStateRole and column == 0:
+            return Qt.Checked if columns.unit_ids[row] in self._checked else Qt.Unchecked
+        if role == self.FILTER_ROLE:
+            return self._filter_keys[row]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 0:
+            return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+        unit_id = self.columns.unit_ids[index.row()]
+        checked = Qt.CheckState(value) == Qt.Checked
+        if (unit_id in self._checked) == checked:
+            return True
+        if checked:
+            self._checked.add(unit_id)
+        else:
+            self._checked.discard(unit_id)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self.check_changed.emit(unit_id, checked)
+        return True
+
+    def set_checked(self, unit_id: str, checked: bool = True) -> None:
+        """Check or uncheck the row for ``unit_id``."""
+        row = self.columns.row_by_id.get(unit_id)
+        if row is not None:
+            state = Qt.Checked if checked else Qt.Unchecked
+            self.setData(self.index(row, 0), state, Qt.CheckStateRole)
+
+
 class ManualAssignmentDialog(Modal):
     """
     Manual assignment modal for assigning units to tasks.
@@ -86,6 +236,8 @@ class ManualAssignmentDialog(Modal):
 
     assignment_confirmed = pyqtSignal(str, list)  # task_id, [unit_ids]
 
+    FILTER_DEBOUNCE_MS = 150
+
     def __init__(
         self,
         task_id: str,
@@ -100,7 +252,21 @@ class ManualAssignmentDialog(Modal):
         self.task_data = task_data
         self.available_units = available_units
         self.recommendations = recommendations
-        self.selected_units: List[str] = []
+        # Ordered set of checked unit IDs, kept in the order they were checked
+        self.selected_units: Dict[str, None] = {}
+
+        # Used by _validate_selection on every checkbox toggle; per-unit
+        # lookups go through units_model.columns
+        self._required_caps = frozenset(task_data.get('capabilities_required', ()))
+        # Recommendations are fixed for the dialog's lifetime
+        self._recommendations_audit = [
+            {
+                'unit_id': rec.unit_id,
+                'score': rec.suitability_score,
+                'reason': rec.match_reason,
+            }
+            for rec in recommendations
+        ]
 
         self.setMinimumWidth(800)
         self.setMinimumHeight(600)
@@ -154,18 +320,26 @@ class ManualAssignmentDialog(Modal):
         filter_layout.addWidget(QLabel("Filter:"))
         self.unit_filter = Input(placeholder="Search by unit ID or capability")
         self.unit_filter.textChanged.connect(self._filter_units)
+        # Filter once typing pauses rather than on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_unit_filter)
         filter_layout.addWidget(self.unit_filter)
         all_units_card.add_layout(filter_layout)
 
-        self.units_table = QTableWidget()
-        self.units_table.setColumnCount(6)
-        self.units_table.setHorizontalHeaderLabels([
-            "Select", "Unit ID", "Capabilities", "Status", "Load", "Fatigue"
-        ])
+        # Model/view so only visible rows are formatted; the proxy filters
+        self.units_model = UnitsTableModel(self.available_units, self)
+        self.units_proxy = QSortFilterProxyModel(self)
+        self.units_proxy.setSourceModel(self.units_model)
+        self.units_proxy.setFilterRole(UnitsTableModel.FILTER_ROLE)
+        # Keys are already lowercase; _apply_unit_filter lowercases the text
+        self.units_proxy.setFilterCaseSensitivity(Qt.CaseSensitive)
+
+        self.units_table = QTableView()
+        self.units_table.setModel(self.units_proxy)
         self.units_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.units_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-
-        self._populate_units_table()
         all_units_card.add_widget(self.units_table)
         self.content_layout.addWidget(all_units_card)
 
@@ -190,118 +364,74 @@ class ManualAssignmentDialog(Modal):
         self.button_box.accepted.disconnect()  # Remove default
         self.button_box.accepted.connect(self._confirm_assignment)
         self.recommendations_table.cellDoubleClicked.connect(self._add_recommended_unit)
-        self.units_table.cellChanged.connect(self._on_unit_selection_changed)
+        self.units_model.check_changed.connect(self._on_unit_check_changed)
 
     def _populate_recommendations(self):
         """Populate recommendations table with scoring (3-01)."""
-        self.recommendations_table.setRowCount(len(self.recommendations))
-
-        for row, rec in enumerate(self.recommendations):
-            # Unit ID
-            self.recommendations_table.setItem(row, 0, QTableWidgetItem(rec.unit_id))
-
-            # Score with color coding
-            score_item = QTableWidgetItem(f"{rec.suitability_score:.0f}")
-            if rec.suitability_score >= 80:
-                score_item.setForeground(Qt.green)
-            elif rec.suitability_score >= 60:
-                score_item.setForeground(Qt.yellow)
-            else:
-                score_item.setForeground(Qt.red)
-            self.recommendations_table.setItem(row, 1, score_item)
-
-            # Capabilities
-            caps_str = ", ".join(rec.capabilities) if rec.capabilities else "None"
-            self.recommendations_table.setItem(row, 2, QTableWidgetItem(caps_str))
-
-            # Load
-            load_str = f"{rec.current_load}/{rec.max_capacity}"
-            self.recommendations_table.setItem(row, 3, QTableWidgetItem(load_str))
-
-            # Location
-            location = rec.location or "Unknown"
-            self.recommendations_table.setItem(row, 4, QTableWidgetItem(location))
-
-            # Reason (tooltip shows full explanation)
-            reason_item = QTableWidgetItem(rec.match_reason[:50] + "..." if len(rec.match_reason) > 50 else rec.match_reason)
-            reason_item.setToolTip(rec.match_reason)
-            self.recommendations_table.setItem(row, 5, reason_item)
-
-    def _populate_units_table(self):
-        """Populate all units table."""
-        self.units_table.setRowCount(len(self.available_units))
-
-        for row, unit in enumerate(self.available_units):
-            # Checkbox for selection
-            checkbox = QCheckBox()
-            checkbox.setProperty("unit_id", unit.get('unit_id', ''))
-            checkbox.stateChanged.connect(lambda state, r=row: self._on_checkbox_changed(r, state))
-            checkbox_widget = QWidget()
-            checkbox_layout = QHBoxLayout(checkbox_widget)
-            checkbox_layout.addWidget(checkbox)
-            checkbox_layout.setAlignment(Qt.AlignCenter)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            self.units_table.setCellWidget(row, 0, checkbox_widget)
-
-            # Unit ID
-            self.units_table.setItem(row, 1, QTableWidgetItem(unit.get('unit_id', '')))
-
-            # Capabilities
-            caps = unit.get('capabilities', [])
-            caps_str = ", ".join(caps) if caps else "None"
-            self.units_table.setItem(row, 2, QTableWidgetItem(caps_str))
-
-            # Status
-            status = unit.get('status', 'unknown')
-            self.units_table.setItem(row, 3, QTableWidgetItem(status))
-
-            # Load
-            current_tasks = len(unit.get('current_tasks', []))
-            max_concurrent = unit.get('max_concurrent_tasks', 1)
-            load_str = f"{current_tasks}/{max_concurrent}"
-            self.units_table.setItem(row, 4, QTableWidgetItem(load_str))
-
-            # Fatigue
-            fatigue = unit.get('fatigue', 0.0)
-            self.units_table.setItem(row, 5, QTableWidgetItem(f"{fatigue:.1f}"))
-
-    def _on_checkbox_changed(self, row: int, state: int):
-        """Handle unit selection checkbox change."""
-        checkbox_widget = self.units_table.cellWidget(row, 0)
-        checkbox = checkbox_widget.findChild(QCheckBox)
-        unit_id = checkbox.property("unit_id")
+        table = self.recommendations_table
+        # Fill the table in one go instead of repainting per item
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(self.recommendations))
+            # Bound once; the loop below runs six cells per recommendation
+            set_item = table.setItem
+
+            for row, rec in enumerate(self.recommendations):
+                # Unit ID
+                set_item(row, 0, QTableWidgetItem(rec.unit_id))
+
+                # Score with color coding
+                score = rec.suitability_score
+                score_item = QTableWidgetItem(f"{score:.0f}")
+                if score >= 80:
+                    score_item.setForeground(Qt.green)
+                elif score >= 60:
+                    score_item.setForeground(Qt.yellow)
+                else:
+                    score_item.setForeground(Qt.red)
+                set_item(row, 1, score_item)
+
+                # Capabilities
+                caps_str = ", ".join(rec.capabilities) if rec.capabilities else "None"
+                set_item(row, 2, QTableWidgetItem(caps_str))
+
+                # Load
+                set_item(row, 3, QTableWidgetItem(f"{rec.current_load}/{rec.max_capacity}"))
 
-        if state == Qt.Checked:
-            if unit_id not in self.selected_units:
-                self.selected_units.append(unit_id)
+                # Location
+                set_item(row, 4, QTableWidgetItem(rec.location or "Unknown"))
+
+                # Reason (tooltip shows full explanation)
+                reason = rec.match_reason
+                reason_item = QTableWidgetItem(reason[:50] + "..." if len(reason) > 50 else reason)
+                reason_item.setToolTip(reason)
+                set_item(row, 5, reason_item)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    def _on_unit_check_changed(self, unit_id: str, checked: bool):
+        """Handle unit selection checkbox change."""
+        if checked:
+            self.selected_units[unit_id] = None
         else:
-            if unit_id in self.selected_units:
-                self.selected_units.remove(unit_id)
+            self.selected_units.pop(unit_id, None)
 
         self._validate_selection()
 
     def _add_recommended_unit(self, row: int, column: int):
         """Add recommended unit to selection on double-click."""
         unit_id = self.recommendations_table.item(row, 0).text()
-
-        # Find and check the unit in the main table
-        for r in range(self.units_table.rowCount()):
-            if self.units_table.item(r, 1).text() == unit_id:
-                checkbox_widget = self.units_table.cellWidget(r, 0)
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                checkbox.setChecked(True)
-                break
+        self.units_model.set_checked(unit_id)
 
     def _filter_units(self, text: str):
         """Filter units table based on search text."""
-        text_lower = text.lower()
+        self._filter_timer.start()
 
-        for row in range(self.units_table.rowCount()):
-            unit_id = self.units_table.item(row, 1).text().lower()
-            capabilities = self.units_table.item(row, 2).text().lower()
-
-            matches = text_lower in unit_id or text_lower in capabilities
-            self.units_table.setRowHidden(row, not matches)
+    def _apply_unit_filter(self):
+        """Apply the current filter text to the units table."""
+        self.units_proxy.setFilterFixedString(self.unit_filter.text().lower())
 
     def _validate_selection(self):
         """Validate selected units (3-03: capacity, capabilities, conflicts)."""
@@ -312,7 +442,7 @@ class ManualAssignmentDialog(Modal):
             return
 
         # Get task requirements
-        required_caps = set(self.task_data.get('capabilities_required', []))
+        required_caps = self._required_caps
         min_units = self.task_data.get('min_units', 1)
         max_units = self.task_data.get('max_units', 1)
 
@@ -334,18 +464,19 @@ class ManualAssignmentDialog(Modal):
             return
 
         # Check capability coverage
-        selected_unit_data = [u for u in self.available_units if u.get('unit_id') in self.selected_units]
-        combined_caps = set()
-        over_capacity_units = []
-
-        for unit in selected_unit_data:
-            combined_caps.update(unit.get('capabilities', []))
-
-            # Check capacity
-            current_tasks = len(unit.get('current_tasks', []))
-            max_concurrent = unit.get('max_concurrent_tasks', 1)
-            if current_tasks >= max_concurrent:
-                over_capacity_units.append(unit.get('unit_id', ''))
+        selected = self.selected_units
+        columns = self.units_model.columns
+        selected_rows = [row for unit_id, row in columns.row_by_id.items() if unit_id in selected]
+        unit_caps = columns.caps
+        combined_caps = frozenset().union(*(unit_caps[row] for row in selected_rows))
+
+        # Check capacity
+        current_load = columns.current_load
+        max_capacity = columns.max_capacity
+        unit_ids = columns.unit_ids
+        over_capacity_units = [
+            unit_ids[row] for row in selected_rows if current_load[row] >= max_capacity[row]
+        ]
 
         if over_capacity_units:
             self.validation_label.setText(
@@ -383,24 +514,21 @@ class ManualAssignmentDialog(Modal):
         # - override reason (if provided)
         # - original scheduler recommendations
 
-        self.assignment_confirmed.emit(self.task_id, self.selected_units)
+        self.assignment_confirmed.emit(self.task_id, list(self.selected_units))
         self.accept()
 
     def get_assignment_audit_data(self) -> Dict[str, Any]:
-        """Get audit trail data for this assignment (3-04)."""
+        """Get audit trail data for this assignment (3-04).
+
+        ``scheduler_recommendations`` is shared between calls; copy it
+        before modifying.
+        """
         return {
             'task_id': self.task_id,
-            'assigned_units': self.selected_units,
+            'assigned_units': list(self.selected_units),
             'override_reason': self.reason_input.toPlainText(),
             'timestamp': datetime.now(timezone.utc).isoformat(),
-            'scheduler_recommendations': [
-                {
-                    'unit_id': rec.unit_id,
-                    'score': rec.suitability_score,
-                    'reason': rec.match_reason,
-                }
-                for rec in self.recommendations
-            ],
+            'scheduler_recommendations': self._recommendations_audit,
         }
 
 
@@ -408,6 +536,28 @@ class ManualAssignmentDialog(Modal):
 # TASK CREATION & EDITING (3-05 to 3-06)
 # =============================================================================
 
+def _capabilities_text(capabilities: Any) -> str:
+    """Join a capability list for display; other values are shown as-is."""
+    if isinstance(capabilities, (list, tuple)):
+        return ", ".join(capabilities)
+    return str(capabilities)
+
+
+def _add_list_items(list_widget: QListWidget, texts: List[str], payloads: List[Any]) -> None:
+    """Append rows to ``list_widget`` in one batch, storing each payload in UserRole."""
+    first_row = list_widget.count()
+    list_widget.setUpdatesEnabled(False)
+    list_widget.blockSignals(True)
+    try:
+        list_widget.addItems(texts)
+        item = list_widget.item
+        for row, payload in enumerate(payloads, first_row):
+            item(row).setData(Qt.UserRole, payload)
+    finally:
+        list_widget.blockSignals(False)
+        list_widget.setUpdatesEnabled(True)
+
+
 class TaskCreationDialog(Modal):
     """
     Task creation modal (3-05).
@@ -417,10 +567,22 @@ class TaskCreationDialog(Modal):
 
     task_created = pyqtSignal(dict)  # task_data
 
+    _STYLE_DANGER = f"color: {theme.DANGER};"
+    _STYLE_OK = f"color: {theme.SUCCESS};"
+    # Validation state -> (label text, label style, OK enabled)
+    _VALIDATION_STATES = {
+        "empty": ("⚠ Task ID is required", _STYLE_DANGER, False),
+        "range": ("⚠ Min units cannot exceed max units", _STYLE_DANGER, False),
+        "ok": ("✓ Form valid", _STYLE_OK, True),
+    }
+
     def __init__(self, existing_tasks: Optional[List[Dict[str, Any]]] = None, parent: Optional[QWidget] = None):
         super().__init__("Create Task", parent)
 
         self.existing_tasks = existing_tasks or []
+        # Last state applied by _validate_form, so unchanged keystrokes skip
+        # the setStyleSheet restyle
+        self._last_valid_state: Optional[str] = None
         self.setMinimumWidth(600)
         self._build_ui()
 
@@ -435,16 +597,16 @@ class TaskCreationDialog(Modal):
         select_layout.addWidget(Caption("Select a task created from a call:"))
 
         self.task_list = QListWidget()
-        for task in self.existing_tasks:
-            task_id = task.get("task_id", "Unknown")
-            priority = task.get("priority", 0)
-            capabilities = task.get("capabilities_required", [])
-            if isinstance(capabilities, (list, tuple)):
-                capabilities = ", ".join(capabilities)
-            item_text = f"{task_id} (P{priority}) - [{capabilities}]"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, task)
-            self.task_list.addItem(item)
+        tasks = self.existing_tasks
+        # One column per field, then a single formatting pass
+        task_ids = [task.get("task_id", "Unknown") for task in tasks]
+        priorities = [task.get("priority", 0) for task in tasks]
+        capabilities = [_capabilities_text(task.get("capabilities_required", [])) for task in tasks]
+        texts = [
+            f"{task_id} (P{priority}) - [{caps}]"
+            for task_id, priority, caps in zip(task_ids, priorities, capabilities)
+        ]
+        _add_list_items(self.task_list, texts, tasks)
 
         if not self.existing_tasks:
             self.task_list.addItem("No tasks from calls available")
@@ -526,6 +688,7 @@ class TaskCreationDialog(Modal):
         self.content_layout.addWidget(self.tabs)
 
         # Connect validation
+        self._ok_button = self.button_box.button(QDialogButtonBox.StandardButton.Ok)
         self.task_id_input.textChanged.connect(self._validate_form)
         self.tabs.currentChanged.connect(self._validate_form)
         self.button_box.accepted.disconnect()
@@ -556,27 +719,25 @@ class TaskCreationDialog(Modal):
         # Only validate if on the "From Scratch" tab (index 1)
         if self.tabs.currentIndex() == 0:
             # "From Call" tab - always enable OK button
-            self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(True)
+            self._last_valid_state = "call"
+            self._ok_button.setEnabled(True)
             return
 
         # Validate "From Scratch" tab
-        task_id = self.task_id_input.text().strip()
-
-        if not task_id:
-            self.validation_label.setText("⚠ Task ID is required")
-            self.validation_label.setStyleSheet(f"color: {theme.DANGER};")
-            self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
-            return
+        if not self.task_id_input.text().strip():
+            state = "empty"
+        elif self.min_units_spin.value() > self.max_units_spin.value():
+            state = "range"
+        else:
+            state = "ok"
 
-        if self.min_units_spin.value() > self.max_units_spin.value():
-            self.validation_label.setText("⚠ Min units cannot exceed max units")
-            self.validation_label.setStyleSheet(f"color: {theme.DANGER};")
-            self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
+        if state == self._last_valid_state:
             return
-
-        self.validation_label.setText("✓ Form valid")
-        self.validation_label.setStyleSheet(f"color: {theme.SUCCESS};")
-        self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(True)
+        self._last_valid_state = state
+        text, style, valid = self._VALIDATION_STATES[state]
+        self.validation_label.setText(text)
+        self.validation_label.setStyleSheet(style)
+        self._ok_button.setEnabled(valid)
 
     def _create_task(self):
         """Create task and emit signal."""
@@ -952,15 +1113,11 @@ class ResponderCreationDialog(Modal):
         select_layout.addWidget(Caption("Select an existing responder to add to the roster:"))
 
         self.responder_list = QListWidget()
-        for responder in self.existing_responders:
-            unit_id = responder.get("unit_id", "Unknown")
-            capabilities = responder.get("capabilities", [])
-            if isinstance(capabilities, (list, tuple)):
-                capabilities = ", ".join(capabilities)
-            item_text = f"{unit_id} - [{capabilities}]"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, responder)
-            self.responder_list.addItem(item)
+        responders = self.existing_responders
+        unit_ids = [responder.get("unit_id", "Unknown") for responder in responders]
+        capabilities = [_capabilities_text(responder.get("capabilities", [])) for responder in responders]
+        texts = [f"{unit_id} - [{caps}]" for unit_id, caps in zip(unit_ids, capabilities)]
+        _add_list_items(self.responder_list, texts, responders)
 
         if not self.existing_responders:
             self.responder_list.addItem("No existing responders available")
@@ -1315,6 +1472,7 @@ class CallCorrelationDialog(Modal):
         self.calls_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
 
         self._populate_calls_table()
+        self.calls_table.itemChanged.connect(self._on_call_item_changed)
         self.content_layout.addWidget(self.calls_table)
 
         # Correlation reason
@@ -1332,33 +1490,31 @@ class CallCorrelationDialog(Modal):
 
     def _populate_calls_table(self):
         """Populate similar calls table."""
-        self.calls_table.setRowCount(len(self.similar_calls))
+        table = self.calls_table
+        table.setRowCount(len(self.similar_calls))
 
         for row, call in enumerate(self.similar_calls):
-            # Checkbox
-            checkbox = QCheckBox()
-            checkbox.setProperty("call_id", call.get('call_id', ''))
-            checkbox.stateChanged.connect(lambda state, r=row: self._on_call_selected(r, state))
-            checkbox_widget = QWidget()
-            checkbox_layout = QHBoxLayout(checkbox_widget)
-            checkbox_layout.addWidget(checkbox)
-            checkbox_layout.setAlignment(Qt.AlignCenter)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            self.calls_table.setCellWidget(row, 0, checkbox_widget)
+            # Checkable item for selection; one itemChanged connection
+            # serves every row
+            select_item = QTableWidgetItem()
+            select_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+            select_item.setCheckState(Qt.Unchecked)
+            select_item.setData(Qt.UserRole, call.get('call_id', ''))
+            table.setItem(row, 0, select_item)
 
             # Call data
-            self.calls_table.setItem(row, 1, QTableWidgetItem(call.get('call_id', '')))
-            self.calls_table.setItem(row, 2, QTableWidgetItem(call.get('location', '')))
-            self.calls_table.setItem(row, 3, QTableWidgetItem(call.get('incident_type', '')))
-            self.calls_table.setItem(row, 4, QTableWidgetItem(call.get('timestamp', '')))
+            table.setItem(row, 1, QTableWidgetItem(call.get('call_id', '')))
+            table.setItem(row, 2, QTableWidgetItem(call.get('location', '')))
+            table.setItem(row, 3, QTableWidgetItem(call.get('incident_type', '')))
+            table.setItem(row, 4, QTableWidgetItem(call.get('timestamp', '')))
 
-    def _on_call_selected(self, row: int, state: int):
+    def _on_call_item_changed(self, item: QTableWidgetItem):
         """Handle call selection."""
-        checkbox_widget = self.calls_table.cellWidget(row, 0)
-        checkbox = checkbox_widget.findChild(QCheckBox)
-        call_id = checkbox.property("call_id")
+        if item.column() != 0:
+            return
+        call_id = item.data(Qt.UserRole)
 
-        if state == Qt.Checked:
+        if item.checkState() == Qt.Checked:
             if call_id not in self.selected_calls:
                 self.selected_calls.append(call_id)
         else:
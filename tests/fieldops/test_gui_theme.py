@@ -60,3 +60,16 @@ def test_build_palette_requires_pyside6() -> None:
 
     with pytest.raises(RuntimeError):
         build_palette()
+
+
+def test_build_palette_reuses_parsed_colors() -> None:
+    pytest.importorskip("PySide6.QtGui")
+    from fieldops.gui.styles.theme import COLOR_TOKENS, _qcolor, build_palette
+    from PySide6.QtGui import QPalette
+
+    _qcolor.cache_clear()
+    palette = build_palette()
+
+    assert _qcolor.cache_info().misses == 7  # 13 roles share 7 colors
+    assert palette.color(QPalette.Text).name().upper() == COLOR_TOKENS["neutral_900"].hex.upper()
+    assert palette.color(QPalette.ToolTipText) == palette.color(QPalette.ButtonText)
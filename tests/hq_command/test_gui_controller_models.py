@@ -7,6 +7,8 @@ import pytest
 pytest.importorskip("PySide6.QtWidgets")
 
 from hq_command.gui import HQCommandController
+from hq_command.gui.controller import BaseListModel
+from hq_command.gui.qt_compat import Qt
 
 
 def test_controller_transforms_inputs() -> None:
@@ -141,3 +143,27 @@ def test_operator_roles_are_exposed() -> None:
 
     assert controller.operator_roles() == ("tasking_officer", "audit_lead")
     assert controller.operator_active_role() == "audit_lead"
+
+
+def test_base_list_model_data_roles_and_bounds() -> None:
+    model = BaseListModel()
+    model.set_items(["alpha", "bravo"])
+
+    assert model.rowCount() == 2
+    assert model.data(model.index(1, 0)) == "bravo"
+    assert model.data(model.index(0, 0), Qt.EditRole) == "alpha"
+    assert model.data(model.index(0, 0), int(Qt.UserRole)) == "alpha"
+    assert model.data(model.index(0, 0), Qt.ToolTipRole) is None
+    assert model.data(model.index(5, 0)) is None
+
+
+def test_base_list_model_items_copies_only_when_requested() -> None:
+    model = BaseListModel()
+    model.set_items(["alpha", "bravo"])
+
+    view = model.items(copy=False)
+    snapshot = model.items()
+
+    assert view is model.items(copy=False)
+    assert snapshot == view
+    assert snapshot is not view
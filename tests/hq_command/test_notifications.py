@@ -0,0 +1,258 @@
+"""Tests for the HQ Command notification panel and manager."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+pytest.importorskip("pytestqt")
+
+from hq_command.gui.components import Badge
+from hq_command.gui.notifications import (
+    NotificationBadge,
+    NotificationManager,
+    NotificationPanel,
+    clear_badge_cache,
+)
+from hq_command.gui.qt_compat import Qt, QToolButton
+
+
+@pytest.fixture()
+def panel(qtbot) -> NotificationPanel:
+    widget = NotificationPanel()
+    qtbot.addWidget(widget)
+    return widget
+
+
+def test_unread_count_tracks_add_remove_and_mark_read(panel: NotificationPanel) -> None:
+    manager = NotificationManager(panel)
+    emitted: list[int] = []
+    panel.unread_count_changed.connect(emitted.append)
+
+    manager.add_info_notification("One", "first")
+    manager.add_info_notification("Two", "second")
+    manager.add_warning_notification("Three", "third")
+    assert panel.get_unread_count() == 3
+
+    first_id = panel.notifications[-1].notification_id
+    panel.mark_read(first_id)
+    assert panel.get_unread_count() == 2
+
+    # Removing an already-read notification leaves the count untouched.
+    panel.remove_notification(first_id)
+    assert panel.get_unread_count() == 2
+
+    panel.remove_notification(panel.notifications[0].notification_id)
+    assert panel.get_unread_count() == 1
+
+    panel._mark_all_read()
+    assert panel.get_unread_count() == 0
+    assert emitted == [1, 2, 3, 2, 1, 0]
+
+
+def test_badge_click_and_item_dismiss_emit_signals(qtbot, panel: NotificationPanel) -> None:
+    badge = NotificationBadge()
+    qtbot.addWidget(badge)
+    with qtbot.waitSignal(badge.clicked, timeout=1000):
+        qtbot.mouseClick(badge, Qt.LeftButton)
+
+    NotificationManager(panel).add_info_notification("Title", "body")
+    notification_id = panel.notifications[0].notification_id
+    item = panel.notification_items[notification_id]
+    dismiss_btn = item.findChild(QToolButton, "NotifDismiss")
+    with qtbot.waitSignal(panel.notification_dismissed, timeout=1000) as blocker:
+        dismiss_btn.click()
+    assert blocker.args == [notification_id]
+    assert notification_id not in panel.notification_items
+
+
+def test_signal_payload_ids_work_with_mark_read_and_remove(qtbot, panel: NotificationPanel) -> None:
+    manager = NotificationManager(panel)
+    manager.add_system_notification("First", "body", action_callback=lambda: None)
+    manager.add_info_notification("Second", "body")
+    first, second = panel.notifications[1], panel.notifications[0]
+
+    with qtbot.waitSignal(panel.notification_action, timeout=1000) as blocker:
+        panel._on_notification_action(first.notification_id)
+    (payload,) = blocker.args
+    assert payload == first.notification_id
+    assert isinstance(payload, int)
+
+    panel.mark_read(payload)
+    assert first.read
+    assert panel.get_unread_count() == 1
+
+    panel.remove_notification(second.notification_id)
+    assert list(panel.notifications) == [first]
+    assert panel.get_unread_count() == 0
+
+
+def test_refresh_timestamp_only_updates_label_when_bucket_changes(panel: NotificationPanel) -> None:
+    NotificationManager(panel).add_info_notification("Title", "body")
+    notification = panel.notifications[0]
+    item = panel.notification_items[notification.notification_id]
+    assert item.timestamp_label.text() == "Just now"
+
+    start = notification.timestamp
+    item.refresh_timestamp(start + timedelta(minutes=5))
+    assert item.timestamp_label.text() == "5m ago"
+
+    item.timestamp_label.setText("sentinel")
+    item.refresh_timestamp(start + timedelta(minutes=5, seconds=30))
+    assert item.timestamp_label.text() == "sentinel"
+
+    item.refresh_timestamp(start + timedelta(hours=3))
+    assert item.timestamp_label.text() == "3h ago"
+    item.refresh_timestamp(start + timedelta(days=2))
+    assert item.timestamp_label.text() == "2d ago"
+
+
+def test_type_badge_pixmap_is_reused_after_first_show(qtbot, panel: NotificationPanel) -> None:
+    clear_badge_cache()
+    manager = NotificationManager(panel)
+    panel.show()
+    qtbot.waitExposed(panel)
+
+    manager.add_info_notification("First", "body")
+    first = panel.notification_items[panel.notifications[0].notification_id]
+    assert isinstance(first.type_badge, Badge)
+    qtbot.waitUntil(first.isVisible)
+
+    manager.add_info_notification("Second", "body")
+    second = panel.notification_items[panel.notifications[0].notification_id]
+    assert not isinstance(second.type_badge, Badge)
+    assert not second.type_badge.pixmap().isNull()
+
+    clear_badge_cache()
+    manager.add_info_notification("Third", "body")
+    third = panel.notification_items[panel.notifications[0].notification_id]
+    assert isinstance(third.type_badge, Badge)
+
+
+def test_read_item_switches_to_snapshot_and_back(qtbot, panel: NotificationPanel) -> None:
+    panel.show()
+    qtbot.waitExposed(panel)
+    NotificationManager(panel).add_info_notification("Title", "body")
+    notification = panel.notifications[0]
+    item = panel.notification_items[notification.notification_id]
+    qtbot.waitUntil(item.isVisible)
+    assert not item.is_snapshot()
+
+    panel.mark_read(notification.notification_id)
+    qtbot.waitUntil(item.is_snapshot)
+    assert not item._snapshot_label.pixmap().isNull()
+
+    # A timestamp tick invalidates the snapshot, which is then re-taken.
+    item.refresh_timestamp(notification.timestamp + timedelta(minutes=2))
+    assert not item.is_snapshot()
+    assert item.timestamp_label.text() == "2m ago"
+    qtbot.waitUntil(item.is_snapshot)
+
+
+def test_snapshot_is_retaken_after_resize_and_style_change(qtbot, panel: NotificationPanel) -> None:
+    panel.resize(320, 400)
+    panel.show()
+    qtbot.waitExposed(panel)
+    NotificationManager(panel).add_info_notification("Title", "body")
+    notification = panel.notifications[0]
+    item = panel.notification_items[notification.notification_id]
+    panel.mark_read(notification.notification_id)
+    qtbot.waitUntil(item.is_snapshot)
+    old_width = item._snapshot_label.pixmap().width()
+
+    panel.resize(520, 400)
+    qtbot.waitUntil(lambda: item.is_snapshot() and item._snapshot_label.pixmap().width() > old_width)
+    assert item._snapshot_label.pixmap().width() == item._live.width()
+
+    item.setStyleSheet("font-size: 20pt;")
+    assert not item.is_snapshot()
+    qtbot.waitUntil(item.is_snapshot)
+
+
+def test_snapshot_mode_ignores_hidden_ancestors(qtbot, panel: NotificationPanel) -> None:
+    panel.show()
+    qtbot.waitExposed(panel)
+    NotificationManager(panel).add_info_notification("Title", "body")
+    notification = panel.notifications[0]
+    item = panel.notification_items[notification.notification_id]
+    panel.mark_read(notification.notification_id)
+    qtbot.waitUntil(item.is_snapshot)
+
+    panel.hide()
+    assert item.is_snapshot()
+
+    # Live again (label kept) while the panel is still hidden
+    item.refresh_timestamp(notification.timestamp + timedelta(minutes=2))
+    assert item._snapshot_label is not None
+    assert not item.is_snapshot()
+
+
+def test_manager_batch_shares_timestamp_and_defers_panel_inserts(panel: NotificationPanel) -> None:
+    manager = NotificationManager(panel)
+    emitted: list[int] = []
+    panel.unread_count_changed.connect(emitted.append)
+
+    with manager.batch():
+        manager.add_assignment_notification("task-1", ["alpha"])
+        manager.add_assignment_notification("task-2", ["bravo"])
+        manager.add_info_notification("Info", "body")
+        assert not panel.notifications
+
+    assert len(panel.notifications) == 3
+    assert len({n.timestamp for n in panel.notifications}) == 1
+    assert emitted == [3]
+
+
+def test_timestamp_timer_runs_only_while_panel_is_shown(qtbot, panel: NotificationPanel) -> None:
+    assert not panel._refresh_timer.isActive()
+
+    panel.show()
+    qtbot.waitExposed(panel)
+    assert panel._refresh_timer.isActive()
+
+    panel.hide()
+    assert not panel._refresh_timer.isActive()
+
+
+def test_clear_all_empties_panel_and_resets_unread(panel: NotificationPanel) -> None:
+    manager = NotificationManager(panel)
+    for index in range(3):
+        manager.add_info_notification(f"Info {index}", "body")
+    assert [n.title for n in panel.notifications] == ["Info 2", "Info 1", "Info 0"]
+
+    panel._clear_all()
+    assert not panel.notifications
+    assert not panel.notification_items
+    assert panel.get_unread_count() == 0
+    assert not panel.empty_label.isHidden()
+
+
+def test_action_button_is_built_on_first_show(qtbot, panel: NotificationPanel) -> None:
+    calls: list[str] = []
+    NotificationManager(panel).add_system_notification(
+        "Title", "body", action_callback=lambda: calls.append("run"), action_label="Open"
+    )
+    notification = panel.notifications[0]
+    item = panel.notification_items[notification.notification_id]
+    assert item.action_btn is None
+
+    panel.show()
+    qtbot.waitUntil(item.isVisible)
+    assert item.action_btn is not None
+    assert item.action_btn.text() == "Open"
+
+    with qtbot.waitSignal(panel.notification_action, timeout=1000):
+        item.action_btn.click()
+    assert calls == ["run"]
+
+
+def test_badge_bell_uses_cached_emoji_pixmap(qtbot) -> None:
+    first = NotificationBadge()
+    second = NotificationBadge()
+    qtbot.addWidget(first)
+    qtbot.addWidget(second)
+
+    assert not first.icon_label.pixmap().isNull()
+    assert first.icon_label.pixmap().cacheKey() == second.icon_label.pixmap().cacheKey()
@@ -1,3 +1,4 @@
+import threading
 import time
 from typing import Dict, Iterable
 
@@ -38,6 +39,185 @@ def test_virtualized_sequence_paginates_and_caches() -> None:
     assert metrics["cache_size"] <= 2
 
 
+def test_virtualized_sequence_shards_keep_the_page_budget() -> None:
+    fetched: list[int] = []
+
+    def fetch_page(page: int, size: int) -> Iterable[int]:
+        fetched.append(page)
+        return range(page * size, (page + 1) * size)
+
+    sequence = VirtualizedSequence(fetch_page, total_count=10_000, page_size=10, cache_pages=18)
+    assert [shard.capacity for shard in sequence._shards] == [5, 5, 4, 4]
+
+    for page in range(40):
+        assert sequence[page * 10] == page * 10
+    assert sequence.metrics() == {"page_hits": 0, "page_misses": 40, "cache_size": 18}
+
+    # The most recent page of every shard is still cached
+    _ = sequence[390], sequence[380], sequence[370], sequence[360]
+    assert sequence.metrics()["page_hits"] == 4
+    assert len(fetched) == 40
+
+
+def test_virtualized_sequence_hits_keep_lru_order_without_locking() -> None:
+    sequence = VirtualizedSequence(lambda page, size: [page] * size, total_count=100, page_size=10, cache_pages=8)
+    shard = sequence._shards[0]  # even pages, room for four
+    assert shard.capacity == 4
+
+    _ = sequence[0], sequence[20]
+    with shard.lock:
+        # A held lock must not block reads of cached pages
+        assert sequence[0] == 0
+        assert sequence[5] == 0
+    assert list(shard.pages) == [2, 0]
+
+    _ = sequence[40], sequence[60], sequence[80]
+    assert list(shard.pages) == [0, 4, 6, 8]
+    assert sequence.metrics()["page_hits"] == 2
+
+
+@pytest.mark.parametrize("cache_pages", [6, 8])
+def test_virtualized_sequence_keeps_two_hot_pages_from_one_shard(cache_pages: int) -> None:
+    sequence = VirtualizedSequence(
+        lambda page, size: range(page * size, (page + 1) * size),
+        total_count=1000,
+        page_size=10,
+        cache_pages=cache_pages,
+    )
+    # Pages 2 and 6 share a shard whenever the cache is split
+    assert 2 & sequence._shard_mask == 6 & sequence._shard_mask
+
+    for _ in range(5):
+        assert sequence[25] == 25
+        assert sequence[65] == 65
+    assert sequence.metrics() == {"page_hits": 8, "page_misses": 2, "cache_size": 2}
+
+
+def test_virtualized_window_loads_each_page_once() -> None:
+    def fetch_page(page: int, size: int) -> Iterable[int]:
+        # The last page comes back short
+        return range(page * size, min((page + 1) * size, 245))
+
+    sequence = VirtualizedSequence(fetch_page, total_count=250, page_size=100)
+
+    window = sequence.window(90, 210)
+    assert window.items == list(range(90, 210))
+    assert sequence.metrics()["page_hits"] + sequence.metrics()["page_misses"] == 3
+
+    assert sequence.window(240).items == list(range(240, 245))
+    assert sequence.window(50, 50).items == []
+
+
+def test_virtualized_getitem_rejects_indexes_outside_the_data() -> None:
+    def fetch_page(page: int, size: int) -> Iterable[int]:
+        # Fewer rows than total_count reported
+        return range(page * size, min((page + 1) * size, 45))
+
+    sequence = VirtualizedSequence(fetch_page, total_count=50, page_size=20)
+
+    assert sequence[44] == 44
+    for index in (-1, 50, 47):
+        with pytest.raises(IndexError):
+            sequence[index]
+
+
+def test_virtualized_window_within_one_page_does_a_single_lookup() -> None:
+    def fetch_page(page: int, size: int) -> Iterable[int]:
+        return range(page * size, (page + 1) * size)
+
+    sequence = VirtualizedSequence(fetch_page, total_count=300, page_size=100)
+
+    assert sequence.window(120, 120).items == []
+    assert sequence.page_hits + sequence.page_misses == 0
+
+    assert sequence.window(120, 180).items == list(range(120, 180))
+    assert sequence.window(100, 200).items == list(range(100, 200))
+    assert (sequence.page_hits, sequence.page_misses) == (1, 1)
+
+
+def test_virtualized_prefetch_runs_in_background_and_skips_pending_pages() -> None:
+    release = threading.Event()
+    fetched: list[int] = []
+
+    def fetch_page(page: int, size: int) -> Iterable[int]:
+        release.wait(timeout=5)
+        fetched.append(page)
+        return range(page * size, (page + 1) * size)
+
+    sequence = VirtualizedSequence(fetch_page, total_count=1000, page_size=100)
+
+    first = sequence.prefetch(150, 210)
+    assert len(first) == 2  # pages 1 and 2, returned before either loads
+    assert sequence.prefetch(100, 300) == []
+
+    release.set()
+    for future in first:
+        future.result(timeout=5)
+    assert sorted(fetched) == [1, 2]
+    assert sequence.prefetch(100, 300) == []
+    assert sequence[250] == 250
+    assert sorted(fetched) == [1, 2]
+
+
+def test_virtualized_read_waits_for_a_pending_prefetch() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    fetched: list[int] = []
+
+    def fetch_page(page: int, size: int) -> Iterable[int]:
+        fetched.append(page)
+        started.set()
+        release.wait(timeout=5)
+        return range(page * size, (page + 1) * size)
+
+    sequence = VirtualizedSequence(fetch_page, total_count=1000, page_size=100)
+    (future,) = sequence.prefetch(300, 310)
+    assert started.wait(timeout=5)
+
+    threading.Timer(0.05, release.set).start()
+    assert sequence[305] == 305
+    assert future.done()
+    assert fetched == [3]
+    assert (sequence.page_hits, sequence.page_misses) == (1, 1)
+    sequence.close()
+
+
+def test_virtualized_close_cancels_queued_prefetches() -> None:
+    release = threading.Event()
+
+    def fetch_page(page: int, size: int) -> Iterable[int]:
+        release.wait(timeout=5)
+        return range(page * size, (page + 1) * size)
+
+    sequence = VirtualizedSequence(fetch_page, total_count=1000, page_size=100, cache_pages=8)
+    futures = sequence.prefetch(0, 600)
+    assert len(futures) == 6
+    sequence.close()
+    release.set()
+
+    assert sum(future.cancelled() for future in futures) >= 6 - 2  # two were running
+    assert all(not future.cancelled() for future in sequence._pending.values())
+    assert sequence.prefetch(0, 1000) == []
+    assert sequence[550] == 550
+
+
+def test_virtualized_prefetch_stops_at_each_shard_capacity() -> None:
+    def fetch_page(page: int, size: int) -> Iterable[int]:
+        return range(page * size, (page + 1) * size)
+
+    # Two shards holding 5 (even pages) and 4 (odd pages)
+    sequence = VirtualizedSequence(fetch_page, total_count=2000, page_size=100, cache_pages=9)
+    futures = sequence.prefetch(0, 2000)
+    for future in futures:
+        future.result(timeout=5)
+
+    assert len(futures) == 9
+    assert sorted(sequence._shards[0].pages) == [0, 2, 4, 6, 8]
+    assert sorted(sequence._shards[1].pages) == [1, 3, 5, 7]
+    assert sequence.window(0, 400).items == list(range(400))
+    assert sequence.page_misses == 9
+
+
 @pytest.mark.skipif(not HAS_QT, reason="PySide6 not available")
 def test_data_table_virtualized_source_round_trips_qmodelindex() -> None:
     rows = [{"id": idx, "value": idx} for idx in range(300)]
@@ -58,6 +238,31 @@ def test_data_table_virtualized_source_round_trips_qmodelindex() -> None:
         model.sort(0, SortOrder.ASCENDING)
 
 
+@pytest.mark.skipif(not HAS_QT, reason="PySide6 not available")
+def test_data_table_closes_virtualized_sources_it_drops() -> None:
+    shiboken6 = pytest.importorskip("shiboken6")
+
+    def fetch_page(page: int, size: int) -> Iterable[Dict[str, int]]:
+        return [{"id": idx} for idx in range(page * size, (page + 1) * size)]
+
+    model = DataTableModel(["id"])
+    first = VirtualizedSequence(fetch_page, total_count=100, page_size=10)
+    second = VirtualizedSequence(fetch_page, total_count=100, page_size=10)
+    model.set_virtualized_source(first)
+    model.prefetch_rows(0, 20)
+    model.set_virtualized_source(second)
+    assert first._closed and first._prefetch_pool is None
+    assert not second._closed
+
+    model.set_data([])
+    assert second._closed
+
+    third = VirtualizedSequence(fetch_page, total_count=100, page_size=10)
+    model.set_virtualized_source(third)
+    shiboken6.delete(model)
+    assert third._closed
+
+
 def test_stale_while_revalidate_cache_refreshes() -> None:
     cache = StaleWhileRevalidateCache[str, int](ttl_seconds=0.01, max_age_seconds=0.05)
     calls = 0
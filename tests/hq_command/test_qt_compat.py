@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
 
 pytest.importorskip("PySide6.QtWidgets")
 
+from hq_command.gui import qt_compat
 from hq_command.gui.qt_compat import QPolygonF, QPointF, qt_exec
 
 
@@ -58,3 +62,52 @@ def test_polygon_classes_available() -> None:
     polygon = QPolygonF([QPointF(0, 0), QPointF(1, 1)])
 
     assert isinstance(polygon, QPolygonF)
+
+
+def test_lazy_exports_resolve_on_first_access_and_are_cached() -> None:
+    renderer_cls = qt_compat.QSvgRenderer
+
+    assert renderer_cls.__name__ == "QSvgRenderer"
+    assert vars(qt_compat)["QSvgRenderer"] is renderer_cls
+    with pytest.raises(AttributeError):
+        getattr(qt_compat, "QDoesNotExist")
+
+
+def test_all_exports_resolve_to_pyside6_objects() -> None:
+    # Bound at import, so module attribute access never reaches __getattr__
+    assert {"Qt", "QColor", "QWidget", "pyqtSignal"} <= set(vars(qt_compat))
+    for name in qt_compat.__all__:
+        assert getattr(qt_compat, name) is not None
+
+    assert qt_compat.pyqtSignal is qt_compat.QtCore.Signal
+    assert qt_compat.QWidget is qt_compat.QtWidgets.QWidget
+
+
+def test_all_lists_every_imported_qt_name() -> None:
+    # __all__ is written out by hand, so guard it against the import list;
+    # lazy QtSvg names stay out of it to keep star imports cheap
+    imported = {
+        name
+        for name, value in vars(qt_compat).items()
+        if not name.startswith("_") and name not in qt_compat._LAZY_ATTRS
+        and getattr(value, "__module__", getattr(value, "__name__", "")).startswith("PySide6")
+    }
+    assert imported <= set(qt_compat.__all__)
+
+
+def test_qt_exec_caches_resolved_method_per_class() -> None:
+    qt_exec(_ExecUnderscoreRecorder())
+
+    assert qt_compat._EXEC_METHODS[_ExecUnderscoreRecorder] == "exec_"
+
+
+def test_qt_exec_runs_instance_level_exec_without_caching_the_class() -> None:
+    assert qt_exec(SimpleNamespace(exec=lambda: "ran")) == "ran"
+    assert SimpleNamespace not in qt_compat._EXEC_METHODS
+
+    mock = MagicMock()
+    qt_exec(mock, 5)
+    mock.exec.assert_called_once_with(5)
+
+    assert qt_exec(SimpleNamespace()) is None
+    assert qt_exec(SimpleNamespace(exec_=lambda: "late")) == "late"
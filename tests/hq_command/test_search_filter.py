@@ -0,0 +1,244 @@
+"""Tests for the HQ Command search and filter widgets."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+pytest.importorskip("pytestqt")
+
+from hq_command.gui.qt_compat import QLabel, Qt
+from hq_command.gui.search_filter import (
+    ContextDrawerManager,
+    FilterManager,
+    FilterPreset,
+    FilterPresetsPanel,
+    GlobalSearchBar,
+    SearchResultsPanel,
+    _format_result_text,
+)
+
+
+@pytest.fixture()
+def results_panel(qtbot) -> SearchResultsPanel:
+    widget = SearchResultsPanel()
+    qtbot.addWidget(widget)
+    return widget
+
+
+def test_result_lines_are_formatted_per_type_and_cached(results_panel: SearchResultsPanel) -> None:
+    _format_result_text.cache_clear()
+    results = [
+        {"type": "task", "id": "T-1", "priority": 2, "location": "Depot"},
+        {"type": "responder", "id": "U-7", "status": "available", "capabilities": ["medic", "rescue"]},
+        {"type": "call", "id": "C-3", "incident_type": "fire"},
+        {"type": "asset", "id": "A-9"},
+    ]
+
+    assert [results_panel._format_result(r, "t") for r in results] == [
+        "[Task] T-1 (P2) - Depot",
+        "[Responder] U-7 (available) - medic, rescue",
+        "[Call] C-3 - fire",
+        "[asset] A-9",
+    ]
+
+    results_panel._format_result(results[0], "another query")
+    assert _format_result_text.cache_info().hits == 1
+
+
+def test_results_model_serves_formatted_rows_and_emits_selected_result(
+    qtbot, results_panel: SearchResultsPanel
+) -> None:
+    result = {"type": "call", "id": "C-3", "incident_type": "fire"}
+    results_panel.set_results("fire", [result])
+
+    model = results_panel.results_model
+    index = model.index(0, 0)
+    assert model.rowCount() == 1
+    assert index.data(Qt.DisplayRole) == "[Call] C-3 - fire"
+    assert index.data(Qt.UserRole) == result
+    assert results_panel.empty_label.isHidden()
+
+    with qtbot.waitSignal(results_panel.result_selected, timeout=1000) as blocker:
+        results_panel.results_list.clicked.emit(index)
+    assert blocker.args == ["call", result]
+
+    results_panel.set_results("none", [])
+    assert model.rowCount() == 0
+    assert not results_panel.empty_label.isHidden()
+
+
+def test_search_history_dedupes_and_keeps_last_ten(qtbot) -> None:
+    bar = GlobalSearchBar()
+    qtbot.addWidget(bar)
+
+    for index in range(12):
+        bar.search_input.setText(f"q{index}")
+        bar._perform_search()
+    bar.search_input.setText("q11")
+    bar._perform_search()
+
+    assert bar.search_history == [f"q{index}" for index in range(11, 1, -1)]
+    assert bar._history_set == set(bar.search_history)
+
+
+def test_rapid_searches_are_coalesced_into_one_request(qtbot) -> None:
+    bar = GlobalSearchBar()
+    qtbot.addWidget(bar)
+    emitted: list[tuple[str, str]] = []
+    bar.search_requested.connect(lambda query, scope: emitted.append((query, scope)))
+
+    for query in ("al", "alp", "alpha"):
+        bar.search_input.setText(query)
+        bar._perform_search()
+    assert emitted == []
+
+    qtbot.waitUntil(lambda: emitted == [("alpha", "all")], timeout=1000)
+
+
+def test_filter_manager_persists_presets_in_background(tmp_path) -> None:
+    config_path = tmp_path / "presets.json"
+    manager = FilterManager(config_path)
+    manager.save_preset(FilterPreset("Night Shift", {"status": "available"}, "After 22:00"))
+    manager.delete_preset("escalated")
+    manager.flush()
+
+    reloaded = FilterManager(config_path)
+    assert "Night Shift" in reloaded.list_presets()
+    assert "escalated" not in reloaded.list_presets()
+    assert not config_path.with_suffix(".tmp").exists()
+
+
+def test_filter_preset_to_dict_is_cached_until_a_field_changes() -> None:
+    preset = FilterPreset("High", {"priority_max": 2})
+    first = preset.to_dict()
+    assert preset.to_dict() is first
+
+    preset.description = "Top priorities"
+    assert preset.to_dict() is not first
+    assert preset.to_dict()["description"] == "Top priorities"
+
+
+def test_filter_manager_skips_writes_when_presets_are_unchanged(tmp_path) -> None:
+    config_path = tmp_path / "presets.json"
+    manager = FilterManager(config_path)
+    manager.list_presets()
+    manager.flush()
+    written = manager._pending_write
+    assert written is not None
+
+    manager._save_presets()
+    assert manager._pending_write is written
+
+    manager.delete_preset("escalated")
+    assert manager._pending_write is not written
+    manager.flush()
+
+
+def test_filter_manager_defers_disk_access_until_presets_are_used(tmp_path) -> None:
+    config_path = tmp_path / "hq" / "presets.json"
+    manager = FilterManager(config_path)
+    assert not config_path.parent.exists()
+
+    assert "high_priority" in manager.list_presets()
+    manager.flush()
+    assert config_path.exists()
+
+
+def test_presets_panel_refresh_reuses_unchanged_items(qtbot, tmp_path) -> None:
+    manager = FilterManager(tmp_path / "presets.json")
+    panel = FilterPresetsPanel(manager)
+    qtbot.addWidget(panel)
+    kept = panel._item_by_name["high_priority"]
+
+    manager.delete_preset("escalated")
+    manager.save_preset(FilterPreset("Night Shift", {"status": "available"}, "After 22:00"))
+    panel.refresh()
+    manager.flush()
+
+    texts = [panel.presets_list.item(row).text() for row in range(panel.presets_list.count())]
+    assert panel._item_by_name["high_priority"] is kept
+    assert "escalated" not in panel._item_by_name
+    assert texts[-1] == "Night Shift\n  After 22:00"
+    assert len(texts) == len(manager.list_presets())
+
+
+class _DrawerRecorder:
+    def __init__(self) -> None:
+        self.content: list = []
+
+    def clear_content(self) -> None:
+        self.content.clear()
+
+    def set_title(self, title: str) -> None:
+        self.title = title
+
+    def add_content(self, widget) -> None:
+        self.content.append(widget)
+
+    def open_drawer(self) -> None:
+        pass
+
+
+def test_responder_roster_renders_rows_in_one_label(qtbot) -> None:
+    drawer = _DrawerRecorder()
+    responders = [
+        {"unit_id": f"U-{index}", "status": "available", "capabilities": ["a", "b", "c", "d"]}
+        for index in range(12)
+    ]
+
+    ContextDrawerManager(drawer).show_responder_roster(responders)
+
+    (card,) = drawer.content
+    qtbot.addWidget(card)
+    texts = [label.text() for label in card.findChildren(QLabel)]
+    roster = next(text for text in texts if text.startswith("• U-0"))
+    assert roster.splitlines() == [f"• U-{index} (available) - a, b, c" for index in range(10)]
+    assert "... and 2 more" in texts
+
+
+def test_presets_panel_rerenders_only_edited_presets(qtbot, tmp_path) -> None:
+    manager = FilterManager(tmp_path / "presets.json")
+    panel = FilterPresetsPanel(manager)
+    qtbot.addWidget(panel)
+
+    untouched = panel._item_by_name["escalated"]
+    untouched.setText("sentinel")
+    edited = manager.get_preset("high_priority")
+    edited.description = "P1 only"
+    panel.refresh()
+    manager.flush()
+
+    assert untouched.text() == "sentinel"
+    assert panel._item_by_name["high_priority"].text() == "High Priority Tasks\n  P1 only"
+
+
+def test_call_transcript_details_share_one_escaped_label(qtbot) -> None:
+    drawer = _DrawerRecorder()
+    ContextDrawerManager(drawer).show_call_transcript(
+        {"call_id": "C-1", "caller_name": "<Ann>", "location": "Pier 4", "timestamp": "09:00"}
+    )
+
+    (card,) = drawer.content
+    qtbot.addWidget(card)
+    details = next(label for label in card.findChildren(QLabel) if "Caller" in label.text())
+    assert "<b>Caller:</b> &lt;Ann&gt;" in details.text()
+    assert "<b>Location:</b> Pier 4" in details.text()
+    assert "<b>Severity:</b> Unknown" in details.text()
+
+
+def test_search_scope_is_taken_from_selector_index(qtbot) -> None:
+    bar = GlobalSearchBar()
+    qtbot.addWidget(bar)
+    assert [bar.scope_select.itemText(i) for i in range(bar.scope_select.count())] == [
+        "All",
+        "Tasks",
+        "Responders",
+        "Calls",
+    ]
+
+    bar.scope_select.setCurrentIndex(2)
+    bar.search_input.setText("medic")
+    with qtbot.waitSignal(bar.search_requested, timeout=1000) as blocker:
+        bar._perform_search()
+    assert blocker.args == ["medic", "responders"]
@@ -0,0 +1,90 @@
+"""Tests for the HQ Command theme tokens and builders."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PySide6.QtGui")
+pytest.importorskip("pytestqt")
+
+from hq_command.gui.qt_compat import QColor, QPalette
+from hq_command.gui.styles.theme import (
+    SURFACE_DARK,
+    Theme,
+    ThemeVariant,
+    build_palette,
+    component_styles,
+    prewarm_component_styles,
+    qcolor,
+)
+
+
+def test_themes_of_a_variant_share_one_read_only_color_scheme() -> None:
+    first = Theme(ThemeVariant.DARK)
+    second = Theme(ThemeVariant.DARK)
+
+    assert first._colors is second._colors
+    with pytest.raises(TypeError):
+        first._colors["background"] = "#123456"  # type: ignore[index]
+    assert Theme(ThemeVariant.HIGH_CONTRAST).get_color("text_primary") == "#FFFFFF"
+    assert first.get_color("missing") == "#FF00FF"
+    assert isinstance(first.to_dict()["colors"], dict)
+
+
+def test_qcolor_is_cached_per_color_string() -> None:
+    light = Theme(ThemeVariant.LIGHT)
+
+    color = light.get_qcolor("text_primary")
+    assert color.name().upper() == light.get_color("text_primary").upper()
+    assert qcolor(light.get_color("text_primary")) is color
+
+
+def test_qcolor_maps_are_shared_between_theme_instances() -> None:
+    first = Theme(ThemeVariant.DARK)
+    second = Theme(ThemeVariant.DARK)
+
+    assert first.get_qcolor("surface") is second.get_qcolor("surface")
+    assert first.get_qcolor("missing").name().upper() == "#FF00FF"
+
+
+def test_to_dict_is_built_once_per_theme() -> None:
+    theme = Theme(ThemeVariant.LIGHT)
+
+    exported = theme.to_dict()
+    assert exported["variant"] == "light"
+    assert theme.to_dict() is exported
+
+
+def test_component_styles_are_cached_per_variant() -> None:
+    component_styles.cache_clear()
+    light = component_styles(ThemeVariant.LIGHT)
+
+    assert component_styles(ThemeVariant.LIGHT) is light
+    assert component_styles(ThemeVariant.DARK) != light
+
+    component_styles.cache_clear()
+    rebuilt = component_styles(ThemeVariant.LIGHT)
+    assert rebuilt == light
+    assert rebuilt is not light
+
+
+def test_build_palette_reuses_prebuilt_palette_but_returns_copies(qapp) -> None:
+    first = build_palette(ThemeVariant.DARK)
+    first.setColor(QPalette.Window, QColor("#123456"))
+
+    second = build_palette(ThemeVariant.DARK)
+    assert second.color(QPalette.Window).name().upper() == SURFACE_DARK.upper()
+    assert second is not build_palette(ThemeVariant.DARK)
+
+
+def test_prewarm_builds_every_variant_stylesheet_in_the_background() -> None:
+    component_styles.cache_clear()
+
+    thread = prewarm_component_styles()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert component_styles.cache_info().currsize == len(ThemeVariant)
+    misses = component_styles.cache_info().misses
+    component_styles(ThemeVariant.DARK)
+    assert component_styles.cache_info().misses == misses
@@ -0,0 +1,266 @@
+"""Tests for the HQ Command timeline view."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+pytest.importorskip("pytestqt")
+
+from hq_command.gui.components import BadgeType
+from hq_command.gui.qt_compat import QColor, QListView, QPainter, QPixmap, QRect, QStyleOptionViewItem, Qt
+from hq_command.gui.styles import theme
+from hq_command.gui.timeline import TIMELINE_BATCH_SIZE, TimelineView, _badge_type_for, _format_event_type, _parse_timestamp
+
+
+def _event(event_type: str, timestamp: str, details: str = "") -> dict:
+    return {"event_type": event_type, "timestamp": timestamp, "details": details}
+
+
+@pytest.fixture()
+def timeline(qtbot) -> TimelineView:
+    view = TimelineView()
+    qtbot.addWidget(view)
+    return view
+
+
+def test_model_groups_events_under_date_headers_newest_first(timeline: TimelineView) -> None:
+    timeline._time_filter.setCurrentText("All Time")
+    timeline.set_events([
+        _event("task_created", "2024-05-01T08:00:00", "Created T-1"),
+        _event("escalation", "2024-05-02T09:30:00Z", "Escalated T-1"),
+        _event("task_assigned", "2024-05-02T10:00:00", "Assigned U-7"),
+    ])
+
+    model = timeline._model
+    rows = [model.row_at(row) for row in range(model.rowCount())]
+    assert [row.header for row in rows if row.event is None] == ["May 02, 2024", "May 01, 2024"]
+    assert [row.details for row in rows if row.event is not None] == [
+        "Assigned U-7",
+        "Escalated T-1",
+        "Created T-1",
+    ]
+    escalation = rows[2]
+    assert escalation.badge_text == "Escalation"
+    assert escalation.badge_type is BadgeType.DANGER
+    assert escalation.time_text == "2024-05-02 09:30:00"
+
+
+def test_type_filter_updates_model_rows(qtbot, timeline: TimelineView) -> None:
+    timeline._time_filter.setCurrentText("All Time")
+    timeline.set_events([
+        _event("task_created", "2024-05-01T08:00:00"),
+        _event("task_escalated", "2024-05-01T09:00:00"),
+    ])
+    timeline._type_filter.setCurrentText("Task Escalated")
+
+    qtbot.waitUntil(lambda: len(timeline.get_filtered_events()) == 1, timeout=1000)
+    assert [event["event_type"] for event in timeline.get_filtered_events()] == ["task_escalated"]
+    assert timeline._model.rowCount() == 2
+    assert len(timeline.get_events()) == 2
+
+
+def test_add_event_inserts_rows_without_resetting_the_model(qtbot, timeline: TimelineView) -> None:
+    timeline._time_filter.setCurrentText("All Time")
+    timeline.set_events([
+        _event("task_created", "2024-05-03T10:00:00", "a"),
+        _event("task_created", "2024-05-01T10:00:00", "b"),
+    ])
+    resets: list[bool] = []
+    timeline._model.modelReset.connect(lambda: resets.append(True))
+
+    timeline.add_event("task_assigned", "2024-05-03T12:00:00", "newest")
+    timeline.add_event("task_assigned", "2024-05-02T08:00:00", "new day")
+    timeline.add_event("task_assigned", "2024-05-03T09:00:00", "same day")
+
+    incremental = [timeline._model.row_at(row) for row in range(timeline._model.rowCount())]
+    assert resets == []
+
+    timeline._apply_filters()
+    rebuilt = [timeline._model.row_at(row) for row in range(timeline._model.rowCount())]
+    assert [(row.header, row.details) for row in incremental] == [
+        (row.header, row.details) for row in rebuilt
+    ]
+    assert [row.details for row in rebuilt if row.event is not None] == [
+        "newest", "a", "same day", "new day", "b",
+    ]
+
+
+def test_add_event_skips_events_hidden_by_filters(timeline: TimelineView) -> None:
+    timeline._time_filter.setCurrentText("All Time")
+    timeline._type_filter.setCurrentText("Task Escalated")
+
+    timeline.add_event("task_created", "2024-05-01T08:00:00", "hidden")
+    timeline.add_event("task_escalated", "2024-05-01T09:00:00", "shown")
+
+    assert [event["details"] for event in timeline.get_filtered_events()] == ["shown"]
+    assert timeline._model.rowCount() == 2
+    assert len(timeline.get_events()) == 2
+
+
+def test_timestamps_are_parsed_once_across_filter_passes(qtbot, timeline: TimelineView) -> None:
+    _parse_timestamp.cache_clear()
+    timeline._time_filter.setCurrentText("This Week")
+    timeline.set_events([
+        _event("task_created", "2024-05-01T08:00:00"),
+        _event("task_created", "not a timestamp"),
+    ])
+    timeline._time_filter.setCurrentText("Today")
+    qtbot.waitUntil(lambda: len(timeline.get_filtered_events()) == 1, timeout=1000)
+
+    info = _parse_timestamp.cache_info()
+    assert info.misses == 2
+    assert info.hits > 0
+    assert [event["timestamp"] for event in timeline.get_filtered_events()] == ["not a timestamp"]
+    assert set(timeline.get_events()[0]) == {"event_type", "timestamp", "details"}
+
+
+def test_time_filter_uses_window_bounds_for_naive_and_utc_timestamps(timeline: TimelineView) -> None:
+    now = datetime.now()
+    utc_now = datetime.now(timezone.utc)
+    events = [
+        _event("task_created", (now - timedelta(minutes=5)).isoformat(), "recent"),
+        _event("task_created", (now - timedelta(hours=2)).isoformat(), "earlier"),
+        _event("task_created", (utc_now - timedelta(minutes=5)).isoformat().replace("+00:00", "Z"), "recent utc"),
+        _event("task_created", (now - timedelta(days=10)).isoformat(), "old"),
+        _event("task_created", "unknown", "no timestamp"),
+    ]
+
+    def details(time_range: str) -> list:
+        return [event["details"] for event in timeline._filter_by_time(events, time_range)]
+
+    assert details("Last Hour") == ["recent", "recent utc", "no timestamp"]
+    assert details("This Week") == ["recent", "earlier", "recent utc", "no timestamp"]
+
+
+def test_search_typing_is_coalesced_into_one_filter_pass(qtbot, timeline: TimelineView) -> None:
+    timeline._time_filter.setCurrentText("All Time")
+    timeline.set_events([
+        _event("task_created", "2024-05-01T08:00:00", "Bridge closed"),
+        _event("task_escalated", "2024-05-01T09:00:00", "Flooding"),
+    ])
+    passes: list[bool] = []
+    timeline._model.modelReset.connect(lambda: passes.append(True))
+
+    for text in ("f", "fl", "flo", "flood"):
+        timeline._search_input.setText(text)
+    assert passes == []
+
+    qtbot.waitUntil(lambda: passes == [True], timeout=1000)
+    assert [event["details"] for event in timeline.get_filtered_events()] == ["Flooding"]
+
+
+def test_event_type_badges_and_labels_are_cached() -> None:
+    _badge_type_for.cache_clear()
+    _format_event_type.cache_clear()
+
+    for _ in range(3):
+        assert _badge_type_for("TASK_ESCALATED") is BadgeType.DANGER
+        assert _badge_type_for("status_change") is BadgeType.WARNING
+        assert _format_event_type("task_completed") == "Task Completed"
+
+    assert _badge_type_for.cache_info().misses == 2
+    assert _format_event_type.cache_info().misses == 1
+
+
+def test_delegate_reuses_wrapped_text_heights_until_the_width_changes(timeline: TimelineView) -> None:
+    timeline._time_filter.setCurrentText("All Time")
+    timeline.set_events([
+        _event("task_created", "2024-05-01T08:00:00", "same text"),
+        _event("task_created", "2024-05-01T09:00:00", "same text"),
+    ])
+    timeline.resize(400, 300)
+    delegate = timeline._event_list.itemDelegate()
+    option = QStyleOptionViewItem()
+    rows = [timeline._model.index(row, 0) for row in range(timeline._model.rowCount())]
+
+    heights = [delegate.sizeHint(option, index).height() for index in rows]
+    assert heights[1] == heights[2] > heights[0]
+    assert list(delegate._details_heights) == ["same text"]
+
+    timeline.resize(200, 300)
+    delegate.sizeHint(option, rows[1])
+    assert delegate._details_width == timeline._event_list.viewport().width() - 2 * theme.SPACING_MD
+
+
+def test_combined_filters_match_applying_them_in_turn(timeline: TimelineView) -> None:
+    now = datetime.now()
+    events = [
+        _event(event_type, (now - age).isoformat(), details)
+        for event_type, age, details in (
+            ("task_escalated", timedelta(minutes=10), "Flood at pier"),
+            ("task_escalated", timedelta(days=3), "Flood at depot"),
+            ("task_escalated", timedelta(minutes=20), "Power out"),
+            ("task_created", timedelta(minutes=5), "Flood reported"),
+        )
+    ]
+    timeline._time_filter.setCurrentText("Last Hour")
+    timeline._type_filter.setCurrentText("Task Escalated")
+    timeline._search_input.setText("flood")
+    timeline.set_events(events)
+
+    sequential = timeline._filter_by_type(timeline._filter_by_time(events, "Last Hour"), "Task Escalated")
+    sequential = [e for e in sequential if "flood" in e["details"].lower()]
+    assert timeline.get_filtered_events() == sequential
+    assert [e["details"] for e in sequential] == ["Flood at pier"]
+
+
+def test_events_stay_in_timestamp_order_as_they_arrive(timeline: TimelineView) -> None:
+    timeline._time_filter.setCurrentText("All Time")
+    timeline.set_events([
+        _event("task_created", "2024-05-01T10:00:00", "b"),
+        _event("task_created", "2024-05-01T08:00:00", "a"),
+    ])
+
+    timeline.add_event("task_created", "2024-05-01T12:00:00", "d")
+    timeline.add_event("task_created", "2024-05-01T09:00:00", "a2")
+    timeline.add_event("task_created", "2024-05-01T10:00:00", "c")
+
+    assert [e["details"] for e in timeline.get_events()] == ["a", "a2", "b", "c", "d"]
+    assert timeline.get_filtered_events() == timeline.get_events()
+    incremental = [timeline._model.row_at(row).details for row in range(timeline._model.rowCount())]
+    timeline._apply_filters()
+    rebuilt = [timeline._model.row_at(row).details for row in range(timeline._model.rowCount())]
+    assert incremental == rebuilt == ["", "d", "c", "b", "a2", "a"]
+
+
+def test_event_list_lays_out_rows_in_batches(timeline: TimelineView) -> None:
+    assert timeline._event_list.layoutMode() == QListView.Batched
+    assert timeline._event_list.batchSize() == TIMELINE_BATCH_SIZE
+
+
+def _paint_row(timeline: TimelineView, row: int):
+    delegate = timeline._event_list.itemDelegate()
+    option = QStyleOptionViewItem()
+    index = timeline._model.index(row, 0)
+    option.rect = QRect(0, 0, 400, delegate.sizeHint(option, index).height())
+    pixmap = QPixmap(option.rect.size())
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    delegate.paint(painter, option, index)
+    painter.end()
+    return pixmap.toImage()
+
+
+def test_delegate_paints_with_the_active_theme_colors(qtbot, timeline: TimelineView) -> None:
+    timeline._time_filter.setCurrentText("All Time")
+    timeline.set_events([_event("task_created", "2024-05-01T08:00:00", "x")])
+    dark = theme.Theme(theme.ThemeVariant.DARK)
+    updates: list[int] = []
+    timeline._event_list.viewport().update = lambda: updates.append(1)
+
+    timeline.set_theme(dark)
+    assert updates
+
+    header = _paint_row(timeline, 0)
+    # The most opaque text pixel carries the pen color unblended
+    solid = max(
+        (header.pixelColor(x, y) for x in range(header.width()) for y in range(header.height())),
+        key=QColor.alpha,
+    )
+    assert solid.rgb() == dark.get_qcolor("text_secondary").rgb()
+
+    card = _paint_row(timeline, 1)
+    assert card.pixelColor(card.width() - 4, card.height() // 2) == dark.get_qcolor("surface_elevated")
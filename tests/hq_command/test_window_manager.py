@@ -0,0 +1,62 @@
+"""Tests for HQ Command window state persistence."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+pytest.importorskip("pytestqt")
+
+from hq_command.gui.qt_compat import QMainWindow
+from hq_command.gui import window_manager
+from hq_command.gui.window_manager import WindowManager
+
+
+@pytest.fixture()
+def window(qtbot) -> QMainWindow:
+    widget = QMainWindow()
+    qtbot.addWidget(widget)
+    widget.setGeometry(40, 50, 640, 480)
+    return widget
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch) -> str:
+    if request.param == "json":
+        monkeypatch.setattr(window_manager, "orjson", None)
+    elif window_manager.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_save_writes_compact_json_atomically(tmp_path, window: QMainWindow, json_backend: str) -> None:
+    manager = WindowManager(tmp_path)
+    manager.save_window_state(window, "main")
+    manager.save_window_state(window, "secondary")
+
+    raw = manager.state_file.read_text(encoding="utf-8")
+    assert "\n" not in raw and ": " not in raw
+    state = json.loads(raw)
+    assert set(state) == {"main", "secondary"}
+    assert state["main"]["geometry"]["width"] == 640
+    assert not manager.state_file.with_suffix(".tmp").exists()
+
+
+def test_state_file_is_read_once_and_kept_in_memory(tmp_path, window: QMainWindow, monkeypatch) -> None:
+    WindowManager(tmp_path).save_window_state(window, "main")
+
+    manager = WindowManager(tmp_path)
+    monkeypatch.setattr(manager, "_load_state_file", lambda: pytest.fail("state file re-read"))
+    window.setGeometry(0, 0, 300, 200)
+    manager.restore_window_state(window, "main")
+    assert window.width() == 640
+
+    manager.save_window_state(window, "other")
+    assert set(json.loads(manager.state_file.read_text(encoding="utf-8"))) == {"main", "other"}
+
+
+def test_unreadable_state_file_falls_back_to_defaults(tmp_path, json_backend: str) -> None:
+    (tmp_path / "window_state.json").write_bytes(b"{not json")
+    assert WindowManager(tmp_path)._state_cache == {}
@@ -0,0 +1,223 @@
+"""Tests for the HQ Command interactive workflow dialogs."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+pytest.importorskip("pytestqt")
+
+from hq_command.gui.qt_compat import QDialogButtonBox, Qt
+from hq_command.gui.workflows import (
+    CallCorrelationDialog,
+    ManualAssignmentDialog,
+    ResponderCreationDialog,
+    TaskCreationDialog,
+    UnitColumns,
+    UnitRecommendation,
+)
+
+
+UNITS = [
+    {"unit_id": "U-1", "capabilities": ["medic"], "status": "available", "current_tasks": [], "max_concurrent_tasks": 2},
+    {"unit_id": "U-2", "capabilities": ["rescue"], "status": "available", "current_tasks": [], "max_concurrent_tasks": 1},
+    {"unit_id": "U-3", "capabilities": ["medic", "rescue"], "status": "busy", "current_tasks": ["T-9"], "max_concurrent_tasks": 1},
+]
+
+
+@pytest.fixture()
+def dialog(qtbot) -> ManualAssignmentDialog:
+    recommendation = UnitRecommendation(
+        unit_id="U-2",
+        suitability_score=85,
+        capabilities=["rescue"],
+        current_load=0,
+        max_capacity=1,
+        location=None,
+        fatigue=0.0,
+        match_reason="Closest rescue unit",
+    )
+    widget = ManualAssignmentDialog(
+        "T-1",
+        {"priority": 1, "capabilities_required": ["rescue"], "min_units": 1, "max_units": 2},
+        UNITS,
+        [recommendation],
+    )
+    qtbot.addWidget(widget)
+    return widget
+
+
+def test_checking_units_updates_selection_and_validation(dialog: ManualAssignmentDialog) -> None:
+    ok_button = dialog.button_box.button(QDialogButtonBox.StandardButton.Ok)
+    model = dialog.units_model
+
+    dialog._add_recommended_unit(0, 0)
+    assert list(dialog.selected_units) == ["U-2"]
+    assert model.index(1, 0).data(Qt.CheckStateRole) == Qt.Checked
+    assert ok_button.isEnabled()
+
+    assert model.setData(model.index(0, 0), Qt.Checked, Qt.CheckStateRole)
+    assert list(dialog.selected_units) == ["U-2", "U-1"]
+
+    model.setData(model.index(1, 0), Qt.Unchecked, Qt.CheckStateRole)
+    assert list(dialog.selected_units) == ["U-1"]
+    assert not ok_button.isEnabled()
+
+
+def test_confirmed_units_are_emitted_in_selection_order(
+    qtbot, dialog: ManualAssignmentDialog
+) -> None:
+    model = dialog.units_model
+    model.set_checked("U-1")
+    model.set_checked("U-2")
+
+    with qtbot.waitSignal(dialog.assignment_confirmed, timeout=1000) as blocker:
+        dialog._confirm_assignment()
+    assert blocker.args == ["T-1", ["U-1", "U-2"]]
+    audit = dialog.get_assignment_audit_data()
+    assert audit["assigned_units"] == ["U-1", "U-2"]
+    assert audit["scheduler_recommendations"] == [
+        {"unit_id": "U-2", "score": 85, "reason": "Closest rescue unit"}
+    ]
+    assert dialog.get_assignment_audit_data()["scheduler_recommendations"] is audit["scheduler_recommendations"]
+
+
+def test_units_model_formats_cells_on_demand(dialog: ManualAssignmentDialog) -> None:
+    model = dialog.units_model
+
+    assert model.rowCount() == 3
+    assert model.rowCount(model.index(0, 1)) == 0
+    assert model.columnCount(model.index(0, 1)) == 0
+    assert [model.headerData(column, Qt.Horizontal) for column in range(model.columnCount())] == [
+        "Select", "Unit ID", "Capabilities", "Status", "Load", "Fatigue",
+    ]
+    assert [model.index(2, column).data() for column in range(1, 6)] == [
+        "U-3", "medic, rescue", "busy", "1/1", "0.0",
+    ]
+    assert model.flags(model.index(0, 0)) & Qt.ItemIsUserCheckable
+
+
+def test_unit_columns_store_each_field_column_wise() -> None:
+    columns = UnitColumns.from_units(UNITS + [{"unit_id": "U-4", "fatigue": 0.45}])
+
+    assert len(columns) == 4
+    assert columns.unit_ids == ["U-1", "U-2", "U-3", "U-4"]
+    assert columns.caps[2] == frozenset({"medic", "rescue"})
+    assert columns.statuses[3] == "unknown"
+    assert list(columns.current_load) == [0, 0, 1, 0]
+    assert list(columns.max_capacity) == [2, 1, 1, 1]
+    assert f"{columns.fatigue[3]:.1f}" == f"{0.45:.1f}"
+    assert columns.row_by_id["U-3"] == 2
+
+
+def test_units_model_reloads_rows_in_one_reset(qtbot, dialog: ManualAssignmentDialog) -> None:
+    model = dialog.units_model
+    model.set_checked("U-1")
+    model.set_checked("U-2")
+    inserted: list = []
+    model.rowsInserted.connect(lambda *args: inserted.append(args))
+
+    with qtbot.waitSignal(model.modelReset, timeout=1000):
+        model.load(UNITS[1:] + [{"unit_id": "U-4", "capabilities": ["hazmat"]}])
+
+    assert inserted == []
+    assert model.rowCount() == 3
+    assert model.index(2, 2).data() == "hazmat"
+    assert list(dialog.selected_units) == ["U-2"]
+    model.set_checked("U-4")
+    assert model.index(2, 0).data(Qt.CheckStateRole) == Qt.Checked
+
+
+def test_unit_filter_matches_id_or_capability_after_typing_pauses(
+    qtbot, dialog: ManualAssignmentDialog
+) -> None:
+    proxy = dialog.units_proxy
+
+    def visible() -> list:
+        return [proxy.index(row, 1).data() for row in range(proxy.rowCount())]
+
+    dialog.unit_filter.setText("RES")
+    dialog.unit_filter.setText("RESCUE")
+    assert proxy.rowCount() == 3
+    qtbot.waitUntil(lambda: visible() == ["U-2", "U-3"], timeout=1000)
+
+    dialog.unit_filter.setText("u-1")
+    qtbot.waitUntil(lambda: visible() == ["U-1"], timeout=1000)
+
+    dialog.unit_filter.setText("busy")
+    qtbot.waitUntil(lambda: proxy.rowCount() == 0, timeout=1000)
+
+
+def test_validation_reports_capacity_and_missing_capabilities(dialog: ManualAssignmentDialog) -> None:
+    model = dialog.units_model
+
+    model.set_checked("U-1")
+    assert "Missing required capabilities: rescue" in dialog.validation_label.text()
+
+    model.set_checked("U-3")
+    assert "Units at capacity: U-3" in dialog.validation_label.text()
+
+    model.set_checked("U-3", False)
+    model.set_checked("U-2")
+    assert dialog.validation_label.text().startswith("✓ Valid assignment: 2 unit(s)")
+
+
+def test_call_correlation_rows_share_one_check_handler(qtbot) -> None:
+    calls = [
+        {"call_id": "C-2", "location": "Pier 4", "incident_type": "fire", "timestamp": "09:01"},
+        {"call_id": "C-3", "location": "Pier 5", "incident_type": "fire", "timestamp": "09:02"},
+    ]
+    correlation = CallCorrelationDialog({"call_id": "C-1"}, calls)
+    qtbot.addWidget(correlation)
+    table = correlation.calls_table
+    assert table.cellWidget(0, 0) is None
+
+    table.item(1, 0).setCheckState(Qt.Checked)
+    table.item(0, 0).setCheckState(Qt.Checked)
+    assert correlation.selected_calls == ["C-3", "C-2"]
+
+    table.item(1, 0).setCheckState(Qt.Unchecked)
+    table.item(0, 2).setText("Pier 6")
+    assert correlation.selected_calls == ["C-2"]
+
+
+def test_task_form_restyles_only_when_validation_state_changes(qtbot, monkeypatch) -> None:
+    creation = TaskCreationDialog()
+    qtbot.addWidget(creation)
+    ok_button = creation.button_box.button(QDialogButtonBox.StandardButton.Ok)
+    creation.tabs.setCurrentIndex(1)
+    assert creation.validation_label.text() == "⚠ Task ID is required"
+    assert not ok_button.isEnabled()
+
+    styles: list = []
+    monkeypatch.setattr(creation.validation_label, "setStyleSheet", styles.append)
+    for text in ("T", "T-", "T-1"):
+        creation.task_id_input.setText(text)
+    assert creation.validation_label.text() == "✓ Form valid"
+    assert ok_button.isEnabled()
+    assert styles == [TaskCreationDialog._STYLE_OK]
+
+    creation.task_id_input.setText("")
+    assert styles[-1] == TaskCreationDialog._STYLE_DANGER
+    assert not ok_button.isEnabled()
+
+
+def test_creation_dialogs_list_existing_entries_with_their_data(qtbot) -> None:
+    tasks = [
+        {"task_id": "T-1", "priority": 2, "capabilities_required": ["medic", "rescue"]},
+        {"task_id": "T-2", "capabilities_required": "hazmat"},
+    ]
+    task_dialog = TaskCreationDialog(tasks)
+    qtbot.addWidget(task_dialog)
+    task_list = task_dialog.task_list
+    assert [task_list.item(row).text() for row in range(task_list.count())] == [
+        "T-1 (P2) - [medic, rescue]",
+        "T-2 (P0) - [hazmat]",
+    ]
+    assert task_list.item(1).data(Qt.UserRole) == tasks[1]
+
+    responders = [{"unit_id": "U-1", "capabilities": ("medic",)}]
+    responder_dialog = ResponderCreationDialog(responders)
+    qtbot.addWidget(responder_dialog)
+    assert responder_dialog.responder_list.item(0).text() == "U-1 - [medic]"
+    assert responder_dialog.responder_list.item(0).data(Qt.UserRole) == responders[0]